@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 from monty.json import MSONable
 
-from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
+from pymatgen.analysis.structure_matcher import ElementComparator, StructureIndex, StructureMatcher
 from pymatgen.core import get_el_sp
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
@@ -245,8 +245,40 @@ class RemoveExistingFilter(AbstractStructureFilter):
         else:
             self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
 
+    @property
+    def existing_structures(self) -> list[Structure]:
+        """Existing structures to compare with. Structures appended to the list are
+        indexed on the next call to test. Assign a new list to replace them.
+        """
+        return self._existing_structures
+
+    @existing_structures.setter
+    def existing_structures(self, structures: list[Structure]) -> None:
+        self._existing_structures = structures
+        self._index: StructureIndex | None = None
+
+    def _get_index(self) -> StructureIndex:
+        """StructureIndex of existing_structures, including any structures appended since the last call."""
+        if self._index is None or len(self._index) > len(self.existing_structures):
+            self._index = StructureIndex(self.structure_matcher)
+        self._index.add_structures(self.existing_structures[len(self._index) :])
+        return self._index
+
     def test(self, structure: Structure):
         """True if structure is not in existing list."""
+        if self.symprec is None and not self.structure_matcher._subset:
+            # Only fit the existing structures sharing the invariants of structure,
+            # and the hash of its composition before any species are ignored
+            get_hash = self.structure_matcher._comparator.get_hash
+            comp_hash = get_hash(structure.composition)
+
+            def has_comp_hash(idx: int) -> bool:
+                return get_hash(self.existing_structures[idx].composition) == comp_hash
+
+            if self._get_index().find(structure, prefilter=has_comp_hash) is not None:
+                return False
+            self.structure_list.append(structure)
+            return True
 
         def get_sg(s):
             finder = SpacegroupAnalyzer(s, symprec=self.symprec)
@@ -355,7 +355,6 @@ class EwaldSummation(MSONable):
         force_pf = 2 * self._sqrt_eta / math.sqrt(math.pi)
         coords = self._coords
         n_sites = len(self._struct)
-        e_real = np.empty((n_sites, n_sites), dtype=np.float64)
 
         forces = np.zeros((n_sites, 3), dtype=np.float64)
 
@@ -363,35 +362,35 @@ class EwaldSummation(MSONable):
 
         e_point = -(qs**2) * math.sqrt(self._eta / math.pi)
 
-        for idx in range(n_sites):
-            nf_coords, rij, js, _ = self._struct.lattice.get_points_in_sphere(
-                frac_coords, coords[idx], self._rmax, zip_results=False
-            )
+        # Neighbors of all sites in a single search
+        lattice = self._struct.lattice
+        center_indices, js, images, rij = lattice.get_points_in_spheres_batched(frac_coords, coords, self._rmax)
 
-            # remove the rii term
-            inds = rij > 1e-8
-            js = js[inds]
-            rij = rij[inds]
-            nf_coords = nf_coords[inds]
+        # remove the rii term
+        inds = rij > 1e-8
+        center_indices = center_indices[inds]
+        js = js[inds]
+        images = images[inds]
+        rij = rij[inds]
 
-            qi = qs[idx]
-            qj = qs[js]
+        qi = qs[center_indices]
+        qj = qs[js]
 
-            erfc_val = erfc(self._sqrt_eta * rij)
-            new_ereals = erfc_val * qi * qj / rij
+        erfc_val = erfc(self._sqrt_eta * rij)
+        new_ereals = erfc_val * qi * qj / rij
 
-            # insert new_ereals
-            for key in range(n_sites):
-                e_real[key, idx] = np.sum(new_ereals[js == key])
+        # e_real[j, i] is the sum over all images of site j around site i
+        e_real = np.bincount(js * n_sites + center_indices, weights=new_ereals, minlength=n_sites * n_sites)
+        e_real = e_real.reshape(n_sites, n_sites)
 
-            if self._compute_forces:
-                nc_coords = self._struct.lattice.get_cartesian_coords(nf_coords)
+        if self._compute_forces:
+            nc_coords = lattice.get_cartesian_coords(frac_coords[js] + images)
 
-                fijpf = qj / rij**3 * (erfc_val + force_pf * rij * np.exp(-self._eta * rij**2))
-                forces[idx] += np.sum(
-                    np.expand_dims(fijpf, 1) * (np.array([coords[idx]]) - nc_coords) * qi * EwaldSummation.CONV_FACT,
-                    axis=0,
-                )
+            fijpf = qj / rij**3 * (erfc_val + force_pf * rij * np.exp(-self._eta * rij**2))
+            pair_forces = (
+                np.expand_dims(fijpf, 1) * (coords[center_indices] - nc_coords) * np.expand_dims(qi, 1)
+            ) * EwaldSummation.CONV_FACT
+            np.add.at(forces, center_indices, pair_forces)
 
         e_real *= 0.5 * EwaldSummation.CONV_FACT
         e_point *= EwaldSummation.CONV_FACT
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import copy
 import logging
+import math
 import os.path
 import subprocess
 import warnings
@@ -42,7 +43,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from pymatgen.analysis.local_env import NearNeighbors
-    from pymatgen.core import Species
+    from pymatgen.core import NeighborList, Species
 
 
 logger = logging.getLogger(__name__)
@@ -291,6 +292,10 @@ class StructureGraph(MSONable):
 
         struct_graph = cls.from_empty_graph(structure, name="bonds")
 
+        if not edge_properties:
+            struct_graph.add_edges_from_neighbor_list(strategy.get_all_neighbor_list(structure), weights=weights)
+            return struct_graph
+
         for idx, neighbors in enumerate(strategy.get_all_nn_info(structure)):
             for neighbor in neighbors:
                 # local_env will always try to add two edges
@@ -458,6 +463,61 @@ class StructureGraph(MSONable):
         else:
             self.graph.add_edge(from_index, to_index, to_jimage=to_jimage, **edge_properties)
 
+    def add_edges_from_neighbor_list(self, neighbor_list: NeighborList, weights: bool = False) -> None:
+        """Add an edge for every pair of a NeighborList, e.g. from
+        Structure.get_all_neighbors(as_arrays=True) or NearNeighbors.get_all_neighbor_list.
+        Edges are added following the conventions of add_edge, but in bulk, and
+        duplicate edges are silently skipped.
+
+        Args:
+            neighbor_list (NeighborList): Pairs of sites to connect.
+            weights (bool): if True, use the weights of the neighbor list as edge weights.
+        """
+        # Missing weights are stored as NaN in the neighbor list
+        edge_weights = None
+        if weights and neighbor_list.weights is not None:
+            edge_weights = [None if math.isnan(weight) else weight for weight in neighbor_list.weights.tolist()]
+
+        if self.graph.number_of_edges() > 0:
+            # Duplicates of existing edges have to be checked one by one
+            for idx, (from_index, to_index, to_jimage) in enumerate(
+                zip(neighbor_list.center_indices, neighbor_list.points_indices, neighbor_list.images, strict=True)
+            ):
+                self.add_edge(
+                    from_index=from_index,
+                    to_index=to_index,
+                    to_jimage=to_jimage,
+                    weight=None if edge_weights is None else edge_weights[idx],
+                    warn_duplicates=False,
+                )
+            return
+
+        # Make from_index <= to_index and from_jimage (0, 0, 0), as in add_edge
+        from_indices, to_indices = neighbor_list.center_indices, neighbor_list.points_indices
+        swap = to_indices < from_indices
+        from_indices, to_indices = np.where(swap, to_indices, from_indices), np.where(swap, from_indices, to_indices)
+        to_jimages = np.where(swap[:, None], -neighbor_list.images, neighbor_list.images)
+
+        # Edges from a site to its own image have the first non-zero jimage index positive
+        is_loop = from_indices == to_indices
+        first_nonzero = to_jimages[np.arange(len(to_jimages)), np.argmax(to_jimages != 0, axis=1)]
+        to_jimages[is_loop & (first_nonzero < 0)] *= -1
+        is_self = is_loop & ~to_jimages.any(axis=1)
+        if np.any(is_self):
+            warnings.warn("Tried to create a bond to itself, this doesn't make sense so was ignored.", stacklevel=2)
+
+        # Keep the first occurrence of every edge, in the original order
+        edges = np.column_stack([from_indices, to_indices, to_jimages])
+        _, first_indices = np.unique(edges, axis=0, return_index=True)
+        first_indices = np.sort(first_indices[~is_self[first_indices]])
+
+        for idx in first_indices:
+            from_index, to_index, *to_jimage = edges[idx].tolist()
+            if edge_weights is not None and edge_weights[idx]:
+                self.graph.add_edge(from_index, to_index, to_jimage=tuple(to_jimage), weight=edge_weights[idx])
+            else:
+                self.graph.add_edge(from_index, to_index, to_jimage=tuple(to_jimage))
+
     def insert_node(
         self,
         idx: int,
@@ -1132,44 +1192,40 @@ class StructureGraph(MSONable):
 
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
+        n_sites, n_images = len(self.structure), len(cart_lattice)
+
+        # The supercell holds one copy of the original sites per lattice point
+        # (image-major), with each graph node mapped to its copies accordingly
+        new_structure = Structure(
+            new_lattice,
+            self.structure.species_and_occu * n_images,
+            (self.structure.cart_coords[None, :, :] + cart_lattice[:, None, :]).reshape(-1, 3),
+            coords_are_cartesian=True,
+            site_properties={key: list(vals) * n_images for key, vals in self.structure.site_properties.items()},
+        )
 
-        new_sites = []
-        new_graphs = []
-
-        for v in cart_lattice:
-            # create a map of nodes from original graph to its image
-            mapping = {n: n + len(new_sites) for n in range(len(self.structure))}
-
-            for site in self.structure:
-                site = PeriodicSite(
-                    site.species,
-                    site.coords + v,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                )
-
-                new_sites.append(site)
-
-            new_graphs.append(nx.relabel_nodes(self.graph, mapping, copy=True))
-
-        new_structure = Structure.from_sites(new_sites)
-
-        # merge all graphs into one big graph
+        edges = list(self.graph.edges(keys=True, data=True))
         new_g = nx.MultiDiGraph()
-        for new_graph in new_graphs:
-            new_g = nx.union(new_g, new_graph)
+        new_g.graph.update(self.graph.graph)
+        for offset in range(0, n_sites * n_images, n_sites):
+            new_g.add_nodes_from((node + offset, data) for node, data in self.graph.nodes(data=True))
+            new_g.add_edges_from((u + offset, v + offset, key, data) for u, v, key, data in edges)
 
         edges_to_remove = []  # tuple of (u, v, k)
         edges_to_add = []  # tuple of (u, v, attr_dict)
 
-        # list of new edges inside supercell
+        # set of new edges inside supercell
         # for duplicate checking
-        edges_inside_supercell = [{u, v} for u, v, d in new_g.edges(data=True) if d["to_jimage"] == (0, 0, 0)]
-        new_periodic_images = []
+        edges_inside_supercell = {
+            frozenset((u + offset, v + offset))
+            for u, v, _, data in edges
+            if data["to_jimage"] == (0, 0, 0)
+            for offset in range(0, n_sites * n_images, n_sites)
+        }
+        new_periodic_images = set()
 
         orig_lattice = self.structure.lattice
+        orig_frac_coords = self.structure.frac_coords
 
         # use k-d tree to match given position to an
         # existing Site in Structure
@@ -1179,41 +1235,46 @@ class StructureGraph(MSONable):
         # this could probably be a lot smaller
         tol = 0.05
 
-        for u, v, k, data in new_g.edges(keys=True, data=True):
-            to_jimage = data["to_jimage"]  # for node v
-
-            # reduce unnecessary checking
-            if to_jimage != (0, 0, 0):
-                # get index in original site
-                n_u = u % len(self.structure)
-                n_v = v % len(self.structure)
-
-                # get fractional coordinates of where atoms defined by edge are expected
-                # to be, relative to original lattice (keeping original lattice has
-                # significant benefits)
-                v_image_frac = np.add(self.structure[n_v].frac_coords, to_jimage)
-                u_frac = self.structure[n_u].frac_coords
-
-                # using the position of node u as a reference, get relative Cartesian
-                # coordinates of where atoms defined by edge are expected to be
-                v_image_cart = orig_lattice.get_cartesian_coords(v_image_frac)
-                u_cart = orig_lattice.get_cartesian_coords(u_frac)
-                v_rel = np.subtract(v_image_cart, u_cart)
-
-                # now retrieve position of node v in new supercell, and get absolute
-                # Cartesian coordinates of where atoms defined by edge are expected to be
-                v_expect = new_structure[u].coords + v_rel
-
-                # now search in new structure for these atoms query returns (distance, index)
-                v_present = kd_tree.query(v_expect)
-                v_present = v_present[1] if v_present[0] <= tol else None
+        # reduce unnecessary checking
+        periodic_edges = [edge for edge in edges if edge[3]["to_jimage"] != (0, 0, 0)]
+        u_indices = np.array([u for u, *_ in periodic_edges], dtype=int)
+        v_indices = np.array([v for _, v, *_ in periodic_edges], dtype=int)
+        to_jimages = np.reshape([data["to_jimage"] for *_, data in periodic_edges], (-1, 3))
+
+        # using the position of node u as a reference, get relative Cartesian
+        # coordinates of where atoms defined by edge are expected to be
+        # (keeping original lattice has significant benefits)
+        v_rel = orig_lattice.get_cartesian_coords(orig_frac_coords[v_indices] + to_jimages)
+        v_rel -= orig_lattice.get_cartesian_coords(orig_frac_coords[u_indices])
+
+        # now retrieve position of node u in each image in new supercell, and get absolute
+        # Cartesian coordinates of where atoms defined by edge are expected to be
+        new_u_indices = np.arange(0, n_sites * n_images, n_sites)[:, None] + u_indices[None, :]
+        v_expect = new_structure.cart_coords[new_u_indices] + v_rel[None, :, :]
+
+        # search in new structure for these atoms, query returns (distances, indices)
+        inside_dists, inside_indices = kd_tree.query(v_expect)
+
+        # for edges to sites outside the supercell, find the image of the site such that
+        # we have full periodic boundary conditions so that nodes on one side of
+        # supercell are connected to nodes on opposite side
+        v_expect_frac = new_lattice.get_fractional_coords(v_expect)
+        # use np.around to fix issues with finite precision leading to incorrect image
+        v_expect_images = np.around(v_expect_frac, decimals=3)
+        v_expect_images -= v_expect_images % 1
+        image_dists, image_indices = kd_tree.query(new_lattice.get_cartesian_coords(v_expect_frac - v_expect_images))
+
+        for image_idx, new_u_row in enumerate(new_u_indices):
+            offset = image_idx * n_sites
+            for edge_idx, (u, v, k, data) in enumerate(periodic_edges):
+                u, v = new_u_row[edge_idx].item(), v + offset
 
                 # check if image sites now present in supercell
                 # and if so, delete old edge that went through
                 # periodic boundary
-                if v_present is not None:
+                if inside_dists[image_idx, edge_idx] <= tol:
                     new_u = u
-                    new_v = v_present
+                    new_v = inside_indices[image_idx, edge_idx].item()
                     new_data = data.copy()
 
                     # node now inside supercell
@@ -1223,58 +1284,38 @@ class StructureGraph(MSONable):
 
                     # make sure we don't try to add duplicate edges
                     # will remove two edges for everyone one we add
-                    if {new_u, new_v} not in edges_inside_supercell:
+                    if frozenset((new_u, new_v)) not in edges_inside_supercell:
                         # normalize direction
                         if new_v < new_u:
                             new_u, new_v = new_v, new_u
 
-                        edges_inside_supercell.append({new_u, new_v})
+                        edges_inside_supercell.add(frozenset((new_u, new_v)))
                         edges_to_add.append((new_u, new_v, new_data))
 
-                else:
-                    # want to find new_v such that we have
-                    # full periodic boundary conditions
-                    # so that nodes on one side of supercell
-                    # are connected to nodes on opposite side
-
-                    v_expec_frac = new_structure.lattice.get_fractional_coords(v_expect)
-
-                    # find new to_jimage
-                    # use np.around to fix issues with finite precision leading to incorrect image
-                    v_expec_image = np.around(v_expec_frac, decimals=3)
-                    v_expec_image -= v_expec_image % 1
-
-                    v_expec_frac = np.subtract(v_expec_frac, v_expec_image)
-                    v_expect = new_structure.lattice.get_cartesian_coords(v_expec_frac)
-                    v_present = kd_tree.query(v_expect)
-                    v_present = v_present[1] if v_present[0] <= tol else None
-
-                    if v_present is not None:
-                        new_u = u
-                        new_v = v_present
-                        new_data = data.copy()
-                        new_to_jimage = tuple(map(int, v_expec_image))
+                elif image_dists[image_idx, edge_idx] <= tol:
+                    new_u = u
+                    new_v = image_indices[image_idx, edge_idx].item()
+                    new_data = data.copy()
+                    new_to_jimage = tuple(map(int, v_expect_images[image_idx, edge_idx]))
 
-                        # normalize direction
-                        if new_v < new_u:
-                            new_u, new_v = new_v, new_u
-                            new_to_jimage = tuple(np.multiply(-1, data["to_jimage"]).astype(int))
+                    # normalize direction
+                    if new_v < new_u:
+                        new_u, new_v = new_v, new_u
+                        new_to_jimage = tuple(np.multiply(-1, data["to_jimage"]).astype(int))
 
-                        new_data["to_jimage"] = new_to_jimage
+                    new_data["to_jimage"] = new_to_jimage
 
-                        edges_to_remove.append((u, v, k))
+                    edges_to_remove.append((u, v, k))
 
-                        if (new_u, new_v, new_to_jimage) not in new_periodic_images:
-                            edges_to_add.append((new_u, new_v, new_data))
-                            new_periodic_images.append((new_u, new_v, new_to_jimage))
+                    if (new_u, new_v, new_to_jimage) not in new_periodic_images:
+                        edges_to_add.append((new_u, new_v, new_data))
+                        new_periodic_images.add((new_u, new_v, new_to_jimage))
 
         logger.debug(f"Removing {len(edges_to_remove)} edges, adding {len(edges_to_add)} new edges.")
 
         # add/delete marked edges
-        for edge in edges_to_remove:
-            new_g.remove_edge(*edge)
-        for u, v, data in edges_to_add:
-            new_g.add_edge(u, v, **data)
+        new_g.remove_edges_from(edges_to_remove)
+        new_g.add_edges_from(edges_to_add)
 
         # return new instance of StructureGraph with supercell
         data = {
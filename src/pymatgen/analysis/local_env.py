@@ -26,7 +26,7 @@ from scipy.spatial import Voronoi
 from pymatgen.analysis.bond_valence import BV_PARAMS, BVAnalyzer
 from pymatgen.analysis.graphs import StructureGraph
 from pymatgen.analysis.molecule_structure_comparator import CovalentRadius
-from pymatgen.core import Element, IStructure, PeriodicNeighbor, PeriodicSite, Site, Species, Structure
+from pymatgen.core import Element, IStructure, NeighborList, PeriodicNeighbor, PeriodicSite, Site, Species, Structure
 
 try:
     from openbabel import openbabel
@@ -281,6 +281,15 @@ class NearNeighbors:
         """
         raise NotImplementedError("extend_structures_molecule is not defined!")
 
+    @property
+    def search_cutoff_radius(self) -> float | None:
+        """Radius of the fixed-cutoff neighbor search done in get_nn_info, or None if
+        the neighbors are not found that way. get_all_nn_info uses it to find the
+        neighbors of all sites in a single pass, which get_nn_info then reads from
+        the neighbor list cache of the structure.
+        """
+        return None
+
     @overload
     def get_cn(
         self,
@@ -430,8 +439,44 @@ class NearNeighbors:
             List of NN site information for each site in the structure. Each
                 entry has the same format as `get_nn_info`
         """
+        if (cutoff := self.search_cutoff_radius) is not None and isinstance(structure, IStructure):
+            structure.get_neighbor_list(cutoff)
         return [self.get_nn_info(structure, n) for n in range(len(structure))]
 
+    def get_all_neighbor_list(self, structure: Structure) -> NeighborList:
+        """Get the near neighbors of all sites in a structure as a NeighborList of
+        flat arrays, with the weights of get_nn_info. Strategies based on a
+        fixed-cutoff neighbor search compute it directly from the neighbor list
+        of the structure, without creating any neighbor site or dict.
+
+        Args:
+            structure (Structure): Input structure
+
+        Returns:
+            NeighborList: near neighbors of all sites in the structure.
+        """
+        center_indices, points_indices, images, weights = [], [], [], []
+        for idx, nn_info in enumerate(self.get_all_nn_info(structure)):
+            for nn in nn_info:
+                center_indices.append(idx)
+                points_indices.append(nn["site_index"])
+                images.append(nn["image"])
+                weights.append(nn["weight"])
+
+        points_indices = np.array(points_indices, dtype=np.int64)
+        images = np.reshape(images, (-1, 3))
+        vectors = structure.lattice.get_cartesian_coords(structure.frac_coords[points_indices] + images)
+        vectors -= structure.cart_coords[np.array(center_indices, dtype=np.int64)]
+        return NeighborList.from_pairs(
+            n_centers=len(structure),
+            center_indices=center_indices,
+            points_indices=points_indices,
+            images=images,
+            distances=np.linalg.norm(vectors, axis=1),
+            vectors=vectors,
+            weights=np.array(weights, dtype=np.float64),
+        )
+
     def get_nn_shell_info(self, structure: Structure, site_idx, shell):
         """Get a certain nearest neighbor shell for a certain site.
 
@@ -1369,6 +1414,11 @@ class MinimumDistanceNN(NearNeighbors):
         """
         return True
 
+    @property
+    def search_cutoff_radius(self) -> float:
+        """Given by the cutoff attribute."""
+        return self.cutoff
+
     def get_nn_info(self, structure: Structure, n: int) -> list[dict[str, Any]]:
         """Get all near-neighbor sites as well as the associated image locations
         and weights of the site with index n using the closest neighbor
@@ -1414,6 +1464,29 @@ class MinimumDistanceNN(NearNeighbors):
                     )
         return siw
 
+    def get_all_neighbor_list(self, structure: Structure) -> NeighborList:
+        """Get the near neighbors of all sites in a structure as a NeighborList,
+        computed from the neighbor list of the structure.
+
+        Args:
+            structure (Structure): Input structure
+
+        Returns:
+            NeighborList: near neighbors of all sites in the structure.
+        """
+        if not isinstance(structure, IStructure):
+            return super().get_all_neighbor_list(structure)
+
+        neighbors = structure.get_all_neighbors(self.cutoff, as_arrays=True)
+        if self.get_all_sites:
+            return neighbors._replace(weights=neighbors.distances)
+
+        if np.any(np.diff(neighbors.offsets) == 0):
+            raise ValueError(f"No neighbors found within {self.cutoff=} for some sites")
+        min_dists = np.minimum.reduceat(neighbors.distances, neighbors.offsets[:-1])[neighbors.center_indices]
+        mask = neighbors.distances < (1 + self.tol) * min_dists
+        return neighbors.select(mask, weights=min_dists[mask] / neighbors.distances[mask])
+
 
 class OpenBabelNN(NearNeighbors):
     """
@@ -1778,6 +1851,11 @@ class MinimumOKeeffeNN(NearNeighbors):
         """
         return True
 
+    @property
+    def search_cutoff_radius(self) -> float:
+        """Given by the cutoff attribute."""
+        return self.cutoff
+
     def get_nn_info(self, structure: Structure, n: int):
         """Get all near-neighbor sites as well as the associated image locations
         and weights of the site with index n using the closest relative
@@ -3467,6 +3545,11 @@ class BrunnerNNReciprocal(NearNeighbors):
         """
         return False
 
+    @property
+    def search_cutoff_radius(self) -> float:
+        """Given by the cutoff attribute."""
+        return self.cutoff
+
     def get_nn_info(self, structure: Structure, n: int):
         """Get all near-neighbor sites as well as the associated image locations
         and weights of the site with index n in structure.
@@ -3542,6 +3625,11 @@ class BrunnerNNRelative(NearNeighbors):
         """
         return False
 
+    @property
+    def search_cutoff_radius(self) -> float:
+        """Given by the cutoff attribute."""
+        return self.cutoff
+
     def get_nn_info(self, structure: Structure, n: int):
         """Get all near-neighbor sites as well as the associated image locations
         and weights of the site with index n in structure.
@@ -3618,6 +3706,11 @@ class BrunnerNNReal(NearNeighbors):
         """
         return False
 
+    @property
+    def search_cutoff_radius(self) -> float:
+        """Given by the cutoff attribute."""
+        return self.cutoff
+
     def get_nn_info(self, structure: Structure, n: int):
         """Get all near-neighbor sites as well as the associated image locations
         and weights of the site with index n in structure.
@@ -3718,6 +3811,11 @@ class EconNN(NearNeighbors):
         """
         return True
 
+    @property
+    def search_cutoff_radius(self) -> float:
+        """Given by the cutoff attribute."""
+        return self.cutoff
+
     def get_nn_info(self, structure: Structure, n: int):
         """Get all near-neighbor sites as well as the associated image locations
         and weights of the site with index n in structure.
@@ -4315,6 +4413,11 @@ class CutOffDictNN(NearNeighbors):
 
         raise ValueError(f"Unknown {preset=}")
 
+    @property
+    def search_cutoff_radius(self) -> float:
+        """Given by the largest distance in cut_off_dict."""
+        return self._max_dist
+
     def get_nn_info(self, structure: Structure, n: int) -> list[dict]:
         """Get all near-neighbor sites as well as the associated image locations
         and weights of the site with index n in structure.
@@ -4349,6 +4452,30 @@ class CutOffDictNN(NearNeighbors):
 
         return nn_info
 
+    def get_all_neighbor_list(self, structure: Structure) -> NeighborList:
+        """Get the near neighbors of all sites in a structure as a NeighborList,
+        computed from the neighbor list of the structure.
+
+        Args:
+            structure (Structure): Input structure
+
+        Returns:
+            NeighborList: near neighbors of all sites in the structure.
+        """
+        if not isinstance(structure, IStructure):
+            return super().get_all_neighbor_list(structure)
+
+        neighbors = structure.get_all_neighbors(self._max_dist, as_arrays=True)
+        # Cut-off distances between the unique species strings of the structure
+        species_strings = [site.species_string for site in structure]
+        unique_species, species_indices = np.unique(species_strings, return_inverse=True)
+        cut_offs = np.array(
+            [[self._lookup_dict.get(sp1, {}).get(sp2, 0.0) for sp2 in unique_species] for sp1 in unique_species]
+        )
+        pair_cut_offs = cut_offs[species_indices[neighbors.center_indices], species_indices[neighbors.points_indices]]
+        mask = neighbors.distances < pair_cut_offs
+        return neighbors.select(mask, weights=neighbors.distances[mask])
+
 
 class Critic2NN(NearNeighbors):
     """
@@ -3,24 +3,26 @@
 from __future__ import annotations
 
 import itertools
+import json
 import logging
 import math
 import os
 import re
 import warnings
 from collections import defaultdict
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 import numpy as np
 import orjson
 import plotly.graph_objects as go
+from joblib import Parallel, delayed
 from matplotlib import cm
 from matplotlib.cm import ScalarMappable
 from matplotlib.colors import LinearSegmentedColormap, Normalize
 from matplotlib.font_manager import FontProperties
-from monty.json import MontyDecoder, MSONable
+from monty.json import MontyDecoder, MontyEncoder, MSONable
 from scipy import interpolate
 from scipy.optimize import minimize
 from scipy.spatial import ConvexHull
@@ -32,19 +34,26 @@ from pymatgen.core.composition import Composition
 from pymatgen.entries import Entry
 from pymatgen.util.coord import Simplex, in_coord_list
 from pymatgen.util.due import Doi, due
+from pymatgen.util.io_utils import read_array_file, write_array_file
 from pymatgen.util.plotting import pretty_plot
 from pymatgen.util.string import htmlify, latexify
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterator, Sequence
+    from collections.abc import Callable, Collection, Iterator, Sequence
     from io import StringIO
     from typing import Any, Literal
 
     from numpy.typing import ArrayLike
     from typing_extensions import Self
 
+    from pymatgen.util.typing import PathLike
+
 logger = logging.getLogger(__name__)
 
+# Magic and format version of files written by PhaseDiagram.save
+_MAGIC = b"PMGPHDIA"
+_FORMAT_VERSION = 1
+
 with open(
     os.path.join(os.path.dirname(__file__), "..", "util", "plotly_pd_layouts.json"),
     "rb",
@@ -375,6 +384,10 @@ class PhaseDiagram(MSONable):
 
             # Update keys to be Element objects in case they are strings in pre-computed data
             computed_data["el_refs"] = [(Element(el_str), entry) for el_str, entry in computed_data["el_refs"]]
+        self._set_computed_data(computed_data)
+
+    def _set_computed_data(self, computed_data: dict[str, Any]) -> None:
+        """Set the attributes derived from the output of PhaseDiagram._compute()."""
         self.computed_data = computed_data
         self.facets = computed_data["facets"]
         self.simplexes = computed_data["simplexes"]
@@ -386,6 +399,7 @@ class PhaseDiagram(MSONable):
         self._qhull_spaces = tuple(frozenset(e.elements) for e in self.qhull_entries)
         self._stable_entries = tuple({self.qhull_entries[idx] for idx in set(itertools.chain(*self.facets))})
         self._stable_spaces = tuple(frozenset(e.elements) for e in self._stable_entries)
+        self.__dict__.pop("_facet_index", None)
 
     def as_dict(self):
         """Get MSONable dict representation of PhaseDiagram."""
@@ -411,14 +425,117 @@ class PhaseDiagram(MSONable):
         computed_data = dct.get("computed_data")
         return cls(entries, elements, computed_data=computed_data)
 
-    def _compute(self) -> dict[str, Any]:
-        if self.elements == ():
-            self.elements = sorted({els for e in self.entries for els in e.elements})
+    def save(self, filename: PathLike) -> None:
+        """Write the phase diagram to a binary file. Unlike as_dict, the convex hull
+        data (qhull_data and facets, from which the simplexes are built) is stored as
+        arrays that PhaseDiagram.load can memory-map, so that many processes can share
+        one phase diagram on disk. Entries are stored once as JSON alongside them and
+        referenced by index.
 
-        elements = list(self.elements)
+        Args:
+            filename (PathLike): Path of the file.
+        """
+        if type(self) not in (PhaseDiagram, PatchedPhaseDiagram):
+            raise NotImplementedError(f"save is not supported for {type(self).__name__}")
+
+        entries = list(self.all_entries)
+        indices = {id(entry): idx for idx, entry in enumerate(entries)}
+
+        def get_indices(entries_to_index: Sequence[PDEntry]) -> np.ndarray:
+            for entry in entries_to_index:
+                if id(entry) not in indices:
+                    indices[id(entry)] = len(entries)
+                    entries.append(entry)
+            return np.array([indices[id(entry)] for entry in entries_to_index], dtype=np.int64)
+
+        header, arrays = self._get_save_data(get_indices)
+        arrays["entries"] = np.frombuffer(json.dumps(entries, cls=MontyEncoder).encode(), dtype=np.uint8)
+        header = {
+            "format_version": _FORMAT_VERSION,
+            "class": type(self).__name__,
+            "elements": list(self.elements),
+            **header,
+        }
+        write_array_file(filename, _MAGIC, header, arrays)
+
+    @classmethod
+    def load(cls, filename: PathLike, mmap: bool = True) -> Self:
+        """Load a phase diagram written by save.
+
+        Args:
+            filename (PathLike): Path of the file.
+            mmap (bool): Whether to memory-map the convex hull arrays (read-only)
+                instead of reading them into memory. Defaults to True.
+
+        Returns:
+            PhaseDiagram
+        """
+        header, arrays = read_array_file(filename, _MAGIC, mmap=mmap)
+        if header["format_version"] > _FORMAT_VERSION:
+            raise ValueError(f"Unsupported phase diagram format version {header['format_version']}")
+        if header["class"] != cls.__name__:
+            raise ValueError(f"{filename} contains a {header['class']}, not a {cls.__name__}")
+        entries = json.loads(arrays.pop("entries").tobytes(), cls=MontyDecoder)
+        return cls._from_save_data(header, arrays, entries)
+
+    def _get_save_data(
+        self,
+        get_indices: Callable[[Sequence[PDEntry]], np.ndarray],
+        prefix: str = "",
+    ) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """Get the header and arrays written by save, with entries replaced by their
+        indices in the saved entries.
+        """
+        arrays = {
+            "all_entries": get_indices(self.all_entries),
+            "qhull_entries": get_indices(self.qhull_entries),
+            "el_refs": get_indices([self.el_refs[el] for el in self.elements]),
+            "facets": np.array(self.facets, dtype=np.int64).reshape(len(self.facets), self.dim),
+            "qhull_data": self.qhull_data,
+        }
+        return {}, {f"{prefix}{key}": arr for key, arr in arrays.items()}
+
+    @classmethod
+    def _from_save_data(
+        cls,
+        header: dict[str, Any],
+        arrays: dict[str, np.ndarray],
+        entries: list[PDEntry],
+        prefix: str = "",
+    ) -> Self:
+        """Inverse of _get_save_data."""
+        elements = header["elements"]
+        all_entries = [entries[idx] for idx in arrays[f"{prefix}all_entries"]]
+        qhull_data = arrays[f"{prefix}qhull_data"]
+        facets = list(arrays[f"{prefix}facets"])
+        computed_data = {
+            "facets": facets,
+            "simplexes": [Simplex(qhull_data[facet, :-1]) for facet in facets],
+            "all_entries": all_entries,
+            "qhull_data": qhull_data,
+            "dim": len(elements),
+            "el_refs": [(el, entries[idx]) for el, idx in zip(elements, arrays[f"{prefix}el_refs"], strict=True)],
+            "qhull_entries": [entries[idx] for idx in arrays[f"{prefix}qhull_entries"]],
+        }
+        return cls(all_entries, elements, computed_data=computed_data)
+
+    def _compute(
+        self, entries: Sequence[PDEntry] | None = None, elements: Sequence[Element] | None = None
+    ) -> dict[str, Any]:
+        """Compute the convex hull data. Defaults to the entries and elements of
+        the phase diagram, in which case the elements are also set on it (inferred
+        from the entries if empty). Otherwise the phase diagram is left unchanged.
+        """
+        update_elements = entries is None and elements is None
+        if entries is None:
+            entries = self.entries
+        if elements is None:
+            elements = self.elements or sorted({els for e in entries for els in e.elements})
+
+        elements = list(elements)
         dim = len(elements)
 
-        entries = sorted(self.entries, key=lambda e: e.composition.reduced_composition)
+        entries = sorted(entries, key=lambda e: e.composition.reduced_composition)
 
         el_refs: dict[Element, PDEntry] = {}
         min_entries: list[PDEntry] = []
@@ -457,23 +574,11 @@ class PhaseDiagram(MSONable):
         extra_point[-1] = np.max(qhull_data) + 1
         qhull_data = np.concatenate([qhull_data, [extra_point]], axis=0)
 
-        if dim == 1:
-            facets = [qhull_data.argmin(axis=0)]
-        else:
-            facets = get_facets(qhull_data)
-            final_facets = []
-            for facet in facets:
-                # Skip facets that include the extra point
-                if max(facet) == len(qhull_data) - 1:
-                    continue
-                mat = qhull_data[facet]
-                mat[:, -1] = 1
-                if abs(np.linalg.det(mat)) > 1e-14:
-                    final_facets.append(facet)
-            facets = final_facets
+        facets = [qhull_data.argmin(axis=0)] if dim == 1 else _get_hull_facets(qhull_data)
 
         simplexes = [Simplex(qhull_data[facet, :-1]) for facet in facets]
-        self.elements = elements
+        if update_elements:
+            self.elements = elements
         return {
             "facets": facets,
             "simplexes": simplexes,
@@ -485,6 +590,132 @@ class PhaseDiagram(MSONable):
             "qhull_entries": qhull_entries,
         }
 
+    @cached_property
+    def _min_entries(self) -> dict[Composition, PDEntry]:
+        """Lowest energy entry for each reduced composition in the phase diagram."""
+        min_entries: dict[Composition, PDEntry] = {}
+        for entry in self.all_entries:
+            comp = entry.composition.reduced_composition
+            if comp not in min_entries or entry.energy_per_atom < min_entries[comp].energy_per_atom:
+                min_entries[comp] = entry
+        return min_entries
+
+    def add_entries(self, entries: Sequence[PDEntry]) -> list[PDEntry]:
+        """Add entries to the phase diagram in place, updating the convex hull
+        incrementally instead of recomputing it from all entries.
+
+        New entries are first compared with the existing hull. If none of them
+        lies on or below it, the facets are kept as is. Otherwise the hull is only
+        recomputed from the current stable entries and the new entries below the
+        hull, since adding entries can never make an unstable entry stable. A full
+        recomputation is needed only if the elemental references change, i.e. if
+        the new entries contain new elements or lower energy elemental entries.
+
+        Args:
+            entries (list[PDEntry]): PDEntry-like objects to add.
+
+        Returns:
+            list[PDEntry]: The added entries that are stable in the updated phase diagram.
+        """
+        if type(self) is not PhaseDiagram:
+            raise NotImplementedError(f"add_entries is not supported for {type(self).__name__}")
+
+        entries = list(entries)
+        if not entries:
+            return []
+
+        # Compute from local copies so that the phase diagram is left unchanged on failure
+        new_elements = {el for entry in entries for el in entry.elements} - set(self.elements)
+        all_entries = [*self.entries, *entries]
+        elements = list(self.elements)
+        if new_elements or any(
+            entry.composition.is_element
+            and entry.energy_per_atom < self.el_refs[entry.composition.elements[0]].energy_per_atom
+            for entry in entries
+        ):
+            elements += sorted(new_elements)
+            computed_data = self._compute(all_entries, elements)
+            min_entries = None
+        else:
+            computed_data, min_entries = self._add_entries_to_hull(entries)
+
+        self.entries = all_entries
+        self.elements = elements
+        if min_entries is None:
+            self.__dict__.pop("_min_entries", None)
+        else:
+            self.__dict__["_min_entries"] = min_entries
+        self._set_computed_data(computed_data)
+        PhaseDiagram._get_stable_entries_in_space.cache_clear()
+        PhaseDiagram._get_facet_and_simplex.cache_clear()
+
+        stable_entries = self.stable_entries
+        return [entry for entry in entries if entry in stable_entries]
+
+    def _add_entries_to_hull(self, entries: list[PDEntry]) -> tuple[dict[str, Any], dict[Composition, PDEntry]]:
+        """Get the computed data and the updated lowest energy entries after adding
+        entries that do not change the elemental references. Helper for add_entries.
+        """
+        elements = list(self.elements)
+        dim = len(elements)
+        ref_energies = np.array([self.el_refs[el].energy_per_atom for el in elements])
+
+        qhull_entries = list(self.qhull_entries)
+        qhull_data = [*self.qhull_data[:-1]]
+        qhull_indices = {entry.composition.reduced_composition: idx for idx, entry in enumerate(qhull_entries)}
+        min_entries = dict(self._min_entries)
+
+        # Indices of new lowest energy entries in qhull_entries
+        candidates: list[int] = []
+        for entry in entries:
+            comp = entry.composition.reduced_composition
+            if comp in min_entries and entry.energy_per_atom >= min_entries[comp].energy_per_atom:
+                continue
+            min_entries[comp] = entry
+            fractions = np.array([comp.get_atomic_fraction(el) for el in elements])
+            row = np.append(fractions[1:], entry.energy_per_atom)
+            if comp in qhull_indices:
+                idx = qhull_indices[comp]
+                qhull_entries[idx] = entry
+                qhull_data[idx] = row
+            elif entry.energy_per_atom - np.dot(fractions, ref_energies) < -PhaseDiagram.formation_energy_tol:
+                idx = qhull_indices[comp] = len(qhull_entries)
+                qhull_entries.append(entry)
+                qhull_data.append(row)
+            else:
+                continue
+            candidates.append(idx)
+
+        # Only entries on or below the current hull can change the facets
+        below_hull = [
+            idx
+            for idx in dict.fromkeys(candidates)
+            if qhull_entries[idx].energy_per_atom
+            < self.get_hull_energy_per_atom(qhull_entries[idx].composition) + PhaseDiagram.numerical_tol
+        ]
+
+        qhull_data_arr = np.array(qhull_data)
+        extra_point = np.zeros(dim) + 1 / dim
+        extra_point[-1] = np.max(qhull_data_arr) + 1
+        qhull_data_arr = np.concatenate([qhull_data_arr, [extra_point]], axis=0)
+
+        facets = self.facets
+        if below_hull:
+            vertices = np.array(sorted(set(itertools.chain(*self.facets, below_hull))))
+            sub_data = np.concatenate([qhull_data_arr[vertices], [extra_point]], axis=0)
+            facets = [vertices[facet] for facet in _get_hull_facets(sub_data)]
+
+        computed_data = {
+            "facets": facets,
+            "simplexes": [Simplex(qhull_data_arr[facet, :-1]) for facet in facets],
+            "all_entries": [*self.all_entries, *entries],
+            "qhull_data": qhull_data_arr,
+            "dim": dim,
+            "el_refs": list(self.el_refs.items()),
+            "qhull_entries": qhull_entries,
+        }
+        return computed_data, min_entries
+
     def pd_coords(self, comp: Composition) -> np.ndarray:
         """
         The phase diagram is generated in a reduced dimensional space
@@ -713,6 +944,160 @@ class PhaseDiagram(MSONable):
         """
         return comp.num_atoms * self.get_hull_energy_per_atom(comp)
 
+    @cached_property
+    def _facet_index(self) -> tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        """Spatial index of the facets: a uniform grid over the pd coordinates with
+        n_cells cells along each axis, sized so that the part of the grid covering the
+        composition simplex has a few cells per facet (at most about 2**20 cells in
+        total). The facets whose bounding boxes overlap each cell are listed in
+        ascending order as cell_facets[cell_offsets[cell] : cell_offsets[cell + 1]].
+
+        Returns:
+            tuple[int, np.ndarray, np.ndarray, np.ndarray]: n_cells, cell_offsets,
+                cell_facets and the inverse augmented matrices converting pd coordinates
+                to barycentric coordinates of each facet.
+        """
+        facets = np.array(self.facets, dtype=int).reshape(len(self.facets), self.dim)
+        coords = self.qhull_data[facets, :-1]
+        aug = np.concatenate([coords, np.ones((*facets.shape, 1))], axis=-1)
+
+        n_dims = self.dim - 1
+        n_cells = 1
+        if n_dims:
+            # The simplex covers 1 / n_dims! of the unit cube
+            n_cells = round(2 * (len(facets) * math.factorial(n_dims)) ** (1 / n_dims))
+            n_cells = max(1, min(n_cells, round(2 ** (20 / n_dims))))
+        tol = PhaseDiagram.numerical_tol / 10
+        lower = np.clip(np.floor((coords.min(axis=1) - tol) * n_cells), 0, n_cells - 1).astype(int)
+        upper = np.clip(np.floor((coords.max(axis=1) + tol) * n_cells), 0, n_cells - 1).astype(int)
+
+        cells, cell_facets = [], []
+        for facet_idx, (lo, hi) in enumerate(zip(lower, upper, strict=True)):
+            ranges = [np.arange(start, stop + 1) for start, stop in zip(lo, hi, strict=True)]
+            facet_cells = (
+                np.ravel_multi_index(np.meshgrid(*ranges, indexing="ij"), (n_cells,) * n_dims).ravel()
+                if n_dims
+                else np.zeros(1, dtype=int)
+            )
+            cells.append(facet_cells)
+            cell_facets.append(np.full(len(facet_cells), facet_idx))
+        cells_arr, cell_facets_arr = np.concatenate(cells), np.concatenate(cell_facets)
+        order = np.argsort(cells_arr, kind="stable")
+        cell_offsets = np.searchsorted(cells_arr[order], np.arange(n_cells**n_dims + 1))
+        return n_cells, cell_offsets, cell_facets_arr[order], np.linalg.inv(aug)
+
+    @staticmethod
+    def _get_cells(coords: np.ndarray, n_cells: int) -> np.ndarray:
+        """Flat indices of the cells of the _facet_index grid containing coords."""
+        cell_coords = np.clip(np.floor(coords * n_cells), 0, n_cells - 1).astype(int)
+        if not cell_coords.shape[1]:
+            return np.zeros(len(coords), dtype=int)
+        return np.ravel_multi_index(cell_coords.T, (n_cells,) * cell_coords.shape[1])
+
+    def _get_batch_coords(self, compositions: Sequence[Composition] | np.ndarray) -> np.ndarray:
+        """Get the pd coordinates of compositions given as Composition objects or
+        as an array of amounts of each element in self.elements.
+        """
+        if isinstance(compositions, np.ndarray):
+            if compositions.ndim != 2 or compositions.shape[1] != len(self.elements):
+                raise ValueError(f"Expected array of shape (n, {len(self.elements)}), got {compositions.shape}")
+            return (compositions / compositions.sum(axis=1, keepdims=True))[:, 1:]
+        coords = [self.pd_coords(Composition(comp)) for comp in compositions]
+        return np.array(coords).reshape(len(coords), self.dim - 1)
+
+    def get_decompositions(
+        self,
+        compositions: Sequence[Composition] | np.ndarray,
+        chunk_size: int = 2**22,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized version of get_decomposition for many compositions at once.
+
+        The facets containing the compositions are located with vectorized barycentric
+        tests, only for the facets listed in the cell of a uniform grid over the pd
+        coordinates (see _facet_index) containing each composition.
+
+        Args:
+            compositions (list[Composition] | np.ndarray): Compositions, or an array of
+                shape (n, len(self.elements)) with the amounts of each element of the
+                phase diagram, which avoids creating Composition objects.
+            chunk_size (int): Maximum number of composition-facet pairs tested at once.
+                Limits the memory used. Defaults to 2**22.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Indices in qhull_entries of the entries in the
+                decomposition of each composition and their fractional amounts, both of
+                shape (n, dim). Amounts smaller than numerical_tol are set to 0.
+        """
+        coords = self._get_batch_coords(compositions)
+        aug_coords = np.concatenate([coords, np.ones((len(coords), 1))], axis=1)
+        n_cells, cell_offsets, cell_facets, aug_inv = self._facet_index
+        tol = PhaseDiagram.numerical_tol / 10
+
+        # Candidate facets of each composition, in the cell containing it
+        cells = self._get_cells(coords, n_cells)
+        first_candidate, n_candidates = cell_offsets[cells], np.diff(cell_offsets)[cells]
+        candidate_offsets = np.concatenate([[0], np.cumsum(n_candidates)])
+
+        facet_idx = np.full(len(coords), -1)
+        bary_coords = np.zeros((len(coords), self.dim))
+        start = 0
+        while start < len(coords):
+            end = np.searchsorted(candidate_offsets, candidate_offsets[start] + chunk_size, side="right") - 1
+            end = min(max(end, start + 1), len(coords))
+            counts = n_candidates[start:end]
+            point_idx = np.repeat(np.arange(start, end), counts)
+            pair_idx = np.arange(candidate_offsets[start], candidate_offsets[end]) - candidate_offsets[point_idx]
+            candidates = cell_facets[first_candidate[point_idx] + pair_idx]
+            start = end
+
+            bary = np.einsum("ij,ijk->ik", aug_coords[point_idx], aug_inv[candidates])
+            in_facet = (bary >= -tol).all(axis=1)
+            # Use the first facet containing each composition like _get_facet_and_simplex
+            found, first = np.unique(point_idx[in_facet], return_index=True)
+            facet_idx[found] = candidates[in_facet][first]
+            bary_coords[found] = bary[in_facet][first]
+
+        if (missing := np.flatnonzero(facet_idx < 0)).size:
+            raise RuntimeError(f"No facet found for compositions at indices {missing.tolist()}")
+
+        bary_coords[np.abs(bary_coords) <= PhaseDiagram.numerical_tol] = 0
+        facets = np.array(self.facets, dtype=int).reshape(len(self.facets), self.dim)
+        return facets[facet_idx], bary_coords
+
+    def get_hull_energies_per_atom(self, compositions: Sequence[Composition] | np.ndarray, **kwargs) -> np.ndarray:
+        """Vectorized version of get_hull_energy_per_atom for many compositions at once.
+
+        Args:
+            compositions (list[Composition] | np.ndarray): Compositions, see get_decompositions().
+            **kwargs: Passed to get_decompositions().
+
+        Returns:
+            np.ndarray: Energy of lowest energy equilibrium at each composition.
+        """
+        entry_idx, amounts = self.get_decompositions(compositions, **kwargs)
+        energies = np.array([entry.energy_per_atom for entry in self.qhull_entries])
+        return (energies[entry_idx] * amounts).sum(axis=1)
+
+    def get_e_above_hulls(
+        self,
+        compositions: Sequence[Composition] | np.ndarray,
+        energies_per_atom: ArrayLike,
+        **kwargs,
+    ) -> np.ndarray:
+        """Vectorized energies above the convex hull for many compositions and energies
+        at once, e.g. to screen large numbers of candidates. Unlike get_e_above_hull,
+        negative values are returned for compositions below the hull.
+
+        Args:
+            compositions (list[Composition] | np.ndarray): Compositions, see get_decompositions().
+            energies_per_atom (ArrayLike): Energy per atom for each composition.
+            **kwargs: Passed to get_decompositions().
+
+        Returns:
+            np.ndarray: Energy above convex hull per atom for each composition.
+        """
+        return np.asarray(energies_per_atom, dtype=float) - self.get_hull_energies_per_atom(compositions, **kwargs)
+
     def get_decomp_and_e_above_hull(
         self,
         entry: PDEntry,
@@ -1613,6 +1998,7 @@ class PatchedPhaseDiagram(PhaseDiagram):
         elements: Sequence[Element] | None = None,
         keep_all_spaces: bool = False,
         verbose: bool = False,
+        n_workers: int = 1,
     ) -> None:
         """
         Args:
@@ -1626,6 +2012,8 @@ class PatchedPhaseDiagram(PhaseDiagram):
             keep_all_spaces (bool): Pass True to keep chemical spaces that are subspaces
                 of other spaces.
             verbose (bool): Whether to show progress bar during convex hull construction.
+            n_workers (int): Number of parallel processes used to compute the convex
+                hulls of the PhaseDiagram patches. Defaults to 1 (serial).
         """
         if elements is None:
             elements = sorted({els for entry in entries for els in entry.elements})
@@ -1685,11 +2073,18 @@ class PatchedPhaseDiagram(PhaseDiagram):
         self.spaces = sorted(spaces, key=len, reverse=True)  # Calculate pds for smaller dimension spaces last
         self.qhull_entries = qhull_entries
         self._qhull_spaces = qhull_spaces
-        self.pds = dict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
         self.all_entries = all_entries
         self.el_refs = el_refs
+        if n_workers == 1:
+            self.pds = dict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
+        else:
+            self.pds = self._get_pd_patches(n_workers, verbose)
         self.elements = elements
 
+        self._set_stable_entries()
+
+    def _set_stable_entries(self) -> None:
+        """Set the stable entries from the PhaseDiagram patches."""
         # Add terminal elements as we may not have PD patches including them
         # NOTE add el_refs in case no multielement entries are present for el
         _stable_entries = {se for pd in self.pds.values() for se in pd._stable_entries}
@@ -1765,6 +2160,48 @@ class PatchedPhaseDiagram(PhaseDiagram):
         elements = [Element.from_dict(elem) for elem in dct["elements"]]
         return cls(entries, elements)
 
+    def _get_save_data(
+        self,
+        get_indices: Callable[[Sequence[PDEntry]], np.ndarray],
+        prefix: str = "",
+    ) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """Get the header and arrays written by save, see PhaseDiagram._get_save_data."""
+        header: dict[str, Any] = {"spaces": [sorted(space) for space in self.spaces], "pds": []}
+        arrays = {
+            "all_entries": get_indices(self.all_entries),
+            "qhull_entries": get_indices(self.qhull_entries),
+            "el_refs": get_indices([self.el_refs[el] for el in self.elements]),
+        }
+        for idx, (space, pd) in enumerate(self.pds.items()):
+            pd_header, pd_arrays = pd._get_save_data(get_indices, prefix=f"pds/{idx}/")
+            header["pds"].append({"space": sorted(space), "elements": list(pd.elements), **pd_header})
+            arrays |= pd_arrays
+        return header, arrays
+
+    @classmethod
+    def _from_save_data(
+        cls,
+        header: dict[str, Any],
+        arrays: dict[str, np.ndarray],
+        entries: list[PDEntry],
+        prefix: str = "",
+    ) -> Self:
+        """Inverse of _get_save_data."""
+        ppd = cls.__new__(cls)
+        ppd.elements = elements = header["elements"]
+        ppd.dim = len(elements)
+        ppd.all_entries = [entries[idx] for idx in arrays["all_entries"]]
+        ppd.qhull_entries = tuple(entries[idx] for idx in arrays["qhull_entries"])
+        ppd._qhull_spaces = tuple(frozenset(entry.elements) for entry in ppd.qhull_entries)
+        ppd.el_refs = {el: entries[idx] for el, idx in zip(elements, arrays["el_refs"], strict=True)}
+        ppd.spaces = [frozenset(space) for space in header["spaces"]]
+        ppd.pds = {}
+        for idx, pd_header in enumerate(header["pds"]):
+            pd = PhaseDiagram._from_save_data(pd_header, arrays, entries, prefix=f"pds/{idx}/")
+            ppd.pds[frozenset(pd_header["space"])] = pd
+        ppd._set_stable_entries()
+        return ppd
+
     @staticmethod
     def remove_redundant_spaces(spaces, keep_all_spaces=False):
         if keep_all_spaces or len(spaces) <= 1:
@@ -1791,7 +2228,9 @@ class PatchedPhaseDiagram(PhaseDiagram):
     # get_e_above_hull(),
     # get_decomp_and_e_above_hull(),
     # get_decomp_and_phase_separation_energy(),
-    # get_phase_separation_energy()
+    # get_phase_separation_energy(),
+    # get_hull_energies_per_atom(),
+    # get_e_above_hulls()
 
     def get_pd_for_entry(self, entry: Entry | Composition) -> PhaseDiagram:
         """Get the possible phase diagrams for an entry.
@@ -1835,6 +2274,83 @@ class PatchedPhaseDiagram(PhaseDiagram):
             competing_entries = self._get_stable_entries_in_space(frozenset(comp.elements))
             return _get_slsqp_decomp(comp, competing_entries)
 
+    def get_decompositions(
+        self,
+        compositions: Sequence[Composition] | np.ndarray,
+        **kwargs,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """See PhaseDiagram. The compositions are grouped by chemical space, and the
+        decompositions of each group are found at once in the smallest PhaseDiagram
+        patch containing that space.
+
+        Args:
+            compositions (list[Composition] | np.ndarray): Compositions, or an array of
+                shape (n, len(self.elements)) with the amounts of each element of the
+                phase diagram, which avoids creating Composition objects.
+            **kwargs: Passed to PhaseDiagram.get_decompositions() of each patch.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Indices in qhull_entries of the entries in the
+                decomposition of each composition and their fractional amounts, both of
+                shape (n, d) with d the largest dimension of the patches used. Rows of
+                decompositions in smaller patches are padded with amounts of 0.
+
+        Raises:
+            ValueError: If no patch contains the chemical space of a composition with
+                more than one element. Unlike get_decomposition, there is no fallback
+                to SLSQP.
+        """
+        if isinstance(compositions, np.ndarray):
+            if compositions.ndim != 2 or compositions.shape[1] != len(self.elements):
+                raise ValueError(f"Expected array of shape (n, {len(self.elements)}), got {compositions.shape}")
+            amounts = compositions
+        else:
+            compositions = [Composition(comp) for comp in compositions]
+            for comp in compositions:
+                if extra := set(comp.elements) - set(self.elements):
+                    raise ValueError(f"{comp} contains elements {sorted(map(str, extra))} not in the phase diagram")
+            amounts = np.array([[comp[el] for el in self.elements] for comp in compositions]).reshape(
+                len(compositions), len(self.elements)
+            )
+
+        space_masks, space_indices = np.unique(amounts > 0, axis=0, return_inverse=True)
+        space_indices = space_indices.reshape(-1)
+        qhull_indices = {id(entry): idx for idx, entry in enumerate(self.qhull_entries)}
+
+        decompositions = []
+        for space_idx, space_mask in enumerate(space_masks):
+            space = frozenset(el for el, present in zip(self.elements, space_mask, strict=True) if present)
+            rows = np.flatnonzero(space_indices == space_idx)
+            pd = self._get_smallest_pd_for_space(space)
+            if pd is None and len(space) == 1:
+                # Elements without patches decompose into their elemental reference
+                el_ref_idx = qhull_indices[id(self.el_refs[next(iter(space))])]
+                decompositions.append((rows, np.full((len(rows), 1), el_ref_idx), np.ones((len(rows), 1))))
+                continue
+            if pd is None:
+                raise ValueError(f"No suitable PhaseDiagrams found for {'-'.join(sorted(map(str, space)))}.")
+            columns = [self.elements.index(el) for el in pd.elements]
+            entry_idx, weights = pd.get_decompositions(amounts[np.ix_(rows, columns)], **kwargs)
+            to_qhull_idx = np.array([qhull_indices[id(entry)] for entry in pd.qhull_entries])
+            decompositions.append((rows, to_qhull_idx[entry_idx], weights))
+
+        width = max((weights.shape[1] for _, _, weights in decompositions), default=1)
+        all_entry_idx = np.zeros((len(amounts), width), dtype=int)
+        all_weights = np.zeros((len(amounts), width))
+        for rows, entry_idx, weights in decompositions:
+            all_entry_idx[rows, : entry_idx.shape[1]] = entry_idx
+            all_weights[rows, : weights.shape[1]] = weights
+        return all_entry_idx, all_weights
+
+    def _get_smallest_pd_for_space(self, space: frozenset[Element]) -> PhaseDiagram | None:
+        """Get the PhaseDiagram patch with the fewest elements containing space, None
+        if no patch contains it.
+        """
+        if space in self.pds:
+            return self.pds[space]
+        containing = [pd_space for pd_space in self.pds if pd_space.issuperset(space)]
+        return self.pds[min(containing, key=len)] if containing else None
+
     def get_equilibrium_reaction_energy(self, entry: Entry) -> float:
         """See PhaseDiagram.
 
@@ -1880,6 +2396,55 @@ class PatchedPhaseDiagram(PhaseDiagram):
 
         return space, PhaseDiagram(space_entries)
 
+    def _get_pd_patches(self, n_workers: int, verbose: bool = False) -> dict[frozenset[Element], PhaseDiagram]:
+        """Get the PhaseDiagram patches for all spaces, computing their convex hulls
+        in parallel. Only the hull data of each patch is sent to the worker processes,
+        so entries are neither pickled nor copied and stay shared between overlapping
+        patches. The patches with the most entries are computed first.
+
+        Args:
+            n_workers (int): Number of parallel processes.
+            verbose (bool): Whether to show progress bar during convex hull construction.
+
+        Returns:
+            dict[frozenset[Element], PhaseDiagram]: PhaseDiagram for each space in self.spaces.
+        """
+        patches = {}
+        for space in self.spaces:
+            elements = sorted(space)
+            space_entries = [
+                e for e, s in zip(self.qhull_entries, self._qhull_spaces, strict=True) if space.issuperset(s)
+            ]
+            qhull_data = np.array(
+                [
+                    [e.composition.get_atomic_fraction(el) for el in elements[1:]] + [e.energy_per_atom]
+                    for e in space_entries
+                ]
+            )
+            extra_point = np.zeros(len(elements)) + 1 / len(elements)
+            extra_point[-1] = np.max(qhull_data) + 1
+            patches[space] = elements, space_entries, np.concatenate([qhull_data, [extra_point]], axis=0)
+
+        spaces = sorted(self.spaces, key=lambda space: len(patches[space][1]), reverse=True)
+        all_facets = Parallel(n_jobs=n_workers)(
+            delayed(_get_hull_facets)(patches[space][2]) for space in tqdm(spaces, disable=not verbose)
+        )
+
+        pds = {}
+        for space, facets in zip(spaces, all_facets, strict=True):
+            elements, space_entries, qhull_data = patches[space]
+            computed_data = {
+                "facets": facets,
+                "simplexes": [Simplex(qhull_data[facet, :-1]) for facet in facets],
+                "all_entries": space_entries,
+                "qhull_data": qhull_data,
+                "dim": len(elements),
+                "el_refs": [(el, self.el_refs[el]) for el in elements],
+                "qhull_entries": space_entries,
+            }
+            pds[space] = PhaseDiagram(space_entries, elements, computed_data=computed_data)
+        return {space: pds[space] for space in self.spaces}
+
     # NOTE the following functions are not implemented for PatchedPhaseDiagram
 
     def _get_facet_and_simplex(self):
@@ -2103,6 +2668,28 @@ def get_facets(qhull_data: ArrayLike, joggle: bool = False) -> ConvexHull:
     return ConvexHull(qhull_data, qhull_options="Qt i").simplices
 
 
+def _get_hull_facets(qhull_data: np.ndarray) -> list[np.ndarray]:
+    """Get the facets of the lower convex hull for PhaseDiagram.
+
+    Args:
+        qhull_data (np.ndarray): The data from which to construct the convex
+            hull, with the extra point enforcing full dimensionality as last row.
+
+    Returns:
+        list[np.ndarray]: Facets excluding the extra point and degenerate facets.
+    """
+    facets = []
+    for facet in get_facets(qhull_data):
+        # Skip facets that include the extra point
+        if max(facet) == len(qhull_data) - 1:
+            continue
+        mat = qhull_data[facet]
+        mat[:, -1] = 1
+        if abs(np.linalg.det(mat)) > 1e-14:
+            facets.append(facet)
+    return facets
+
+
 def _get_slsqp_decomp(
     comp,
     competing_entries,
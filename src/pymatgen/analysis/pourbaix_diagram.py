@@ -31,11 +31,11 @@ from pymatgen.util.plotting import pretty_plot
 from pymatgen.util.string import Stringify
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
     from typing import Any, ClassVar, Literal
 
     import matplotlib.pyplot as plt
-    from numpy.typing import NDArray
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.core import DummySpecies, Species
@@ -528,6 +528,13 @@ class PourbaixDiagram(MSONable):
 
         self._stable_domains, self._stable_domain_vertices = self.get_pourbaix_domains(self._processed_entries)
 
+        # Energies of the stable entries are linear in pH and V: energy + PREFAC * npH * pH + nPhi * V,
+        # then normalized by multiplying with the normalization factors
+        self._stable_energy_coefficients = np.array(
+            [[entry.energy, entry.npH * PREFAC, entry.nPhi] for entry in self._stable_domains]
+        )
+        self._stable_normalization_factors = np.array([entry.normalization_factor for entry in self._stable_domains])
+
     def _convert_entries_to_points(self, pourbaix_entries: list[PourbaixEntry]) -> NDArray:
         """
         Args:
@@ -637,28 +644,9 @@ class PourbaixDiagram(MSONable):
                     these_combos.append(frozenset(these_entries))
                 combos.append(these_combos)
 
-        all_combos: set | list = set(itertools.chain.from_iterable(combos))
-
-        list_combos: list = []
-        for combo in all_combos:
-            list_combos.append(list(combo))
-        all_combos = list_combos
-
-        multi_entries: list = []
-
-        # Parallel processing of multi-entry generation
-        if nproc is not None:
-            func = partial(self.process_multientry, prod_comp=tot_comp)
-            with Pool(nproc) as proc_pool:
-                multi_entries = list(proc_pool.imap(func, all_combos))
-            multi_entries = list(filter(bool, multi_entries))
-        else:
-            # Serial processing of multi-entry generation
-            for combo in all_combos:
-                if multi_entry := self.process_multientry(combo, prod_comp=tot_comp):
-                    multi_entries.append(multi_entry)
+        all_combos = [list(combo) for combo in set(itertools.chain.from_iterable(combos))]
 
-        return multi_entries
+        return self._process_multientries(all_combos, tot_comp, nproc=nproc)
 
     def _generate_multielement_entries(
         self,
@@ -670,7 +658,8 @@ class PourbaixDiagram(MSONable):
 
         This works by finding all possible linear combinations
         of entries that can result in the specified composition
-        from the initialized comp_dict.
+        from the initialized comp_dict. Only entries on the lower
+        hull in nph-nphi-composition space are combined.
 
         Args:
             entries ([PourbaixEntries]): list of Pourbaix entries
@@ -681,34 +670,120 @@ class PourbaixDiagram(MSONable):
         n_elems = len(self._elt_comp)  # No. of elements
         total_comp = Composition(self._elt_comp)
 
-        # generate all combinations of compounds that have all elements
-        entry_combos: list = [itertools.combinations(entries, idx + 1) for idx in range(n_elems)]
-        entry_combos = list(itertools.chain.from_iterable(entry_combos))
-
-        entry_combos = list(filter(lambda x: total_comp < MultiEntry(x).composition, entry_combos))
+        # Entries that are never on the lower hull in nph-nphi-composition space
+        # cannot be part of a stable MultiEntry
+        min_entries, valid_facets = self._get_hull_in_nph_nphi_space(entries)
+        hull_ids = {id(min_entries[idx]) for idx in set(itertools.chain.from_iterable(valid_facets))}
+        hull_entries = [entry for entry in entries if id(entry) in hull_ids]
+        logger.info(f"Kept {len(hull_entries)} of {len(entries)} entries on the lower hull")
 
-        # Generate and filter entries
-        processed_entries: list = []
-        total = sum(comb(len(entries), idx + 1) for idx in range(n_elems))
+        total = sum(comb(len(hull_entries), idx + 1) for idx in range(n_elems))
         if total > 1e6:
             warnings.warn(
                 f"Your Pourbaix diagram includes {total} entries and may take a long time to generate.", stacklevel=2
             )
 
+        # Lazily generate the combinations of compounds that have all elements
+        entry_combos = (
+            combo
+            for idx in range(n_elems)
+            for combo in itertools.combinations(hull_entries, idx + 1)
+            if total_comp < MultiEntry(combo).composition
+        )
+        return self._process_multientries(entry_combos, total_comp, nproc=nproc)
+
+    def _process_multientries(
+        self,
+        combos: Iterable[Sequence[PourbaixEntry]],
+        prod_comp: Composition,
+        nproc: int | None = None,
+        batch_size: int = 10_000,
+    ) -> list[MultiEntry]:
+        """Find the MultiEntries for combinations of entries with process_multientry,
+        after pruning the combinations that cannot form one (see _prune_combos).
+
+        Args:
+            combos (Iterable[list[PourbaixEntry]]): Combinations of entries. They
+                are consumed lazily, batch_size at a time.
+            prod_comp (Composition): Composition constraint of the MultiEntries.
+            nproc (int): number of processes to be used in parallel
+                treatment of entry combos. Defaults to None (serial processing).
+            batch_size (int): Number of combinations pruned at once.
+
+        Returns:
+            list[MultiEntry]: MultiEntries in the order of combos.
+        """
+        n_combos = n_candidates = 0
+
+        def get_candidates() -> Iterator[Sequence[PourbaixEntry]]:
+            nonlocal n_combos, n_candidates
+            combos_iter = iter(combos)
+            while batch := list(itertools.islice(combos_iter, batch_size)):
+                candidates = self._prune_combos(batch, prod_comp)
+                n_combos += len(batch)
+                n_candidates += len(candidates)
+                yield from candidates
+
         # Parallel processing of multi-entry generation
         if nproc is not None:
-            func = partial(self.process_multientry, prod_comp=total_comp)
+            func = partial(self.process_multientry, prod_comp=prod_comp)
             with Pool(nproc) as proc_pool:
-                processed_entries = list(proc_pool.imap(func, entry_combos))
-            processed_entries = list(filter(bool, processed_entries))
+                chunksize = max(1, batch_size // (4 * nproc))
+                multi_entries = list(filter(bool, proc_pool.imap(func, get_candidates(), chunksize=chunksize)))
+
         # Serial processing of multi-entry generation
         else:
-            for combo in entry_combos:
-                processed_entry = self.process_multientry(combo, total_comp)
-                if processed_entry is not None:
-                    processed_entries.append(processed_entry)
+            multi_entries = [
+                multi_entry
+                for combo in get_candidates()
+                if (multi_entry := self.process_multientry(combo, prod_comp=prod_comp))
+            ]
 
-        return processed_entries
+        logger.info(f"Pruned {n_combos - n_candidates} of {n_combos} entry combinations")
+        return multi_entries
+
+    def _prune_combos(
+        self,
+        combos: list[Sequence[PourbaixEntry]],
+        prod_comp: Composition,
+        tol: float = 1e-6,
+    ) -> list[Sequence[PourbaixEntry]]:
+        """Remove combinations of entries that process_multientry would reject
+        because no positive combination of their non-OH compositions gives
+        prod_comp. The weights are found for all combinations of the same size at
+        once by least squares. Linearly dependent combinations are always kept, as
+        their weights are not unique.
+
+        Args:
+            combos (list[list[PourbaixEntry]]): Combinations of entries.
+            prod_comp (Composition): Composition constraint of the MultiEntries.
+            tol (float): Tolerance of the composition residual and weights.
+
+        Returns:
+            list[list[PourbaixEntry]]: The combinations that may form a MultiEntry.
+        """
+        elements = sorted(
+            ({el for combo in combos for entry in combo for el in entry.composition.elements} | {*prod_comp.elements})
+            - self.elements_ho
+        )
+        target = np.array([prod_comp[el] for el in elements]) / sum(prod_comp[el] for el in elements)
+
+        by_size: dict[int, list[int]] = {}
+        for idx, combo in enumerate(combos):
+            by_size.setdefault(len(combo), []).append(idx)
+
+        keep = np.ones(len(combos), dtype=bool)
+        for size, indices in by_size.items():
+            # Compositions of the entries as columns, shape (n_combos, n_elements, size)
+            amounts = np.array(
+                [[[entry.composition[el] for entry in combos[idx]] for el in elements] for idx in indices]
+            )
+            weights = np.einsum("nke,e->nk", np.linalg.pinv(amounts), target)
+            residual = np.linalg.norm(np.einsum("nek,nk->ne", amounts, weights) - target, axis=1)
+            feasible = (residual < tol) & (weights > -tol).all(axis=1)
+            keep[indices] = feasible | (np.linalg.matrix_rank(amounts) < size)
+
+        return [combo for combo, kept in zip(combos, keep, strict=True) if kept]
 
     @staticmethod
     def process_multientry(
@@ -850,14 +925,15 @@ class PourbaixDiagram(MSONable):
         Returns:
             PourbaixEntry: stable entry at pH, V
         """
-        energies_at_conditions = [entry.normalized_energy_at_conditions(pH, V) for entry in self.stable_entries]
-        return self.stable_entries[np.argmin(energies_at_conditions)]
+        _, stable_idx = self.get_hull_energy_and_stable_indices(pH, V)
+        return self.stable_entries[int(stable_idx)]
 
     def get_decomposition_energy(
         self,
         entry: PourbaixEntry,
         pH: float,
         V: float,
+        hull_energy: NDArray | None = None,
     ) -> NDArray:
         """Find decomposition to most stable entries in eV/atom,
         supports vectorized inputs for pH and V.
@@ -867,6 +943,8 @@ class PourbaixDiagram(MSONable):
                 compound to find the decomposition for
             pH (float): pH at which to find the decomposition
             V (float): voltage at which to find the decomposition
+            hull_energy (NDArray): Precomputed hull energy at pH and V,
+                e.g. from get_hull_energy_and_stable_indices. Computed if None.
 
         Returns:
             Decomposition energy for the entry, i.e. the energy above
@@ -879,8 +957,9 @@ class PourbaixDiagram(MSONable):
         ).fractional_composition
         if entry_pbx_comp != pbx_comp:
             raise ValueError("Composition of stability entry does not match Pourbaix Diagram")
+        if hull_energy is None:
+            hull_energy = self.get_hull_energy(pH, V)
         entry_normalized_energy = entry.normalized_energy_at_conditions(pH, V)
-        hull_energy = self.get_hull_energy(pH, V)
         decomposition_energy = entry_normalized_energy - hull_energy
 
         # Convert to eV/atom instead of eV/normalized formula unit
@@ -899,8 +978,71 @@ class PourbaixDiagram(MSONable):
         Returns:
             np.array: minimum Pourbaix energy at conditions
         """
-        all_gs = np.array([entry.normalized_energy_at_conditions(pH, V) for entry in self.stable_entries])
-        return np.min(all_gs, axis=0)
+        return self.get_hull_energy_and_stable_indices(pH, V)[0]
+
+    def get_hull_energy_and_stable_indices(
+        self,
+        pH: ArrayLike,
+        V: ArrayLike,
+        chunk_size: int = 2**22,
+    ) -> tuple[NDArray, NDArray[np.int_]]:
+        """Get the hull energy and the stable entry at many pH, V conditions at
+        once, e.g. over a pH-V mesh for stability maps. The energies of all stable
+        entries are evaluated from their energy coefficients in one vectorized
+        operation per chunk of conditions.
+
+        Args:
+            pH (ArrayLike): pH at each condition.
+            V (ArrayLike): V at each condition, broadcastable with pH.
+            chunk_size (int): Maximum number of entry-condition pairs evaluated
+                at once. Limits the memory used. Defaults to 2**22.
+
+        Returns:
+            tuple[NDArray, NDArray[np.int_]]: Minimum Pourbaix energy and index in
+                stable_entries of the stable entry at each condition, with the
+                broadcast shape of pH and V.
+        """
+        pH, V = np.broadcast_arrays(np.asarray(pH, dtype=float), np.asarray(V, dtype=float))
+        flat_pH, flat_V = pH.ravel(), V.ravel()
+        energy, npH_term, nPhi = self._stable_energy_coefficients.T[:, :, None]
+        normalization_factor = self._stable_normalization_factors[:, None]
+
+        hull_energy = np.empty(pH.size)
+        stable_indices = np.empty(pH.size, dtype=int)
+        step = max(1, chunk_size // len(normalization_factor))
+        for start in range(0, pH.size, step):
+            # Same order of operations as PourbaixEntry.normalized_energy_at_conditions
+            chunk = slice(start, start + step)
+            energies = (energy + npH_term * flat_pH[chunk] + nPhi * flat_V[chunk]) * normalization_factor
+            indices = np.argmin(energies, axis=0)
+            stable_indices[chunk] = indices
+            hull_energy[chunk] = energies[indices, np.arange(len(indices))]
+
+        # Indexing with () gives scalars for scalar pH and V
+        return hull_energy.reshape(pH.shape)[()], stable_indices.reshape(pH.shape)[()]
+
+    def get_decomposition_energies(
+        self,
+        entries: Sequence[PourbaixEntry],
+        pH: ArrayLike,
+        V: ArrayLike,
+        chunk_size: int = 2**22,
+    ) -> NDArray:
+        """Decomposition energies in eV/atom of several entries at many pH, V
+        conditions, computing the hull energy only once.
+
+        Args:
+            entries (list[PourbaixEntry]): Entries to find the decomposition energies for.
+            pH (ArrayLike): pH at each condition.
+            V (ArrayLike): V at each condition, broadcastable with pH.
+            chunk_size (int): See get_hull_energy_and_stable_indices.
+
+        Returns:
+            NDArray: Decomposition energies with shape (len(entries), *conditions shape).
+        """
+        hull_energy, _ = self.get_hull_energy_and_stable_indices(pH, V, chunk_size=chunk_size)
+        pH, V = np.broadcast_arrays(np.asarray(pH, dtype=float), np.asarray(V, dtype=float))
+        return np.array([self.get_decomposition_energy(entry, pH, V, hull_energy=hull_energy) for entry in entries])
 
     def get_stable_entry(self, pH: float, V: float) -> PourbaixEntry | MultiEntry:
         """Get the stable entry at a given pH, V condition.
@@ -913,8 +1055,8 @@ class PourbaixDiagram(MSONable):
             PourbaixEntry | MultiEntry: Pourbaix or multi-entry
                 corresponding to the minimum energy entry at a given pH, V condition
         """
-        all_gs = np.array([entry.normalized_energy_at_conditions(pH, V) for entry in self.stable_entries])
-        return self.stable_entries[np.argmin(all_gs)]
+        _, stable_idx = self.get_hull_energy_and_stable_indices(pH, V)
+        return self.stable_entries[int(stable_idx)]
 
     @property
     def stable_entries(self) -> list:
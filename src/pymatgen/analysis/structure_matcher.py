@@ -4,25 +4,29 @@ from __future__ import annotations
 
 import abc
 import itertools
+import json
 import math
+from collections import OrderedDict
 from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
-from monty.json import MSONable
+from joblib import Parallel, delayed
+from monty.json import MontyEncoder, MSONable
+from monty.serialization import dumpfn, loadfn
 
 from pymatgen.core import SETTINGS, Composition, IStructure, Lattice, Structure, get_el_sp
-from pymatgen.optimization.linear_assignment import LinearAssignment
+from pymatgen.optimization.linear_assignment import LinearAssignment, linear_assignment_batch
 from pymatgen.util.coord import lattice_points_in_supercell
 from pymatgen.util.coord_cython import is_coord_subset_pbc, pbc_shortest_vectors
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
     from typing import Literal
 
     from typing_extensions import Self
 
-    from pymatgen.util.typing import SpeciesLike
+    from pymatgen.util.typing import PathLike, SpeciesLike
 
 __author__ = "William Davidson Richards, Stephen Dacek, Shyue Ping Ong"
 __copyright__ = "Copyright 2011, The Materials Project"
@@ -308,6 +312,99 @@ class OccupancyComparator(AbstractComparator):
         return 1
 
 
+def _get_matching_volume_range(lattice: Lattice, ltol: float, angle_tol: float) -> tuple[float, float]:
+    """Bounds on the volume of any lattice that Lattice.find_all_mappings can
+    match to lattice, i.e. with lengths within a factor 1 + ltol and angles
+    within angle_tol of those of lattice. The bounds are computed with interval
+    arithmetic and are therefore conservative.
+    """
+    a, b, c, *angles = lattice.parameters
+    # Small margins for rounding errors in the lengths and angles
+    angle_tol += 1e-6
+    length_factor = (1 + ltol) ** 3 * (1 + 1e-8)
+
+    cos_ranges = [
+        (math.cos(math.radians(min(angle + angle_tol, 180))), math.cos(math.radians(max(angle - angle_tol, 0))))
+        for angle in angles
+    ]
+    # V = abc * sqrt(1 - cos(alpha)^2 - cos(beta)^2 - cos(gamma)^2 + 2 cos(alpha) cos(beta) cos(gamma))
+    sq_min = sum(0 if lo <= 0 <= hi else min(lo**2, hi**2) for lo, hi in cos_ranges)
+    sq_max = sum(max(lo**2, hi**2) for lo, hi in cos_ranges)
+    products = [x * y * z for x, y, z in itertools.product(*cos_ranges)]
+    factor_min = math.sqrt(max(1 - sq_max + 2 * min(products), 0))
+    factor_max = math.sqrt(max(1 - sq_min + 2 * max(products), 0))
+    return a * b * c * factor_min / length_factor, a * b * c * factor_max * length_factor
+
+
+def _iter_bijections(compatible: np.ndarray) -> Iterator[tuple[int, ...]]:
+    """Yield the permutations perm of range(len(compatible)) with compatible[i, perm[i]]
+    for all i, in the order of itertools.permutations, by backtracking.
+    """
+    n = len(compatible)
+    candidates = [np.flatnonzero(row).tolist() for row in compatible]
+    perm: list[int] = []
+    used = [False] * n
+
+    def backtrack(i):
+        if i == n:
+            yield tuple(perm)
+            return
+        for j in candidates[i]:
+            if not used[j]:
+                used[j] = True
+                perm.append(j)
+                yield from backtrack(i + 1)
+                perm.pop()
+                used[j] = False
+
+    yield from backtrack(0)
+
+
+def _get_nn_distance_ranges(struct: Structure) -> dict:
+    """Range of nearest-neighbor distances of the sites of each species of struct,
+    in units of the average free length per atom (V / n_sites) ** (1/3).
+    """
+    length = (struct.volume / len(struct)) ** (1 / 3)
+    # Most sites have a neighbor within 1.2 length. The radius is doubled until all
+    # sites have one, or it exceeds the longest lattice vector, beyond which sites
+    # without periodic images can be left without neighbors (inf distance).
+    nn_dists = np.full(len(struct), np.inf)
+    r = 1.2 * length
+    while True:
+        centers, _, _, distances = struct.get_neighbor_list(r)
+        np.minimum.at(nn_dists, centers, distances)
+        if np.isfinite(nn_dists).all() or r > max(struct.lattice.abc):
+            break
+        r *= 2
+    nn_dists /= length
+    ranges = {}
+    for sp in struct.elements:
+        sp_dists = nn_dists[[sp in site.species for site in struct]]
+        ranges[sp] = sp_dists.min(), sp_dists.max()
+    return ranges
+
+
+class _LazySequence:
+    """Items of an iterator, computed when first iterated over and reused by
+    later iterations.
+    """
+
+    def __init__(self, iterable: Iterable) -> None:
+        self._iterator = iter(iterable)
+        self._items: list = []
+
+    def __iter__(self) -> Iterator:
+        idx = 0
+        while True:
+            if idx == len(self._items):
+                try:
+                    self._items.append(next(self._iterator))
+                except StopIteration:
+                    return
+            yield self._items[idx]
+            idx += 1
+
+
 class StructureMatcher(MSONable):
     """Match structures by similarity.
 
@@ -363,6 +460,7 @@ class StructureMatcher(MSONable):
         comparator: AbstractComparator | None = None,
         supercell_size: Literal["num_sites", "num_atoms", "volume"] = "num_sites",
         ignored_species: Sequence[SpeciesLike] = (),
+        cache_size: int = 0,
     ) -> None:
         """
         Args:
@@ -405,6 +503,10 @@ class StructureMatcher(MSONable):
                 except for certain ions, e.g. Li-ion intercalation frameworks.
                 This is more useful than allow_subset because it allows better
                 control over what species are ignored in the matching.
+            cache_size (int): Maximum number of reduced structures cached by
+                this matcher, keyed by lattice, species and coordinates. Useful
+                when the same structures are compared many times. Defaults to
+                0, i.e. no caching.
         """
         self.ltol = ltol
         self.stol = stol
@@ -416,6 +518,8 @@ class StructureMatcher(MSONable):
         self._supercell_size = supercell_size
         self._subset = allow_subset
         self._ignored_species = ignored_species
+        self._cache_size = cache_size
+        self._reduced_cache: OrderedDict[tuple, Structure] = OrderedDict()
 
     def _get_supercell_size(self, s1, s2):
         """Get the supercell size, and whether the supercell should be applied to s1.
@@ -457,15 +561,10 @@ class StructureMatcher(MSONable):
             s (Structure): input structure.
             supercell_size (int): Number of primitive cells in returned lattice
         """
-        lattices = s.lattice.find_all_mappings(
-            target_lattice,
-            ltol=self.ltol,
-            atol=self.angle_tol,
-            skip_rotation_matrix=True,
-        )
-        for latt, _, scale_m in lattices:
-            if math.isclose(abs(np.linalg.det(scale_m)), supercell_size, abs_tol=0.5, rel_tol=0):
-                yield latt, scale_m
+        for aligned_ms, scale_ms in s.lattice._find_all_mapping_arrays(target_lattice, self.ltol, self.angle_tol):
+            valid = np.abs(np.abs(np.linalg.det(scale_ms)) - supercell_size) <= 0.5
+            for aligned_m, scale_m in zip(aligned_ms[valid], scale_ms[valid], strict=True):
+                yield Lattice(aligned_m), scale_m
 
     def _get_supercells(self, struct1, struct2, fu, s1_supercell):
         """Compute all supercells of one structure close to the lattice of the other
@@ -535,21 +634,73 @@ class StructureMatcher(MSONable):
             Fractional translation vector to apply to s2.
             Mapping from s1 to s2, i.e. with numpy slicing, s1[mapping] => s2
         """
-        if len(s2) > len(s1):
-            raise ValueError(f"{len(s1)=} must be larger than {len(s2)=}")
-        if mask.shape != (len(s2), len(s1)):
+        dists, f_translations, solutions = cls._cart_dists_batch(
+            s1, np.asarray(s2)[None], avg_lattice, mask, normalization, lll_frac_tol
+        )
+        return dists[0], f_translations[0], solutions[0]
+
+    @classmethod
+    def _cart_dists_batch(cls, s1, s2s, avg_lattice, mask, normalization, lll_frac_tol=None):
+        """Batched version of _cart_dists for many translated copies of s2,
+        solving all linear assignment problems in a single call.
+
+        Args:
+            s1: numpy array of fractional coordinates.
+            s2s: numpy array of shape (n_translations, len(s2), 3) of
+                fractional coordinates. len(s1) >= len(s2)
+            avg_lattice: Lattice on which to calculate distances
+            mask: numpy array of booleans. mask[i, j] = True indicates
+                that s2[i] cannot be matched to s1[j]
+            normalization (float): inverse normalization length
+            lll_frac_tol (float): tolerance for Lenstra-Lenstra-Lovász lattice basis reduction algorithm
+
+        Returns:
+            Distances, fractional translation vectors and mappings as in
+            _cart_dists, stacked for all translations.
+        """
+        n_trans, n_s2 = s2s.shape[:2]
+        if n_s2 > len(s1):
+            raise ValueError(f"{len(s1)=} must be larger than len(s2)={n_s2}")
+        if mask.shape != (n_s2, len(s1)):
             raise ValueError("mask has incorrect shape")
 
         # vectors are from s2 to s1
-        vecs, d_2 = pbc_shortest_vectors(avg_lattice, s2, s1, mask, return_d2=True, lll_frac_tol=lll_frac_tol)
-        lin = LinearAssignment(d_2)
-        sol = lin.solution
-        short_vecs = vecs[np.arange(len(sol)), sol]
-        translation = np.mean(short_vecs, axis=0)
-        f_translation = avg_lattice.get_fractional_coords(translation)
-        new_d2 = np.sum((short_vecs - translation) ** 2, axis=-1)
+        vecs, d_2 = pbc_shortest_vectors(
+            avg_lattice,
+            np.ascontiguousarray(s2s.reshape(-1, 3), dtype=np.float64),
+            s1,
+            mask if n_trans == 1 else np.tile(mask, (n_trans, 1)),
+            return_d2=True,
+            lll_frac_tol=lll_frac_tol,
+        )
+        vecs = vecs.reshape(n_trans, n_s2, len(s1), 3)
+        _, solutions = linear_assignment_batch(d_2.reshape(n_trans, n_s2, len(s1)))
+        short_vecs = vecs[np.arange(n_trans)[:, None], np.arange(n_s2), solutions]
+        translations = np.mean(short_vecs, axis=1)
+        f_translations = avg_lattice.get_fractional_coords(translations)
+        new_d2 = np.sum((short_vecs - translations[:, None]) ** 2, axis=-1)
 
-        return new_d2**0.5 * normalization, f_translation, sol
+        return new_d2**0.5 * normalization, f_translations, solutions
+
+    @staticmethod
+    def _batch_translations(translations, n_pairs, break_on_match, max_size=2**20):
+        """Split an iterable of translations into arrays of at most max_size site
+        pairs. Translations are only consumed as batches are requested, and the
+        first batches are smaller if the search may stop at the first match.
+        """
+        max_batch = max(max_size // max(n_pairs, 1), 1)
+        batch = 1 if break_on_match else max_batch
+        translations = iter(translations)
+        while batch_translations := list(itertools.islice(translations, batch)):
+            yield np.array(batch_translations)
+            batch = min(2 * batch, max_batch)
+
+    def _iter_translations(self, s1fc, s2fc, s1_t_inds, s2_t_ind, frac_tol, mask):
+        """Translations of s2fc for which all its sites are within frac_tol of s1fc."""
+        for s1i in s1_t_inds:
+            t = s1fc[s1i] - s2fc[s2_t_ind]
+            if self._cmp_fstruct(s1fc, s2fc + t, frac_tol, mask):
+                yield t
 
     def _get_mask(self, struct1, struct2, fu, s1_supercell):
         """Get mask for matching struct2 to struct1. If struct1 has sites
@@ -686,8 +837,8 @@ class StructureMatcher(MSONable):
             struct1 = struct1.copy()
             struct2 = struct2.copy()
         else:
-            struct1 = self._get_reduced_structure(struct1, self._primitive_cell, niggli)
-            struct2 = self._get_reduced_structure(struct2, self._primitive_cell, niggli)
+            struct1 = self._get_cached_reduced_structure(struct1, niggli)
+            struct2 = self._get_cached_reduced_structure(struct2, niggli)
 
         if self._supercell:
             fu, s1_supercell = self._get_supercell_size(struct1, struct2)
@@ -742,6 +893,7 @@ class StructureMatcher(MSONable):
         s1_supercell: bool = True,
         use_rms: bool = False,
         break_on_match: bool = False,
+        supercells: Iterable | None = None,
     ) -> tuple[float, float, np.ndarray, float, Mapping] | None:
         """
         Matches struct2 onto struct1 (which should contain all sites in
@@ -754,6 +906,9 @@ class StructureMatcher(MSONable):
             s1_supercell (bool): whether to create the supercell of struct1 (vs struct2)
             use_rms (bool): whether to minimize the rms of the matching
             break_on_match (bool): whether to stop search at first match
+            supercells (Iterable): output of _get_supercells for struct1 and
+                struct2, e.g. shared by structures with the same sites but
+                different species. Computed if None.
 
         Returns:
             tuple[float, float, np.ndarray, float, Mapping]: (rms, max_dist, mask, cost, mapping)
@@ -776,19 +931,23 @@ class StructureMatcher(MSONable):
 
         best_match = None
         # loop over all lattices
-        for s1fc, s2fc, avg_l, sc_m in self._get_supercells(struct1, struct2, fu, s1_supercell):
+        if supercells is None:
+            supercells = self._get_supercells(struct1, struct2, fu, s1_supercell)
+        for s1fc, s2fc, avg_l, sc_m in supercells:
             # compute fractional tolerance
             normalization = (len(s1fc) / avg_l.volume) ** (1 / 3)
             inv_abc = np.array(avg_l.reciprocal_lattice.abc)
             frac_tol = inv_abc * self.stol / (np.pi * normalization)
-            # loop over all translations
-            for s1i in s1_t_inds:
-                t = s1fc[s1i] - s2fc[s2_t_ind]
-                t_s2fc = s2fc + t
-                if self._cmp_fstruct(s1fc, t_s2fc, frac_tol, mask):
+            translations = self._iter_translations(s1fc, s2fc, s1_t_inds, s2_t_ind, frac_tol, mask)
+            lll_frac_tol = None
+            for ts in self._batch_translations(translations, len(s1fc) * len(s2fc), break_on_match):
+                if lll_frac_tol is None:
                     inv_lll_abc = np.array(avg_l.get_lll_reduced_lattice().reciprocal_lattice.abc)
                     lll_frac_tol = inv_lll_abc * self.stol / (np.pi * normalization)
-                    dist, t_adj, mapping = self._cart_dists(s1fc, t_s2fc, avg_l, mask, normalization, lll_frac_tol)
+                dists, t_adjs, mappings = self._cart_dists_batch(
+                    s1fc, s2fc + ts[:, None], avg_l, mask, normalization, lll_frac_tol
+                )
+                for t, dist, t_adj, mapping in zip(ts, dists, t_adjs, mappings, strict=True):
                     val = np.linalg.norm(dist) / len(dist) ** 0.5 if use_rms else max(dist)
 
                     if best_match is None or val < best_match[0]:
@@ -803,14 +962,23 @@ class StructureMatcher(MSONable):
 
         return None
 
-    def group_structures(self, s_list, anonymous=False):
+    def group_structures(self, s_list, anonymous=False, n_workers: int = 1):
         """
         Given a list of structures, use fit to group
         them by structural equality.
 
+        Structures are first split into buckets that cannot match each other:
+        by composition hash, by number of sites in the reduced cell (unless
+        attempt_supercell) and, if structures are not scaled, by ranges of
+        volume compatible with ltol and angle_tol. Buckets are then grouped
+        independently, in parallel if n_workers > 1. The result is the same as
+        comparing all structures with the same composition hash.
+
         Args:
             s_list ([Structure]): List of structures to be grouped
             anonymous (bool): Whether to use anonymous mode.
+            n_workers (int): Number of processes used to group the buckets.
+                Defaults to 1.
 
         Returns:
             A list of lists of matched structures
@@ -821,9 +989,8 @@ class StructureMatcher(MSONable):
             raise ValueError("allow_subset cannot be used with group_structures")
 
         original_s_list = list(s_list)
-        s_list = self._process_species(s_list)
         # Prepare reduced structures beforehand
-        s_list = [self._get_reduced_structure(s, self._primitive_cell, niggli=True) for s in s_list]
+        s_list = self.prepare_structures(s_list)
 
         # Use structure hash to pre-group structures
         if anonymous:
@@ -837,31 +1004,89 @@ class StructureMatcher(MSONable):
         def s_hash(s):
             return c_hash(s[1].composition)
 
-        sorted_s_list = sorted(enumerate(s_list), key=s_hash)
-        all_groups = []
-
-        # For each pre-grouped list of structures, perform actual matching.
-        for _, g in itertools.groupby(sorted_s_list, key=s_hash):
-            unmatched = list(g)
-            while len(unmatched) > 0:
-                i, refs = unmatched.pop(0)
-                matches = [i]
-                if anonymous:
-                    inds = filter(
-                        lambda i: self.fit_anonymous(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                else:
-                    inds = filter(
-                        lambda i: self.fit(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                inds = list(inds)
-                matches.extend([unmatched[i][0] for i in inds])
-                unmatched = [unmatched[i] for i in range(len(unmatched)) if i not in inds]
-                all_groups.append([original_s_list[i] for i in matches])
-
-        return all_groups
+        buckets = self._get_group_buckets(sorted(enumerate(s_list), key=s_hash), key=s_hash)
+        if n_workers == 1:
+            bucket_groups = [self._group_bucket(bucket, anonymous) for bucket in buckets]
+        else:
+            # Largest buckets first for a better load balance
+            buckets.sort(key=len, reverse=True)
+            bucket_groups = Parallel(n_jobs=n_workers)(
+                delayed(self._group_bucket)(bucket, anonymous) for bucket in buckets
+            )
+
+        # Order the groups as if all structures with the same hash had been grouped
+        # together: by hash, then by index of the first structure of each group
+        all_groups = sorted(
+            (group for groups in bucket_groups for group in groups),
+            key=lambda group: (s_hash((group[0], s_list[group[0]])), group[0]),
+        )
+        return [[original_s_list[i] for i in group] for group in all_groups]
+
+    def _get_group_buckets(self, sorted_s_list, key):
+        """Split (index, structure) pairs sorted by key into buckets of structures
+        that can only match structures of the same bucket.
+        """
+
+        def n_sites(s):
+            return len(s[1])
+
+        buckets = []
+        for _, hash_group in itertools.groupby(sorted_s_list, key=key):
+            if self._supercell:
+                buckets.append(list(hash_group))
+                continue
+
+            # Without supercells, matching structures have the same number of sites
+            for _, size_group in itertools.groupby(sorted(hash_group, key=n_sites), key=n_sites):
+                size_group = list(size_group)
+                if self._scale:
+                    buckets.append(size_group)
+                    continue
+
+                # Without scaling, the volume of a structure must be in the range of
+                # volumes of lattices matching the other one. Structures with
+                # overlapping ranges are put in the same bucket.
+                ranges = []
+                for idx, struct in size_group:
+                    v_min, v_max = _get_matching_volume_range(struct.lattice, self.ltol, self.angle_tol)
+                    ranges.append((min(v_min, struct.volume), max(v_max, struct.volume), idx, struct))
+                ranges.sort(key=lambda x: x[:3])
+                bucket, bucket_max = [], -np.inf
+                for v_min, v_max, idx, struct in ranges:
+                    if bucket and v_min > bucket_max:
+                        buckets.append(sorted(bucket, key=lambda s: s[0]))
+                        bucket = []
+                    bucket.append((idx, struct))
+                    bucket_max = max(bucket_max, v_max)
+                buckets.append(sorted(bucket, key=lambda s: s[0]))
+        return buckets
+
+    def _group_bucket(self, unmatched, anonymous):
+        """Group (index, reduced structure) pairs by structural equality.
+
+        Returns:
+            list[list[int]]: Indices of the structures in each group.
+        """
+        unmatched = list(unmatched)
+        groups = []
+        while len(unmatched) > 0:
+            i, refs = unmatched.pop(0)
+            matches = [i]
+            if anonymous:
+                inds = filter(
+                    lambda i: self.fit_anonymous(refs, unmatched[i][1], skip_structure_reduction=True),
+                    list(range(len(unmatched))),
+                )
+            else:
+                inds = filter(
+                    lambda i: self.fit(refs, unmatched[i][1], skip_structure_reduction=True),
+                    list(range(len(unmatched))),
+                )
+            inds = list(inds)
+            matches.extend([unmatched[i][0] for i in inds])
+            unmatched = [unmatched[i] for i in range(len(unmatched)) if i not in inds]
+            groups.append(matches)
+        return groups
 
     def as_dict(self):
         """MSONable dict."""
@@ -879,6 +1104,7 @@ class StructureMatcher(MSONable):
             "allow_subset": self._subset,
             "supercell_size": self._supercell_size,
             "ignored_species": self._ignored_species,
+            "cache_size": self._cache_size,
         }
 
     @classmethod
@@ -901,6 +1127,7 @@ class StructureMatcher(MSONable):
             comparator=AbstractComparator.from_dict(dct["comparator"]),
             supercell_size=dct["supercell_size"],
             ignored_species=dct["ignored_species"],
+            cache_size=dct.get("cache_size", 0),
         )
 
     def _anonymous_match(
@@ -912,9 +1139,11 @@ class StructureMatcher(MSONable):
         use_rms=False,
         break_on_match=False,
         single_match=False,
+        prototype_search=False,
     ):
         """
-        Tries all permutations of matching struct1 to struct2.
+        Tries all permutations of matching struct1 to struct2. Permutations
+        mapping species with different atomic fractions are skipped.
 
         Args:
             struct1 (Structure): First structure
@@ -924,6 +1153,9 @@ class StructureMatcher(MSONable):
             use_rms (bool): Whether to minimize the rms of the matching
             break_on_match (bool): Whether to break search on first match
             single_match (bool): Whether to return only the best match
+            prototype_search (bool): Whether to also skip permutations mapping
+                species with different nearest-neighbor distances, see
+                fit_anonymous.
 
         Returns:
             List of (mapping, match)
@@ -942,9 +1174,33 @@ class StructureMatcher(MSONable):
 
         s1_comp = struct1.composition
         s2_comp = struct2.composition
+        # compatible[i, j] is False if sp1[i] cannot be mapped to sp2[j]
+        compatible = np.ones((len(sp1), len(sp2)), dtype=bool)
+        if not self._subset:
+            frac1 = np.array([s1_comp.get_atomic_fraction(sp) for sp in sp1])
+            frac2 = np.array([s2_comp.get_atomic_fraction(sp) for sp in sp2])
+            compatible &= np.abs(frac1[:, None] - frac2[None, :]) < 1e-3
+            if prototype_search:
+                # Heuristic: mapped species have similar nearest-neighbor distances
+                ranges1 = _get_nn_distance_ranges(struct1)
+                ranges2 = _get_nn_distance_ranges(struct2)
+                for i, j in np.argwhere(compatible):
+                    range1, range2 = ranges1[sp1[i]], ranges2[sp2[j]]
+                    # Ranges of species without neighbors are not compared
+                    if np.isfinite([*range1, *range2]).all() and np.any(
+                        np.abs(np.subtract(range1, range2)) > self.stol
+                    ):
+                        compatible[i, j] = False
+
+        # The lattices and coordinates of the supercells do not depend on the species
+        if swapped:
+            supercells = _LazySequence(self._get_supercells(struct2, struct1, fu, not s1_supercell))
+        else:
+            supercells = _LazySequence(self._get_supercells(struct1, struct2, fu, s1_supercell))
+
         matches = []
-        for perm in itertools.permutations(sp2):
-            sp_mapping = dict(zip(sp1, perm, strict=True))
+        for perm in _iter_bijections(compatible):
+            sp_mapping = dict(zip(sp1, (sp2[j] for j in perm), strict=True))
 
             # do quick check that compositions are compatible
             mapped_comp = Composition({sp_mapping[k]: v for k, v in s1_comp.items()})
@@ -961,9 +1217,12 @@ class StructureMatcher(MSONable):
                     (not s1_supercell),
                     use_rms,
                     break_on_match,
+                    supercells,
                 )
             else:
-                match = self._strict_match(mapped_struct, struct2, fu, s1_supercell, use_rms, break_on_match)
+                match = self._strict_match(
+                    mapped_struct, struct2, fu, s1_supercell, use_rms, break_on_match, supercells
+                )
             if match:
                 matches.append((sp_mapping, match))
                 if single_match:
@@ -992,6 +1251,48 @@ class StructureMatcher(MSONable):
             cls._get_reduced_istructure(SiteOrderedIStructure.from_sites(struct), primitive_cell, niggli)
         )
 
+    def _get_cached_reduced_structure(self, struct: Structure, niggli: bool = True) -> Structure:
+        """Reduced structure, from the cache of this matcher if cache_size > 0."""
+        if self._cache_size <= 0:
+            return self._get_reduced_structure(struct, self._primitive_cell, niggli)
+
+        # Reduced structures keep site properties and labels, so these are part of the key
+        try:
+            site_properties = json.dumps(struct.site_properties, cls=MontyEncoder, sort_keys=True)
+        except TypeError:
+            return self._get_reduced_structure(struct, self._primitive_cell, niggli)
+        species_table, species_indices = struct._get_species_table()
+        key = (
+            niggli,
+            struct.lattice.matrix.tobytes(),
+            struct.lattice.pbc,
+            tuple(species_table),
+            species_indices.tobytes(),
+            struct.frac_coords.tobytes(),
+            tuple(struct.labels),
+            site_properties,
+        )
+        if key in self._reduced_cache:
+            self._reduced_cache.move_to_end(key)
+        else:
+            self._reduced_cache[key] = self._get_reduced_structure(struct, self._primitive_cell, niggli)
+            if len(self._reduced_cache) > self._cache_size:
+                self._reduced_cache.popitem(last=False)
+        return self._reduced_cache[key].copy()
+
+    def prepare_structures(self, structures: Sequence[Structure | IStructure]) -> list[Structure]:
+        """Process species and reduce structures once, e.g. to compare them many
+        times. The prepared structures can be passed to fit and fit_anonymous
+        with skip_structure_reduction=True.
+
+        Args:
+            structures (list[Structure | IStructure]): Structures to prepare.
+
+        Returns:
+            list[Structure]: Reduced structures.
+        """
+        return [self._get_cached_reduced_structure(struct) for struct in self._process_species(structures)]
+
     def get_rms_anonymous(self, struct1, struct2):
         """
         Performs an anonymous fitting, which allows distinct species in one
@@ -1051,7 +1352,7 @@ class StructureMatcher(MSONable):
 
         return None
 
-    def get_all_anonymous_mappings(self, struct1, struct2, niggli=True, include_dist=False):
+    def get_all_anonymous_mappings(self, struct1, struct2, niggli=True, include_dist=False, prototype_search=False):
         """
         Performs an anonymous fitting, which allows distinct species in one
         structure to map to another. Returns a dictionary of species
@@ -1062,6 +1363,8 @@ class StructureMatcher(MSONable):
             struct2 (Structure): 2nd structure
             niggli (bool): Find niggli cell in preprocessing
             include_dist (bool): Return the maximin distance with each mapping
+            prototype_search (bool): Skip species mappings between species with
+                incompatible nearest-neighbor distances, see fit_anonymous.
 
         Returns:
             list of species mappings that map struct1 to struct2.
@@ -1069,7 +1372,9 @@ class StructureMatcher(MSONable):
         struct1, struct2 = self._process_species([struct1, struct2])
         struct1, struct2, fu, s1_supercell = self._preprocess(struct1, struct2, niggli)
 
-        if matches := self._anonymous_match(struct1, struct2, fu, s1_supercell, break_on_match=not include_dist):
+        if matches := self._anonymous_match(
+            struct1, struct2, fu, s1_supercell, break_on_match=not include_dist, prototype_search=prototype_search
+        ):
             if include_dist:
                 return [(m[0], m[1][0]) for m in matches]
 
@@ -1083,17 +1388,28 @@ class StructureMatcher(MSONable):
         struct2: Structure | IStructure,
         niggli: bool = True,
         skip_structure_reduction: bool = False,
+        prototype_search: bool = False,
     ) -> bool:
         """
         Performs an anonymous fitting, which allows distinct species in one structure to map
         to another. e.g. to compare if the Li2O and Na2O structures are similar.
 
+        Only species mappings between species with the same atomic fraction are
+        tried. With prototype_search, mappings between species whose ranges of
+        nearest-neighbor distances, in units of the average free length per atom,
+        differ by more than stol are also skipped before any lattice or site
+        matching. This keeps comparisons of prototypes with many components
+        tractable, but as a heuristic it may miss matches of strongly distorted
+        structures.
+
         Args:
             struct1 (Structure): 1st structure
             struct2 (Structure): 2nd structure
             niggli (bool): If true, perform Niggli reduction for struct1 and struct2
             skip_structure_reduction (bool): Defaults to False
                 If True, skip to get a primitive structure and perform Niggli reduction for struct1 and struct2
+            prototype_search (bool): Defaults to False
+                If True, also prune species mappings by nearest-neighbor distances
 
         Returns:
             bool: True if a species mapping can map struct1 to struct2
@@ -1101,7 +1417,15 @@ class StructureMatcher(MSONable):
         struct1, struct2 = self._process_species([struct1, struct2])
         struct1, struct2, fu, s1_supercell = self._preprocess(struct1, struct2, niggli, skip_structure_reduction)
 
-        matches = self._anonymous_match(struct1, struct2, fu, s1_supercell, break_on_match=True, single_match=True)
+        matches = self._anonymous_match(
+            struct1,
+            struct2,
+            fu,
+            s1_supercell,
+            break_on_match=True,
+            single_match=True,
+            prototype_search=prototype_search,
+        )
 
         return bool(matches)
 
@@ -1241,3 +1565,236 @@ class StructureMatcher(MSONable):
             return None
 
         return match[4]
+
+
+class _VolumeBucket:
+    """Indices of structures sharing the same invariants in a StructureIndex, with
+    their ranges of compatible volumes kept in arrays sorted by the lower bound.
+    """
+
+    def __init__(self) -> None:
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.v_mins = np.zeros(0)
+        self.v_maxs = np.zeros(0)
+        self.max_width = 0.0
+
+    def add(self, idx: int, v_min: float, v_max: float) -> None:
+        pos = np.searchsorted(self.v_mins, v_min, side="right")
+        self.indices = np.insert(self.indices, pos, idx)
+        self.v_mins = np.insert(self.v_mins, pos, v_min)
+        self.v_maxs = np.insert(self.v_maxs, pos, v_max)
+        self.max_width = max(self.max_width, v_max - v_min)
+
+    def get_overlapping(self, v_min: float, v_max: float) -> list[int]:
+        """Indices, in insertion order, of the structures whose volume range overlaps
+        [v_min, v_max]. Their lower bounds are at least v_min - max_width, so only
+        that slice of the sorted ranges is checked.
+        """
+        start = np.searchsorted(self.v_mins, v_min - self.max_width, side="left")
+        end = np.searchsorted(self.v_mins, v_max, side="right")
+        overlap = self.v_maxs[start:end] >= v_min
+        return np.sort(self.indices[start:end][overlap]).tolist()
+
+
+class StructureIndex(MSONable):
+    """Index of structures for fast lookup of matching structures with
+    StructureMatcher semantics, e.g. to deduplicate a database of structures.
+
+    Structures are stored as reduced structures together with invariants that
+    matching structures must share: the comparator hash of the composition,
+    the number of sites in the reduced cell (unless supercells are attempted)
+    and, if structures are not scaled, a range of compatible volumes. A query
+    only fits the stored structures sharing these invariants, so the result is
+    the same as fitting the query against all stored structures.
+
+    Usage:
+        index = StructureIndex(StructureMatcher())
+        index.add_structures(known_structures)
+        if index.find(new_structure) is None:
+            index.add(new_structure)
+        index.save("index.json.gz")
+    """
+
+    def __init__(self, matcher: StructureMatcher | None = None, anonymous: bool = False) -> None:
+        """
+        Args:
+            matcher (StructureMatcher): Matcher used to compare structures.
+                Defaults to StructureMatcher().
+            anonymous (bool): Whether to match structures anonymously, i.e.
+                with fit_anonymous. Defaults to False.
+        """
+        self.matcher = matcher or StructureMatcher()
+        if self.matcher._subset:
+            raise ValueError("allow_subset cannot be used with StructureIndex")
+        self.anonymous = anonymous
+        self._structures: list[Structure] = []
+        self._buckets: dict[tuple, _VolumeBucket] = {}
+
+    def __len__(self) -> int:
+        return len(self._structures)
+
+    def __contains__(self, structure: Structure | IStructure) -> bool:
+        return self.find(structure) is not None
+
+    def _reduce(self, structure: Structure | IStructure) -> Structure:
+        """Reduced structure as used by StructureMatcher.group_structures."""
+        return self.matcher.prepare_structures([structure])[0]
+
+    def _get_key(self, reduced: Structure) -> tuple:
+        """Invariants that matching reduced structures have in common."""
+        if self.anonymous:
+            key: tuple = (reduced.composition.anonymized_formula,)
+        else:
+            key = (self.matcher._comparator.get_hash(reduced.composition),)
+        if not self.matcher._supercell:
+            key += (len(reduced),)
+        return key
+
+    def _get_volume_range(self, reduced: Structure) -> tuple[float, float]:
+        """Range of volumes of structures that can match reduced."""
+        if self.matcher._scale:
+            return -np.inf, np.inf
+        v_min, v_max = _get_matching_volume_range(reduced.lattice, self.matcher.ltol, self.matcher.angle_tol)
+        return min(v_min, reduced.volume), max(v_max, reduced.volume)
+
+    def add(self, structure: Structure | IStructure) -> int:
+        """Add a structure to the index.
+
+        Args:
+            structure (Structure | IStructure): Structure to add.
+
+        Returns:
+            int: Index of the structure in the index.
+        """
+        return self._add_reduced(self._reduce(structure))
+
+    def add_structures(self, structures: Sequence[Structure | IStructure]) -> list[int]:
+        """Add structures to the index.
+
+        Args:
+            structures (list[Structure | IStructure]): Structures to add.
+
+        Returns:
+            list[int]: Indices of the structures in the index.
+        """
+        return [self.add(structure) for structure in structures]
+
+    def _add_reduced(self, reduced: Structure) -> int:
+        idx = len(self._structures)
+        self._structures.append(reduced)
+        self._buckets.setdefault(self._get_key(reduced), _VolumeBucket()).add(idx, *self._get_volume_range(reduced))
+        return idx
+
+    def get_structure(self, idx: int) -> Structure:
+        """Reduced structure stored at index idx."""
+        return self._structures[idx].copy()
+
+    def _get_candidates(self, reduced: Structure) -> list[int]:
+        bucket = self._buckets.get(self._get_key(reduced))
+        if bucket is None:
+            return []
+        if self.matcher._scale:
+            return bucket.indices.tolist()
+        return bucket.get_overlapping(*self._get_volume_range(reduced))
+
+    def get_candidates(self, structure: Structure | IStructure) -> list[int]:
+        """Indices of the stored structures that share the invariants of
+        structure, i.e. that may match it.
+
+        Args:
+            structure (Structure | IStructure): Structure to look up.
+
+        Returns:
+            list[int]: Indices of candidate structures in insertion order.
+        """
+        return self._get_candidates(self._reduce(structure))
+
+    def _fit(self, stored: Structure, reduced: Structure) -> bool:
+        if self.anonymous:
+            return self.matcher.fit_anonymous(stored, reduced, skip_structure_reduction=True)
+        return self.matcher.fit(stored, reduced, skip_structure_reduction=True)
+
+    def _iter_matches(
+        self, structure: Structure | IStructure, prefilter: Callable[[int], bool] | None
+    ) -> Iterator[int]:
+        reduced = self._reduce(structure)
+        for idx in self._get_candidates(reduced):
+            if (prefilter is None or prefilter(idx)) and self._fit(self._structures[idx], reduced):
+                yield idx
+
+    def get_matches(
+        self, structure: Structure | IStructure, prefilter: Callable[[int], bool] | None = None
+    ) -> list[int]:
+        """Indices of all stored structures matching structure.
+
+        Args:
+            structure (Structure | IStructure): Structure to look up.
+            prefilter (Callable[[int], bool]): Optional function of the index of a
+                candidate structure, called before fitting it. Candidates for which
+                it returns False are skipped. Defaults to None.
+
+        Returns:
+            list[int]: Indices of matching structures in insertion order.
+        """
+        return list(self._iter_matches(structure, prefilter))
+
+    def find(self, structure: Structure | IStructure, prefilter: Callable[[int], bool] | None = None) -> int | None:
+        """Index of the first stored structure matching structure.
+
+        Args:
+            structure (Structure | IStructure): Structure to look up.
+            prefilter (Callable[[int], bool]): Optional function of the index of a
+                candidate structure, called before fitting it. Candidates for which
+                it returns False are skipped. Defaults to None.
+
+        Returns:
+            int | None: Index of the first matching structure, None if no
+                stored structure matches.
+        """
+        return next(self._iter_matches(structure, prefilter), None)
+
+    def as_dict(self) -> dict:
+        """MSONable dict."""
+        return {
+            "@module": type(self).__module__,
+            "@class": type(self).__name__,
+            "matcher": self.matcher.as_dict(),
+            "anonymous": self.anonymous,
+            "structures": [struct.as_dict() for struct in self._structures],
+        }
+
+    @classmethod
+    def from_dict(cls, dct: dict) -> Self:
+        """
+        Args:
+            dct (dict): Dict representation.
+
+        Returns:
+            StructureIndex
+        """
+        index = cls(StructureMatcher.from_dict(dct["matcher"]), anonymous=dct["anonymous"])
+        # Stored structures are already reduced
+        for struct_dict in dct["structures"]:
+            index._add_reduced(Structure.from_dict(struct_dict))
+        return index
+
+    def save(self, filename: PathLike) -> None:
+        """Save the index to a file. Compressed formats such as .json.gz
+        are supported.
+
+        Args:
+            filename (PathLike): Name of the file.
+        """
+        dumpfn(self.as_dict(), filename)
+
+    @classmethod
+    def load(cls, filename: PathLike) -> Self:
+        """Load an index saved with StructureIndex.save.
+
+        Args:
+            filename (PathLike): Name of the file.
+
+        Returns:
+            StructureIndex
+        """
+        return cls.from_dict(loadfn(filename, cls=None))
@@ -14,7 +14,16 @@ from pymatgen.core.lattice import Lattice
 from pymatgen.core.operations import SymmOp
 from pymatgen.core.periodic_table import DummySpecie, DummySpecies, Element, Species, get_el_sp
 from pymatgen.core.sites import PeriodicSite, Site
-from pymatgen.core.structure import IMolecule, IStructure, Molecule, PeriodicNeighbor, SiteCollection, Structure
+from pymatgen.core.structure import (
+    IMolecule,
+    IStructure,
+    Molecule,
+    NeighborList,
+    PeriodicNeighbor,
+    SiteCollection,
+    Structure,
+)
+from pymatgen.core.structure_array import StructureArray
 from pymatgen.core.units import ArrayWithUnit, FloatWithUnit, Unit
 
 if TYPE_CHECKING:
@@ -11,7 +11,7 @@ import re
 import string
 import warnings
 from collections import defaultdict
-from functools import total_ordering
+from functools import cached_property, lru_cache, total_ordering
 from itertools import combinations_with_replacement, product
 from typing import TYPE_CHECKING, cast
 
@@ -34,6 +34,8 @@ if TYPE_CHECKING:
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+_EL_SP_TYPES = (Element, Species, DummySpecies)
+
 
 @total_ordering
 class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, Stringify):
@@ -138,6 +140,15 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
     # Prior probability of oxidation used by oxi_state_guesses
     oxi_prob: ClassVar[dict | None] = None
 
+    # Lazily computed values that are only valid within the current process
+    # (Species hashes depend on the string hash seed), dropped when pickling
+    _cached_attrs: ClassVar[tuple[str, ...]] = (
+        "_hash",
+        "_reduced_composition_and_factor",
+        "_reduced_formula_and_factor",
+        "fractional_composition",
+    )
+
     def __init__(self, *args, strict: bool = False, **kwargs) -> None:
         """Very flexible Composition construction, similar to the built-in Python
         dict(). Also extended to allow simple string init.
@@ -166,25 +177,51 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         self.allow_negative = kwargs.pop("allow_negative", False)
         # it's much faster to recognize a composition and use the el_map than
         # to pass the composition to {}
-        if len(args) == 1 and isinstance(args[0], type(self)):
-            elem_map = args[0]
-        elif len(args) == 1 and isinstance(args[0], str):
-            elem_map = self._parse_formula(args[0])  # type: ignore[assignment]
-        elif len(args) == 1 and isinstance(args[0], float) and math.isnan(args[0]):
-            raise ValueError("float('NaN') is not a valid Composition, did you mean 'NaN'?")
+        if (
+            len(args) == 1
+            and not kwargs
+            and isinstance(args[0], Composition)
+            and type(args[0]).amount_tolerance == type(self).amount_tolerance
+            and (self.allow_negative or not args[0].allow_negative)
+        ):
+            # The amounts of an existing Composition have already been validated
+            self._data: dict[Element | Species | DummySpecies, float] = dict(args[0]._data)
+            self._n_atoms: int | float = args[0]._n_atoms
         else:
-            elem_map = dict(*args, **kwargs)  # type: ignore[assignment]
+            if len(args) == 1 and isinstance(args[0], str):
+                elem_map = self._parse_formula(args[0])
+            elif len(args) == 1 and isinstance(args[0], float) and math.isnan(args[0]):
+                raise ValueError("float('NaN') is not a valid Composition, did you mean 'NaN'?")
+            elif len(args) == 1 and not kwargs and isinstance(args[0], dict | Composition):
+                elem_map = args[0]
+            else:
+                elem_map = dict(*args, **kwargs)
+            self._data, self._n_atoms = self._get_elem_amt(elem_map)
+        if strict and not self.valid:
+            raise ValueError(f"Composition is not valid, contains: {', '.join(map(str, self.elements))}")
+
+    def _get_elem_amt(self, elem_map: Mapping) -> tuple[dict[Element | Species | DummySpecies, float], float]:
+        """Validate an {species: amount} mapping, dropping amounts below
+        amount_tolerance. Keys that are already Element, Species or DummySpecies
+        are used as is without going through get_el_sp.
+
+        Returns:
+            tuple[dict, float]: The {Element/Species: amount} dict and the total
+                number of atoms.
+        """
+        tol = type(self).amount_tolerance
         elem_amt = {}
-        self._n_atoms: int | float = 0
+        n_atoms: int | float = 0
         for key, val in elem_map.items():
-            if val < -type(self).amount_tolerance and not self.allow_negative:
+            if val < -tol and not self.allow_negative:
                 raise ValueError("Amounts in Composition cannot be negative!")
-            if abs(val) >= type(self).amount_tolerance:
-                elem_amt[get_el_sp(key)] = val
-                self._n_atoms += abs(val)
-        self._data = elem_amt
-        if strict and not self.valid:
-            raise ValueError(f"Composition is not valid, contains: {', '.join(map(str, self.elements))}")
+            if abs(val) >= tol:
+                elem_amt[key if type(key) in _EL_SP_TYPES else get_el_sp(key)] = val
+                n_atoms += abs(val)
+        return elem_amt, n_atoms
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {key: val for key, val in self.__dict__.items() if key not in self._cached_attrs}
 
     def __getitem__(self, key: SpeciesLike) -> int | float:
         try:
@@ -305,6 +342,10 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
 
     def __hash__(self) -> int:
         """Hash based on the chemical system."""
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
         return hash(frozenset(self._data))
 
     def __repr__(self) -> str:
@@ -400,7 +441,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         """The composition replacing any species by the corresponding element."""
         return type(self)(self.get_el_amt_dict(), allow_negative=self.allow_negative)
 
-    @property
+    @cached_property
     def fractional_composition(self) -> Self:
         """The normalized composition in which the amounts of each species sum to
         1.
@@ -422,6 +463,10 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             tuple[Composition, float]: Normalized Composition and multiplicative factor,
             i.e. "Li4Fe4P4O16" returns (Composition("LiFePO4"), 4).
         """
+        return self._reduced_composition_and_factor
+
+    @cached_property
+    def _reduced_composition_and_factor(self) -> tuple[Self, float]:
         factor: float = self.get_reduced_formula_and_factor()[1]
         return self / factor, factor
 
@@ -442,6 +487,15 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             tuple[str, float]: Normalized formula and multiplicative factor,
                 i.e., "Li4Fe4P4O16" returns (LiFePO4, 4).
         """
+        if not iupac_ordering:
+            return self._reduced_formula_and_factor
+        return self._get_reduced_formula_and_factor(iupac_ordering=True)
+
+    @cached_property
+    def _reduced_formula_and_factor(self) -> tuple[str, float]:
+        return self._get_reduced_formula_and_factor(iupac_ordering=False)
+
+    def _get_reduced_formula_and_factor(self, iupac_ordering: bool) -> tuple[str, float]:
         all_int: bool = all(abs(val - round(val)) < type(self).amount_tolerance for val in self.values())
         if not all_int:
             return self.formula.replace(" ", ""), 1
@@ -611,43 +665,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
             In the case of Metallofullerene formula (e.g. Y3N@C80),
             the @ mark will be dropped and passed to parser.
         """
-        # Raise error if formula contains special characters or only spaces and/or numbers
-        if strict and re.match(r"[\s\d.*/]*$", formula):
-            raise ValueError(f"Invalid {formula=}")
-
-        # For Metallofullerene like "Y3N@C80"
-        formula = formula.replace("@", "")
-        # Square brackets are used in formulas to denote coordination complexes (gh-3583)
-        formula = formula.replace("[", "(")
-        formula = formula.replace("]", ")")
-        # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
-        formula = formula.replace("{", "(")
-        formula = formula.replace("}", ")")
-
-        def get_sym_dict(form: str, factor: float) -> dict[str, float]:
-            sym_dict: dict[str, float] = defaultdict(float)
-            for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
-                el = match[1]
-                amt = 1.0
-                if match[2].strip() != "":
-                    amt = float(match[2])
-                sym_dict[el] += amt * factor
-                form = form.replace(match.group(), "", 1)
-            if form.strip():
-                raise ValueError(f"{form} is an invalid formula!")
-            return sym_dict
-
-        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        while match:
-            factor = 1.0
-            if match[2] != "":
-                factor = float(match[2])
-            unit_sym_dict = get_sym_dict(match[1], factor)
-            expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
-            expanded_formula = formula.replace(match.group(), expanded_sym, 1)
-            formula = expanded_formula
-            match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        return get_sym_dict(formula, 1)
+        return dict(_parse_formula_items(formula, strict))
 
     @property
     def anonymized_formula(self) -> str:
@@ -1342,6 +1360,51 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
                         yield match
 
 
+@lru_cache(maxsize=4096)
+def _parse_formula_items(formula: str, strict: bool = True) -> tuple[tuple[str, float], ...]:
+    """Parse a formula string into (symbol, amount) pairs. Memoized since the same
+    formulas are parsed over and over again, e.g. when reading entries. Use
+    Composition._parse_formula to get a (mutable) dict.
+    """
+    # Raise error if formula contains special characters or only spaces and/or numbers
+    if strict and re.match(r"[\s\d.*/]*$", formula):
+        raise ValueError(f"Invalid {formula=}")
+
+    # For Metallofullerene like "Y3N@C80"
+    formula = formula.replace("@", "")
+    # Square brackets are used in formulas to denote coordination complexes (gh-3583)
+    formula = formula.replace("[", "(")
+    formula = formula.replace("]", ")")
+    # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
+    formula = formula.replace("{", "(")
+    formula = formula.replace("}", ")")
+
+    def get_sym_dict(form: str, factor: float) -> dict[str, float]:
+        sym_dict: dict[str, float] = defaultdict(float)
+        for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
+            el = match[1]
+            amt = 1.0
+            if match[2].strip() != "":
+                amt = float(match[2])
+            sym_dict[el] += amt * factor
+            form = form.replace(match.group(), "", 1)
+        if form.strip():
+            raise ValueError(f"{form} is an invalid formula!")
+        return sym_dict
+
+    match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    while match:
+        factor = 1.0
+        if match[2] != "":
+            factor = float(match[2])
+        unit_sym_dict = get_sym_dict(match[1], factor)
+        expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
+        expanded_formula = formula.replace(match.group(), expanded_sym, 1)
+        formula = expanded_formula
+        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    return tuple(get_sym_dict(formula, 1).items())
+
+
 def reduce_formula(
     sym_amt: Mapping[str, float],
     iupac_ordering: bool = False,
@@ -957,6 +957,28 @@ class Lattice(MSONable):
 
             None is returned if no matches are found.
         """
+        for aligned_ms, scale_ms in self._find_all_mapping_arrays(other_lattice, ltol, atol):
+            rotation_ms = (
+                [None] * len(aligned_ms)
+                if skip_rotation_matrix
+                else np.linalg.solve(aligned_ms, np.broadcast_to(other_lattice.matrix, aligned_ms.shape))
+            )
+            for aligned_m, rotation_m, scale_m in zip(aligned_ms, rotation_ms, scale_ms, strict=True):
+                yield type(self)(aligned_m), rotation_m, scale_m
+
+    def _find_all_mapping_arrays(
+        self,
+        other_lattice: Lattice,
+        ltol: float = 1e-5,
+        atol: float = 1,
+    ) -> Iterator[tuple[NDArray[np.float64], NDArray[np.int64]]]:
+        """Batched version of find_all_mappings.
+
+        Yields:
+            (aligned_matrices, scale_matrices) with shapes (m, 3, 3) for all
+            mappings sharing the same first lattice vector, in the order of
+            find_all_mappings. Singular scale matrices are excluded.
+        """
 
         def get_angles(v1, v2, l1, l2):
             x = np.inner(v1, v2) / l1[:, None] / l2
@@ -974,25 +996,36 @@ class Lattice(MSONable):
         # This can't be broadcast because they're different lengths
         inds = [np.logical_and(dist / ln < 1 + ltol, dist / ln > 1 / (1 + ltol)) for ln in lengths]  # type: ignore[operator]
         c_a, c_b, c_c = (cart[i] for i in inds)
-        f_a, f_b, f_c = (frac[i] for i in inds)
+        f_a, f_b, f_c = (np.asarray(frac[i], dtype=np.int64) for i in inds)  # type: ignore[index]
         l_a, l_b, l_c = (np.sum(c**2, axis=-1) ** 0.5 for c in (c_a, c_b, c_c))
 
         alpha_b = np.isclose(get_angles(c_b, c_c, l_b, l_c), alpha, atol=atol, rtol=0)
         beta_b = np.isclose(get_angles(c_a, c_c, l_a, l_c), beta, atol=atol, rtol=0)
         gamma_b = np.isclose(get_angles(c_a, c_b, l_a, l_b), gamma, atol=atol, rtol=0)
 
-        for idx, all_j in enumerate(gamma_b):
-            inds = np.logical_and(all_j[:, None], np.logical_and(alpha_b, beta_b[idx][None, :]))
-            for j, k in np.argwhere(inds):
-                scale_m = np.array((f_a[idx], f_b[j], f_c[k]), dtype=np.int64)  # type: ignore[index]
-                if abs(np.linalg.det(scale_m)) < 1e-8:
-                    continue
-
-                aligned_m = np.array((c_a[idx], c_b[j], c_c[k]))
-
-                rotation_m = None if skip_rotation_matrix else np.linalg.solve(aligned_m, other_lattice.matrix)
+        for idx in range(len(c_a)):
+            # Only the b and c vectors with matching gamma and beta angles to a
+            j_inds = np.flatnonzero(gamma_b[idx])
+            k_inds = np.flatnonzero(beta_b[idx])
+            if len(j_inds) == 0 or len(k_inds) == 0:
+                continue
+            j_sub, k_sub = np.nonzero(alpha_b[np.ix_(j_inds, k_inds)])
+            if len(j_sub) == 0:
+                continue
+            j_inds, k_inds = j_inds[j_sub], k_inds[k_sub]
 
-                yield type(self)(aligned_m), rotation_m, scale_m
+            scale_ms = np.stack(
+                (np.broadcast_to(f_a[idx], (len(j_inds), 3)), f_b[j_inds], f_c[k_inds]),
+                axis=1,
+            )
+            valid = np.abs(np.linalg.det(scale_ms)) >= 1e-8
+            if not valid.any():
+                continue
+            aligned_ms = np.stack(
+                (np.broadcast_to(c_a[idx], (len(j_inds), 3)), c_b[j_inds], c_c[k_inds]),
+                axis=1,
+            )
+            yield aligned_ms[valid], scale_ms[valid]
 
     def find_mapping(
         self,
@@ -1451,6 +1484,69 @@ class Lattice(MSONable):
                 return tuple(zip(frac_coords, distances, indices, images, strict=True))  # type: ignore[return-value]
             return frac_coords, distances, indices, images  # type: ignore[return-value]
 
+    def get_points_in_spheres_batched(
+        self,
+        frac_points: ArrayLike,
+        centers: ArrayLike,
+        r: float | ArrayLike,
+        numerical_tol: float = 1e-8,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+        """Batched version of get_points_in_sphere for many centers, taking into
+        account periodic boundary conditions. All spheres are searched in a single
+        pass and the results are returned as flat arrays, sorted by center.
+
+        Args:
+            frac_points: All points in the lattice in fractional coordinates.
+            centers: Nx3 Cartesian coordinates of the centers of the spheres.
+            r (float | ArrayLike): Radius of the spheres, either one for all
+                spheres or one per center.
+            numerical_tol (float): Numerical tolerance on the distances.
+
+        Returns:
+            tuple[NDArray, NDArray, NDArray, NDArray]: center_indices, points_indices,
+                images and distances. Point frac_points[points_indices[i]] + images[i]
+                is at distance distances[i] from centers[center_indices[i]].
+        """
+        frac_points = np.ascontiguousarray(np.reshape(frac_points, (-1, 3)), dtype=float)
+        centers = np.ascontiguousarray(np.reshape(centers, (-1, 3)), dtype=float)
+        radii = np.broadcast_to(np.asarray(r, dtype=float), (len(centers),))
+        r_max = float(radii.max()) if len(radii) > 0 else 0.0
+
+        center_indices: NDArray[np.int64]
+        points_indices: NDArray[np.int64]
+        if len(frac_points) == 0 or len(centers) == 0:
+            center_indices = points_indices = np.array([], dtype=np.int64)
+            return center_indices, points_indices, np.empty((0, 3)), np.array([], dtype=float)
+
+        cart_coords = np.ascontiguousarray(self.get_cartesian_coords(frac_points), dtype=float)
+        try:
+            from pymatgen.optimization.neighbors import find_points_in_spheres
+        except ImportError:
+            neighbors = get_points_in_spheres(
+                cart_coords, centers, r_max, pbc=self.pbc, numerical_tol=numerical_tol, lattice=self
+            )
+            n_neighbors = [len(nns) for nns in neighbors]
+            center_indices = np.repeat(np.arange(len(centers)), n_neighbors)
+            points_indices = np.array([nn[2] for nns in neighbors for nn in nns], dtype=np.int64)
+            images = np.reshape([nn[3] for nns in neighbors for nn in nns], (-1, 3)).astype(float)
+            distances = np.array([nn[1] for nns in neighbors for nn in nns], dtype=float)
+        else:
+            center_indices, points_indices, images, distances = find_points_in_spheres(
+                all_coords=cart_coords,
+                center_coords=centers,
+                r=r_max,
+                pbc=np.ascontiguousarray(self.pbc, dtype=np.int64),
+                lattice=np.ascontiguousarray(self.matrix, dtype=float),
+                tol=numerical_tol,
+            )
+
+        if np.ndim(r) > 0 and np.any(radii < r_max):
+            # Searched up to the largest radius, apply the radius of each center
+            center_radii = np.take(radii, center_indices)
+            mask = distances**2 < center_radii**2 + numerical_tol
+            return center_indices[mask], points_indices[mask], images[mask], distances[mask]
+        return center_indices, points_indices, images, distances
+
     def get_points_in_sphere_py(
         self,
         frac_points: ArrayLike,
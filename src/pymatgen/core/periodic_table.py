@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any, Literal
 
+    from numpy.typing import NDArray
     from typing_extensions import Self
 
     from pymatgen.util.typing import SpeciesLike
@@ -45,6 +46,50 @@ _PT_DATA: dict[str, Any] = _RAW_PT_DATA
 
 _PT_ROW_SIZES: tuple[int, ...] = (2, 8, 8, 18, 18, 32, 32)
 
+# Numeric Element properties available as arrays indexed by Z,
+# see get_element_property_array
+ELEMENT_NUMERIC_PROPERTIES: tuple[str, ...] = (
+    "Z",
+    "X",
+    "atomic_mass",
+    "atomic_radius",
+    "atomic_radius_calculated",
+    "van_der_waals_radius",
+    "metallic_radius",
+    "average_ionic_radius",
+    "average_cationic_radius",
+    "average_anionic_radius",
+    "ionization_energy",
+    "electron_affinity",
+    "max_oxidation_state",
+    "min_oxidation_state",
+    "n_electrons",
+    "row",
+    "group",
+    "mendeleev_no",
+    "iupac_ordering",
+    "electrical_resistivity",
+    "velocity_of_sound",
+    "reflectivity",
+    "refractive_index",
+    "poissons_ratio",
+    "molar_volume",
+    "thermal_conductivity",
+    "boiling_point",
+    "melting_point",
+    "critical_temperature",
+    "superconduction_temperature",
+    "liquid_range",
+    "bulk_modulus",
+    "youngs_modulus",
+    "brinell_hardness",
+    "rigidity_modulus",
+    "mineral_hardness",
+    "vickers_hardness",
+    "density_of_solid",
+    "coefficient_of_linear_thermal_expansion",
+)
+
 # Madelung energy ordering rule (lower to higher energy)
 _MADELUNG: list[tuple[int, str]] = [
     (1, "s"),
@@ -1659,6 +1704,40 @@ def get_el_sp(obj: int | SpeciesLike) -> Element | Species | DummySpecies:
         raise ValueError(f"Can't parse Element or Species from {obj!r}") from exc
 
 
+@functools.cache
+def get_element_property_array(prop: str) -> NDArray[np.float64]:
+    """Get a numeric Element property for all elements as an array indexed by
+    atomic number, e.g. get_element_property_array("X")[26] is the
+    electronegativity of Fe. Index 0 and elements without data are NaN. Values
+    are in the units of the corresponding Element attribute, without FloatWithUnit.
+
+    This is much faster than going through Element attributes when looking up
+    properties for many atoms, e.g. table[atomic_numbers].
+
+    Args:
+        prop (str): Property name, one of ELEMENT_NUMERIC_PROPERTIES.
+
+    Returns:
+        NDArray: Read-only array of shape (max Z + 1,).
+    """
+    if prop not in ELEMENT_NUMERIC_PROPERTIES:
+        raise ValueError(f"Invalid {prop=}, must be one of {ELEMENT_NUMERIC_PROPERTIES}")
+
+    elements = [el for el in Element if not el._is_named_isotope]
+    table = np.full(max(el.Z for el in elements) + 1, np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for el in elements:
+            try:
+                val = getattr(el, prop)
+            except (KeyError, ValueError):
+                continue
+            if val is not None:
+                table[el.Z] = float(val)
+    table.flags.writeable = False
+    return table
+
+
 @unique
 class ElementType(Enum):
     """Enum for element types."""
@@ -20,7 +20,7 @@ import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from fnmatch import fnmatch
-from typing import TYPE_CHECKING, Literal, cast, get_args, overload
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast, get_args, overload
 
 import numpy as np
 import orjson
@@ -38,7 +38,14 @@ from pymatgen.core.bonds import CovalentBond, get_bond_length
 from pymatgen.core.composition import Composition
 from pymatgen.core.lattice import Lattice, get_points_in_spheres
 from pymatgen.core.operations import SymmOp
-from pymatgen.core.periodic_table import DummySpecies, Element, Species, get_el_sp
+from pymatgen.core.periodic_table import (
+    ELEMENT_NUMERIC_PROPERTIES,
+    DummySpecies,
+    Element,
+    Species,
+    get_el_sp,
+    get_element_property_array,
+)
 from pymatgen.core.sites import PeriodicSite, Site
 from pymatgen.core.units import Length, Mass
 from pymatgen.electronic_structure.core import Magmom
@@ -210,6 +217,84 @@ class PeriodicNeighbor(PeriodicSite):
         return super(Site, cls).from_dict(dct)
 
 
+class NeighborList(NamedTuple):
+    """Lightweight alternative to lists of PeriodicNeighbor objects, holding the
+    neighbors of a set of centers as flat arrays in CSR layout. Pair j is site
+    points_indices[j] translated by images[j] lattice vectors, at distance
+    distances[j] and Cartesian displacement vectors[j] from center center_indices[j].
+    Pairs are sorted by center, so the neighbors of center i are the pairs in
+    offsets[i]:offsets[i + 1].
+    """
+
+    center_indices: NDArray[np.int64]
+    points_indices: NDArray[np.int64]
+    images: NDArray[np.int64]
+    distances: NDArray[np.float64]
+    vectors: NDArray[np.float64]
+    offsets: NDArray[np.int64]
+    weights: NDArray[np.float64] | None = None
+
+    @classmethod
+    def from_pairs(
+        cls,
+        n_centers: int,
+        center_indices: ArrayLike,
+        points_indices: ArrayLike,
+        images: ArrayLike,
+        distances: ArrayLike,
+        vectors: ArrayLike,
+        weights: ArrayLike | None = None,
+    ) -> Self:
+        """Build a NeighborList from pair arrays, sorting the pairs by center.
+
+        Args:
+            n_centers (int): Number of centers.
+            center_indices (ArrayLike): Index of the center of each pair.
+            points_indices (ArrayLike): Index of the neighbor site of each pair.
+            images (ArrayLike): Lattice image of the neighbor site of each pair.
+            distances (ArrayLike): Distance of each pair.
+            vectors (ArrayLike): Cartesian vector from center to neighbor of each pair.
+            weights (ArrayLike): Optional weight of each pair.
+        """
+        center_indices = np.asarray(center_indices, dtype=np.int64)
+        order = np.argsort(center_indices, kind="stable")
+        return cls(
+            center_indices=center_indices[order],
+            points_indices=np.asarray(points_indices, dtype=np.int64)[order],
+            images=np.round(np.reshape(images, (-1, 3))).astype(np.int64)[order],
+            distances=np.asarray(distances, dtype=np.float64)[order],
+            vectors=np.reshape(np.asarray(vectors, dtype=np.float64), (-1, 3))[order],
+            offsets=np.searchsorted(center_indices[order], np.arange(n_centers + 1)),
+            weights=None if weights is None else np.asarray(weights, dtype=np.float64)[order],
+        )
+
+    @property
+    def n_centers(self) -> int:
+        """Number of centers."""
+        return len(self.offsets) - 1
+
+    def select(self, mask: NDArray[np.bool_], weights: ArrayLike | None = None) -> Self:
+        """Get the NeighborList of the pairs selected by a boolean mask.
+
+        Args:
+            mask (NDArray): Boolean mask over all pairs.
+            weights (ArrayLike): New weights for the selected pairs. Defaults to the
+                current weights of the selected pairs.
+        """
+        if weights is None and self.weights is not None:
+            weights = self.weights[mask]
+        center_indices = self.center_indices[mask]
+        return type(self)(
+            center_indices=center_indices,
+            points_indices=self.points_indices[mask],
+            images=self.images[mask],
+            distances=self.distances[mask],
+            vectors=self.vectors[mask],
+            offsets=np.searchsorted(center_indices, np.arange(self.n_centers + 1)),
+            weights=None if weights is None else np.asarray(weights, dtype=np.float64),
+        )
+
+
 class SiteCollection(collections.abc.Sequence, ABC):
     """Basic SiteCollection. Essentially a sequence of Sites or PeriodicSites.
     This serves as a base class for Molecule (a collection of Site, i.e., no
@@ -250,7 +335,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
     def sites(self, sites: Sequence[PeriodicSite]) -> None:
         """Set the sites in the Structure."""
         # If self is mutable Structure or Molecule, set _sites as list
-        is_mutable = isinstance(self._sites, collections.abc.MutableSequence)
+        is_mutable = isinstance(self, collections.abc.MutableSequence)
         self._sites: list[PeriodicSite] | tuple[PeriodicSite, ...] = list(sites) if is_mutable else tuple(sites)
 
     @abstractmethod
@@ -356,6 +441,38 @@ class SiteCollection(collections.abc.Sequence, ABC):
         except AttributeError:
             raise AttributeError("atomic_numbers available only for ordered Structures")
 
+    def get_element_property_array(self, prop: str) -> NDArray[np.float64]:
+        """Get a numeric element or species property for all sites as an array,
+        e.g. get_element_property_array("X") for the electronegativities.
+
+        Properties in ELEMENT_NUMERIC_PROPERTIES are looked up in the arrays from
+        periodic_table.get_element_property_array. Any other numeric species
+        attribute (e.g. "ionic_radius" or "oxi_state") is evaluated once per
+        unique species. Disordered sites get the average over their species
+        weighted by occupancy. Missing data are NaN.
+
+        Args:
+            prop (str): Property name, e.g. "X", "atomic_mass" or "ionic_radius".
+
+        Returns:
+            NDArray: Property value for each site.
+        """
+        species_table, species_indices = self._get_species_table()
+        values = np.array([_get_occupancy_weighted_property(comp, prop) for comp in species_table], dtype=np.float64)
+        return np.take(values, species_indices)
+
+    def _get_species_table(self) -> tuple[list[Composition], NDArray[np.intp]]:
+        """The unique site species and the index into them for each site."""
+        species_table: list[Composition] = []
+        species_indices = np.empty(len(self), dtype=np.intp)
+        seen: dict[Composition, int] = {}
+        for idx, comp in enumerate(self.species_and_occu):
+            if (type_idx := seen.get(comp)) is None:
+                type_idx = seen[comp] = len(species_table)
+                species_table.append(comp)
+            species_indices[idx] = type_idx
+        return species_table, species_indices
+
     @property
     def site_properties(self) -> dict[str, Sequence]:
         """The site properties as a dict of sequences.
@@ -455,8 +572,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
         Elements are found, a charge of 0 is assumed.
         """
         charge = 0.0
-        for site in self:
-            for specie, amt in site.species.items():
+        for species in self.species_and_occu:
+            for specie, amt in species.items():
                 charge += (getattr(specie, "oxi_state", 0) or 0) * amt
 
         return charge
@@ -1003,6 +1120,265 @@ class SiteCollection(collections.abc.Sequence, ABC):
         return AseAtomsAdaptor.get_structure(atoms, cls=cls, **kwargs)  # type:ignore[type-var,return-value]
 
 
+class _SiteArrays:
+    """Columnar storage for the sites of an IStructure.
+
+    Sites are held as a contiguous Nx3 array of fractional coordinates, an array
+    of indices into a table of unique species (as Compositions), a list per site
+    property and a list of labels. PeriodicSite objects are only created when the
+    sites of the structure are actually accessed, which makes bulk properties
+    such as frac_coords or species cheap for large structures.
+    """
+
+    def __init__(
+        self,
+        lattice: Lattice,
+        frac_coords: NDArray[np.float64],
+        species_table: list[Composition],
+        species_indices: NDArray[np.intp],
+        properties: dict[str, list] | None = None,
+        labels: list[str | None] | None = None,
+    ) -> None:
+        """
+        Args:
+            lattice (Lattice): Lattice the sites belong to.
+            frac_coords (NDArray): Nx3 array of fractional coordinates.
+            species_table (list[Composition]): Unique species on the sites.
+            species_indices (NDArray): Index into species_table for each site.
+            properties (dict): Site properties as a dict of lists of length N.
+            labels (list[str | None]): Site labels. None for default labels.
+        """
+        self.lattice = lattice
+        self.frac_coords = frac_coords
+        self.species_table = species_table
+        self.species_indices = species_indices
+        self.properties = properties or {}
+        self.labels = labels if labels is not None else [None] * len(species_indices)
+
+    def __len__(self) -> int:
+        return len(self.species_indices)
+
+    @classmethod
+    def from_inputs(
+        cls,
+        lattice: Lattice,
+        species: Sequence[CompositionLike],
+        coords: Sequence[ArrayLike] | ArrayLike,
+        to_unit_cell: bool = False,
+        coords_are_cartesian: bool = False,
+        site_properties: dict | None = None,
+        labels: Sequence[str | None] | None = None,
+    ) -> Self:
+        """Build the site arrays from the (flexible) IStructure constructor inputs.
+
+        Species are converted to Compositions and validated once per unique input
+        instead of once per site.
+        """
+        n_sites = len(species)
+        frac_coords = np.array(coords, dtype=np.float64).reshape(n_sites, 3)
+        if coords_are_cartesian:
+            frac_coords = lattice.get_fractional_coords(frac_coords)
+        if to_unit_cell:
+            frac_coords = np.where(lattice.pbc, np.mod(frac_coords, 1), frac_coords)
+
+        species_table: list[Composition] = []
+        species_indices = np.empty(n_sites, dtype=np.intp)
+        seen: dict[Any, int] = {}
+        for idx, specie in enumerate(species):
+            # Strings and ints are interned by value, everything else by identity
+            key = (type(specie), specie) if isinstance(specie, str | int) else id(specie)
+            if (type_idx := seen.get(key)) is None:
+                type_idx = seen[key] = len(species_table)
+                species_table.append(_to_site_composition(specie))
+            species_indices[idx] = type_idx
+
+        properties: dict[str, list] = {}
+        for key, val in (site_properties or {}).items():
+            if val is None:
+                continue
+            vals = list(val)
+            if len(vals) < n_sites:
+                raise IndexError(f"Site property {key} has {len(vals)} values for {n_sites} sites")
+            properties[key] = vals[:n_sites]
+
+        return cls(
+            lattice,
+            frac_coords,
+            species_table,
+            species_indices,
+            properties=properties,
+            labels=[labels[idx] for idx in range(n_sites)] if labels else None,
+        )
+
+    @property
+    def species_and_occu(self) -> list[Composition]:
+        """The species Composition of each site."""
+        table = self.species_table
+        return [table[idx] for idx in self.species_indices]
+
+    @property
+    def type_counts(self) -> NDArray[np.intp]:
+        """Number of sites carrying each entry of species_table."""
+        return np.bincount(self.species_indices, minlength=len(self.species_table))
+
+    @property
+    def prototype_sites(self) -> list[Site]:
+        """One coordinate-less Site per species type, used to evaluate per-site
+        quantities (ordering, species string) once per type.
+        """
+        return [Site(comp, np.zeros(3), skip_checks=True) for comp in self.species_table]
+
+    def to_sites(self) -> list[PeriodicSite]:
+        """Create the PeriodicSite objects described by the arrays."""
+        lattice = self.lattice
+        table = self.species_table
+        props = self.properties
+        return [
+            PeriodicSite(
+                table[type_idx],
+                frac_coords,
+                lattice,
+                properties={key: vals[idx] for key, vals in props.items()},
+                label=self.labels[idx],
+                skip_checks=True,
+            )
+            for idx, (type_idx, frac_coords) in enumerate(zip(self.species_indices, self.frac_coords, strict=True))
+        ]
+
+
+def _to_site_composition(species: CompositionLike) -> Composition:
+    """Convert a species-like input to a site Composition, the same way PeriodicSite does."""
+    if not isinstance(species, Composition):
+        try:
+            species = Composition({get_el_sp(species): 1})  # type: ignore[arg-type]
+        except TypeError:
+            species = Composition(species)
+
+    if species.num_atoms > 1 + Composition.amount_tolerance:
+        raise ValueError("Species occupancies sum to more than 1!")
+    return species
+
+
+def _get_occupancy_weighted_property(species: Composition, prop: str) -> float:
+    """Average of a numeric species property over the species of a site,
+    weighted by occupancy. See SiteCollection.get_element_property_array.
+    """
+    if (total_occu := sum(species.values())) == 0:
+        return np.nan
+
+    table = get_element_property_array(prop) if prop in ELEMENT_NUMERIC_PROPERTIES else None
+    weighted_sum = 0.0
+    for sp, occu in species.items():
+        if table is None:
+            val = getattr(sp, prop)
+        elif getattr(sp, "_is_named_isotope", False):
+            # named isotopes (D, T) share the atomic number of their element
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                val = getattr(sp, prop)
+        else:
+            val = np.nan if isinstance(sp, DummySpecies) else table[sp.Z]
+        if val is None:
+            val = np.nan
+        try:
+            weighted_sum += occu * float(val)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{prop=} is not a numeric property of {sp}") from exc
+    return weighted_sum / total_occu
+
+
+class _NeighborListCache:
+    """Neighbor list of all sites of a structure for the largest cutoff requested so far.
+
+    Pairs are sorted by center index so that the neighbors of any subset of
+    centers can be sliced out, and neighbor lists for smaller cutoffs are obtained
+    by filtering on distance. The cache is only valid for the lattice and Cartesian
+    coordinates it was computed for, which are kept for validation.
+    """
+
+    def __init__(
+        self,
+        r: float,
+        numerical_tol: float,
+        lattice_matrix: NDArray[np.float64],
+        pbc: tuple[bool, bool, bool],
+        cart_coords: NDArray[np.float64],
+        neighbor_list: tuple[NDArray, NDArray, NDArray, NDArray],
+    ) -> None:
+        """
+        Args:
+            r (float): Cutoff radius the neighbor list was computed for.
+            numerical_tol (float): Numerical tolerance used for the distances.
+            lattice_matrix (NDArray): Lattice matrix of the structure.
+            pbc (tuple[bool, bool, bool]): Periodic boundary conditions of the lattice.
+            cart_coords (NDArray): Cartesian coordinates of all sites.
+            neighbor_list (tuple): (center_indices, points_indices, offset_vectors, distances)
+                including self pairs, sorted by center index.
+        """
+        self.r = r
+        self.numerical_tol = numerical_tol
+        self.lattice_matrix = lattice_matrix
+        self.pbc = pbc
+        self.cart_coords = cart_coords
+        self._site_indices: dict[int, int] | None = None
+        self.center_indices, self.points_indices, self.images, self.distances = neighbor_list
+        self.offsets = np.searchsorted(self.center_indices, np.arange(len(cart_coords) + 1))
+
+    def is_valid(self, r: float, numerical_tol: float, lattice: Lattice, cart_coords: NDArray) -> bool:
+        """Whether the cached neighbor list answers a query for cutoff r on a structure with
+        the given lattice and Cartesian coordinates.
+        """
+        return (
+            r <= self.r
+            and numerical_tol == self.numerical_tol
+            and self.pbc == lattice.pbc
+            and np.array_equal(self.lattice_matrix, lattice.matrix)
+            and np.array_equal(self.cart_coords, cart_coords)
+        )
+
+    def get_site_indices(self, sites: Sequence[PeriodicSite], all_sites: Sequence[PeriodicSite]) -> list[int] | None:
+        """Indices of sites in all_sites (the sites of the cached structure) by identity,
+        or None if any of them is not a site of the structure.
+        """
+        for _ in range(2):
+            if self._site_indices is None:
+                self._site_indices = {id(site): idx for idx, site in enumerate(all_sites)}
+            indices = [self._site_indices.get(id(site), -1) for site in sites]
+            if all(idx >= 0 and all_sites[idx] is site for idx, site in zip(indices, sites, strict=True)):
+                return indices
+            # The site list may have changed since the map was built
+            self._site_indices = None
+        return None
+
+    def get_neighbor_list(
+        self,
+        r: float,
+        centers: Sequence[int] | None = None,
+    ) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Neighbor list for cutoff r, optionally restricted to the given center indices.
+        Center indices in the returned list refer to positions in centers.
+        """
+        if centers is None:
+            center_indices = self.center_indices
+            pair_indices = np.arange(len(center_indices))
+        else:
+            centers = np.asarray(centers, dtype=np.int64)
+            starts, counts = self.offsets[centers], np.diff(self.offsets)[centers]
+            # Gather the contiguous blocks of pairs belonging to each center
+            pair_indices = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            center_indices = np.repeat(np.arange(len(centers)), counts)
+        distances = self.distances[pair_indices]
+        # Same criterion as find_points_in_spheres, so a cached superset gives identical results
+        mask = distances <= r if r < 1 else distances**2 < r**2 + self.numerical_tol
+        pair_indices = pair_indices[mask]
+        return (
+            center_indices[mask],
+            self.points_indices[pair_indices],
+            self.images[pair_indices],
+            distances[mask],
+        )
+
+
 class IStructure(SiteCollection, MSONable):
     """Basic immutable Structure object with periodicity. Essentially a sequence
     of PeriodicSites having a common lattice. IStructure is made to be
@@ -1072,29 +1448,86 @@ class IStructure(SiteCollection, MSONable):
 
         self._lattice = lattice if isinstance(lattice, Lattice) else Lattice(lattice)
 
-        sites = []
-        for idx, specie in enumerate(species):
-            prop = None
-            if site_properties:
-                prop = {key: val[idx] for key, val in site_properties.items() if val is not None}
-
-            label = labels[idx] if labels else None
-
-            site = PeriodicSite(
-                specie,
-                np.array(coords[idx]),
-                self._lattice,
-                to_unit_cell,
-                coords_are_cartesian=coords_are_cartesian,
-                properties=prop,
-                label=label,
-            )
-            sites.append(site)
-        self._sites: tuple[PeriodicSite, ...] = tuple(sites)
+        # Sites are stored column-wise and only turned into PeriodicSites on first access
+        self._site_list: list[PeriodicSite] | tuple[PeriodicSite, ...] | None = None
+        self._site_arrays: _SiteArrays | None = _SiteArrays.from_inputs(
+            self._lattice,
+            species,
+            coords,
+            to_unit_cell=to_unit_cell,
+            coords_are_cartesian=coords_are_cartesian,
+            site_properties=site_properties,
+            labels=labels,
+        )
         if validate_proximity and not self.is_valid():
             raise StructureError(f"sites are less than {self.DISTANCE_TOLERANCE} Angstrom apart!")
         self._charge = charge
         self._properties = properties or {}
+        self._neighbor_list_cache: _NeighborListCache | None = None
+
+    def __len__(self) -> int:
+        if (site_arrays := self._site_arrays) is not None:
+            return len(site_arrays)
+        return len(self._sites)
+
+    def __setstate__(self, state: dict) -> None:
+        # Structures pickled before the columnar site storage keep their sites under "_sites"
+        if "_sites" in state:
+            state["_site_list"] = state.pop("_sites")
+            state["_site_arrays"] = None
+        state.setdefault("_neighbor_list_cache", None)
+        self.__dict__.update(state)
+
+    def __getstate__(self) -> dict:
+        # The neighbor list cache can be much larger than the structure itself
+        return {**self.__dict__, "_neighbor_list_cache": None}
+
+    @property
+    def _sites(self) -> list[PeriodicSite] | tuple[PeriodicSite, ...]:
+        """The PeriodicSites of the structure, created from the site arrays on first access.
+        From then on the sites are the only source of truth, since they can be modified in place.
+        """
+        if (site_list := getattr(self, "_site_list", None)) is None:
+            site_arrays = getattr(self, "_site_arrays", None)
+            sites = site_arrays.to_sites() if site_arrays is not None else []
+            site_list = list(sites) if isinstance(self, collections.abc.MutableSequence) else tuple(sites)
+            self._site_list = site_list
+            self._site_arrays = None
+        return site_list
+
+    @_sites.setter
+    def _sites(self, sites: list[PeriodicSite] | tuple[PeriodicSite, ...]) -> None:
+        self._site_list = sites
+        self._site_arrays = None
+        self._neighbor_list_cache = None
+
+    @classmethod
+    def _from_site_arrays(
+        cls,
+        site_arrays: _SiteArrays,
+        charge: float | None = None,
+        properties: dict | None = None,
+    ) -> Self:
+        """Create a structure directly from site arrays, skipping the conversion
+        and validation of the species done by the constructor.
+        """
+        struct = cls(site_arrays.lattice, [], [], charge=charge, properties=properties)
+        struct._site_arrays = site_arrays
+        return struct
+
+    def _get_site_arrays(self) -> _SiteArrays:
+        """The sites of the structure as site arrays, built from the PeriodicSites
+        if these have already been created.
+        """
+        if (site_arrays := self._site_arrays) is not None:
+            return site_arrays
+        return _SiteArrays.from_inputs(
+            self._lattice,
+            self.species_and_occu,
+            self.frac_coords,
+            site_properties=self.site_properties,
+            labels=self.labels,
+        )
 
     def __eq__(self, other: object) -> bool:
         """Define equality by comparing all three attributes: lattice, sites, properties."""
@@ -1154,23 +1587,26 @@ class IStructure(SiteCollection, MSONable):
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
 
-        new_sites = []
-        for site in self:
-            for vec in cart_lattice:
-                periodic_site = PeriodicSite(
-                    site.species,
-                    site.coords + vec,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                    skip_checks=True,
-                    label=site.label,
-                )
-                new_sites.append(periodic_site)
+        # Every site is repeated at all lattice points of the supercell (site-major order)
+        site_arrays = self._get_site_arrays()
+        n_images = len(cart_lattice)
+        cart_coords = site_arrays.lattice.get_cartesian_coords(site_arrays.frac_coords)
+        new_frac_coords = new_lattice.get_fractional_coords(
+            (cart_coords[:, None, :] + cart_lattice[None, :, :]).reshape(-1, 3)
+        )
+        new_site_arrays = _SiteArrays(
+            new_lattice,
+            np.where(new_lattice.pbc, np.mod(new_frac_coords, 1), new_frac_coords),
+            list(site_arrays.species_table),
+            np.repeat(site_arrays.species_indices, n_images),
+            properties={
+                key: [val for val in vals for _ in range(n_images)] for key, vals in site_arrays.properties.items()
+            },
+            labels=[label for label in site_arrays.labels for _ in range(n_images)],
+        )
 
         new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge, to_unit_cell=True)
+        return Structure._from_site_arrays(new_site_arrays, charge=new_charge)
 
     def __rmul__(self, scaling_matrix):
         """Similar to __mul__ to preserve commutativeness."""
@@ -1610,8 +2046,115 @@ class IStructure(SiteCollection, MSONable):
     @property
     def frac_coords(self):
         """Fractional coordinates as a Nx3 numpy array."""
+        if (site_arrays := self._site_arrays) is not None:
+            return site_arrays.frac_coords.copy()
         return np.array([site.frac_coords for site in self])
 
+    @property
+    def cart_coords(self) -> NDArray[np.float64]:
+        """An np.array of the Cartesian coordinates of sites in the structure."""
+        if (site_arrays := self._site_arrays) is not None:
+            return site_arrays.lattice.get_cartesian_coords(site_arrays.frac_coords)
+        return super().cart_coords
+
+    @property
+    def species(self) -> list[Element | Species]:
+        """Only works for ordered structures.
+
+        Raises:
+            AttributeError: If structure is disordered.
+
+        Returns:
+            list[Species]: species at each site of the structure.
+        """
+        if (site_arrays := self._site_arrays) is None:
+            return super().species
+        if not self.is_ordered:
+            raise AttributeError("species property only supports ordered structures!")
+        species = [site.specie for site in site_arrays.prototype_sites]
+        return [species[idx] for idx in site_arrays.species_indices]
+
+    @property
+    def species_and_occu(self) -> list[Composition]:
+        """List of species and occupancies at each site of the structure."""
+        if (site_arrays := self._site_arrays) is not None:
+            return site_arrays.species_and_occu
+        return super().species_and_occu
+
+    @property
+    def types_of_species(self) -> tuple[Element | Species | DummySpecies, ...]:
+        """Tuple of types of species."""
+        if (site_arrays := self._site_arrays) is None:
+            return super().types_of_species
+        types = {
+            sp
+            for comp, count in zip(site_arrays.species_table, site_arrays.type_counts, strict=True)
+            if count
+            for sp, amt in comp.items()
+            if amt != 0
+        }
+        return cast("tuple[Element | Species | DummySpecies, ...]", tuple(sorted(types)))
+
+    @property
+    def atomic_numbers(self) -> tuple[int, ...]:
+        """Tuple of atomic numbers."""
+        if self._site_arrays is None:
+            return super().atomic_numbers
+        try:
+            return tuple(specie.Z for specie in self.species)
+        except AttributeError:
+            raise AttributeError("atomic_numbers available only for ordered Structures")
+
+    def _get_species_table(self) -> tuple[list[Composition], NDArray[np.intp]]:
+        """The unique site species and the index into them for each site."""
+        if (site_arrays := self._site_arrays) is None:
+            return super()._get_species_table()
+        return site_arrays.species_table, site_arrays.species_indices
+
+    @property
+    def site_properties(self) -> dict[str, Sequence]:
+        """The site properties as a dict of sequences.
+        E.g. {"magmom": (5, -5), "charge": (-4, 4)}.
+        """
+        if (site_arrays := self._site_arrays) is not None:
+            return {key: list(vals) for key, vals in site_arrays.properties.items()}
+        return super().site_properties
+
+    @property
+    def labels(self) -> list[str | None]:
+        """Site labels as a list."""
+        if (site_arrays := self._site_arrays) is None:
+            return super().labels
+        species_strings = [site.species_string for site in site_arrays.prototype_sites]
+        return [
+            species_strings[type_idx] if label is None else label
+            for label, type_idx in zip(site_arrays.labels, site_arrays.species_indices, strict=True)
+        ]
+
+    @property
+    def composition(self) -> Composition:
+        """The structure's corresponding Composition object."""
+        if (site_arrays := self._site_arrays) is None:
+            return super().composition
+        elem_map: dict[SpeciesLike, float] = defaultdict(float)
+        for comp, count in zip(site_arrays.species_table, site_arrays.type_counts, strict=True):
+            for species, occu in comp.items():
+                elem_map[species] += occu * int(count)
+        return Composition(elem_map)
+
+    @property
+    def is_ordered(self) -> bool:
+        """Check if structure is ordered, meaning no partial occupancies in any
+        of the sites.
+        """
+        if (site_arrays := self._site_arrays) is None:
+            return super().is_ordered
+        return all(
+            site.is_ordered
+            for site, count in zip(site_arrays.prototype_sites, site_arrays.type_counts, strict=True)
+            if count
+        )
+
     @property
     def volume(self) -> float:
         """The volume of the structure in Angstrom^3."""
@@ -1670,17 +2213,21 @@ class IStructure(SiteCollection, MSONable):
         Returns:
             PeriodicNeighbor
         """
+        site_frac_coords = self.frac_coords
+        _, indices, images, distances = self._lattice.get_points_in_spheres_batched(site_frac_coords, [pt], r)
+        frac_coords = np.take(site_frac_coords, indices, axis=0) + images
         neighbors: list[PeriodicNeighbor] = []
-        for frac_coord, dist, idx, img in self._lattice.get_points_in_sphere(self.frac_coords, pt, r):
+        for frac_coord, dist, idx, img in zip(frac_coords, distances, indices, images, strict=True):
+            site = self[idx]
             nn_site = PeriodicNeighbor(
-                self[idx].species,
+                site.species,
                 frac_coord,
                 self._lattice,
-                properties=self[idx].properties,
+                properties=site.properties,
                 nn_distance=dist,
                 image=tuple(img),
                 index=idx,
-                label=self[idx].label,
+                label=site.label,
             )
             neighbors.append(nn_site)
         return neighbors
@@ -1809,41 +2356,141 @@ class IStructure(SiteCollection, MSONable):
             exclude_self (bool): whether to exclude atom neighboring with itself within
                 numerical tolerance distance, default to True
 
+        Neighbor lists of the whole structure are cached on the structure for the
+        largest cutoff requested so far, so that repeated queries with the same or
+        a smaller cutoff, also for a subset of the sites of the structure, are
+        answered without a new neighbor search. The cache is invalidated when the
+        lattice or the site coordinates change.
+
         Returns:
             tuple: (center_indices, points_indices, offset_vectors, distances)
         """
-        try:
-            from pymatgen.optimization.neighbors import find_points_in_spheres
-        except ImportError:
+        cart_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
+        cache = self._neighbor_list_cache
+        if cache is None or not cache.is_valid(r, numerical_tol, self.lattice, cart_coords):
+            cache = None
             if sites is None:
-                return self._get_neighbor_list_py(r, None, exclude_self=exclude_self)
-            return self._get_neighbor_list_py(r, list(sites), exclude_self=exclude_self)
+                # Only neighbor lists of all sites are cached, sites are usually a small subset
+                neighbor_list = self._find_neighbor_pairs(r, None, cart_coords, numerical_tol)
+                cache = self._neighbor_list_cache = _NeighborListCache(
+                    r, numerical_tol, self.lattice.matrix.copy(), self.pbc, cart_coords, neighbor_list
+                )
 
+        if cache is not None and sites is None:
+            center_indices, points_indices, images, distances = cache.get_neighbor_list(r)
+        elif (
+            cache is not None
+            and sites is not None
+            and (site_indices := cache.get_site_indices(sites, self.sites)) is not None
+        ):
+            center_indices, points_indices, images, distances = cache.get_neighbor_list(r, site_indices)
         else:
-            if sites is None:
-                sites = self.sites
-            site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
-            cart_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
-            lattice_matrix = np.ascontiguousarray(self.lattice.matrix, dtype=float)
-            pbc = np.ascontiguousarray(self.pbc, dtype=np.int64)
-            center_indices, points_indices, images, distances = find_points_in_spheres(
-                cart_coords,
-                site_coords,
-                r=r,
-                pbc=pbc,
-                lattice=lattice_matrix,
-                tol=numerical_tol,
+            center_indices, points_indices, images, distances = self._find_neighbor_pairs(
+                r, sites, cart_coords, numerical_tol
             )
-            cond = np.array([True] * len(center_indices))
-            if exclude_self:
-                self_pair = (center_indices == points_indices) & (distances <= numerical_tol)
-                cond = ~self_pair
-            return (
+
+        if exclude_self:
+            cond = ~((center_indices == points_indices) & (distances <= numerical_tol))
+            return center_indices[cond], points_indices[cond], images[cond], distances[cond]
+        return center_indices, points_indices, images, distances
+
+    def _find_neighbor_pairs(
+        self,
+        r: float,
+        sites: Sequence[PeriodicSite] | None,
+        cart_coords: NDArray[np.float64],
+        numerical_tol: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run the neighbor search behind get_neighbor_list, including self pairs.
+
+        Returns:
+            tuple: (center_indices, points_indices, offset_vectors, distances)
+        """
+        try:
+            from pymatgen.optimization.neighbors import find_points_in_spheres
+        except ImportError:
+            return self._get_neighbor_list_py(r, None if sites is None else list(sites), exclude_self=False)
+
+        site_coords = (
+            cart_coords if sites is None else np.ascontiguousarray([site.coords for site in sites], dtype=float)
+        )
+        lattice_matrix = np.ascontiguousarray(self.lattice.matrix, dtype=float)
+        pbc = np.ascontiguousarray(self.pbc, dtype=np.int64)
+        return find_points_in_spheres(
+            cart_coords,
+            site_coords,
+            r=r,
+            pbc=pbc,
+            lattice=lattice_matrix,
+            tol=numerical_tol,
+        )
+
+    @classmethod
+    def get_neighbor_lists(
+        cls,
+        structures: Sequence[IStructure],
+        r: float,
+        numerical_tol: float = 1e-8,
+        exclude_self: bool = True,
+    ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """Get the neighbor lists of many structures in a single call. If the cython
+        extension is installed, all structures are handled in one pass through the
+        neighbor search without holding the GIL, so lists of structures can also be
+        split into chunks processed by a thread pool.
+
+        Args:
+            structures (Sequence[IStructure]): Structures to get neighbor lists for.
+            r (float): Radius of sphere
+            numerical_tol (float): This is a numerical tolerance for distances.
+                Sites which are < numerical_tol are determined to be coincident
+                with the site. Sites which are r + numerical_tol away is deemed
+                to be within r from the site. The default of 1e-8 should be
+                ok in most instances.
+            exclude_self (bool): whether to exclude atom neighboring with itself within
+                numerical tolerance distance, default to True
+
+        Returns:
+            list[tuple]: (center_indices, points_indices, offset_vectors, distances)
+                for each structure, as returned by get_neighbor_list.
+        """
+        try:
+            from pymatgen.optimization.neighbors import find_points_in_spheres_batch
+        except ImportError:
+            return [
+                struct.get_neighbor_list(r, numerical_tol=numerical_tol, exclude_self=exclude_self)
+                for struct in structures
+            ]
+
+        if len(structures) == 0:
+            return []
+        cart_coords = np.ascontiguousarray(
+            np.concatenate([np.reshape(struct.cart_coords, (-1, 3)) for struct in structures]), dtype=float
+        )
+        offsets = np.zeros(len(structures) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(struct) for struct in structures])
+        pair_offsets, center_indices, points_indices, images, distances = find_points_in_spheres_batch(
+            cart_coords,
+            offsets,
+            cart_coords,
+            offsets,
+            r=r,
+            pbc=np.ascontiguousarray([struct.pbc for struct in structures], dtype=np.int64),
+            lattices=np.ascontiguousarray([struct.lattice.matrix for struct in structures], dtype=float),
+            tol=numerical_tol,
+        )
+        if exclude_self:
+            cond = ~((center_indices == points_indices) & (distances <= numerical_tol))
+            pair_offsets = np.concatenate([[0], np.cumsum(cond)])[pair_offsets]
+            center_indices, points_indices, images, distances = (
                 center_indices[cond],
                 points_indices[cond],
                 images[cond],
                 distances[cond],
             )
+        return [
+            (center_indices[start:end], points_indices[start:end], images[start:end], distances[start:end])
+            for start, end in itertools.pairwise(pair_offsets)
+        ]
 
     def get_symmetric_neighbor_list(
         self,
@@ -2016,6 +2663,29 @@ class IStructure(SiteCollection, MSONable):
             symmetry_ops[idcs_symop],
         )
 
+    @overload
+    def get_all_neighbors(
+        self,
+        r: float,
+        include_index: bool = ...,
+        include_image: bool = ...,
+        sites: Sequence[PeriodicSite] | None = ...,
+        numerical_tol: float = ...,
+        as_arrays: Literal[False] = ...,
+    ) -> list[list[PeriodicNeighbor]]: ...
+
+    @overload
+    def get_all_neighbors(
+        self,
+        r: float,
+        include_index: bool = ...,
+        include_image: bool = ...,
+        sites: Sequence[PeriodicSite] | None = ...,
+        numerical_tol: float = ...,
+        *,
+        as_arrays: Literal[True],
+    ) -> NeighborList: ...
+
     def get_all_neighbors(
         self,
         r: float,
@@ -2023,7 +2693,8 @@ class IStructure(SiteCollection, MSONable):
         include_image: bool = False,
         sites: Sequence[PeriodicSite] | None = None,
         numerical_tol: float = 1e-8,
-    ) -> list[list[PeriodicNeighbor]]:
+        as_arrays: bool = False,
+    ) -> list[list[PeriodicNeighbor]] | NeighborList:
         """Get neighbors for each atom in the unit cell, out to a distance r.
         Use this method if you are planning on looping over all sites in the
         crystal. If you only want neighbors for a particular site, use the
@@ -2055,11 +2726,17 @@ class IStructure(SiteCollection, MSONable):
                 with the site. Sites which are r + numerical_tol away is deemed
                 to be within r from the site. The default of 1e-8 should be
                 ok in most instances.
+            as_arrays (bool): Whether to return the neighbors as a NeighborList of
+                flat arrays instead of PeriodicNeighbor objects. This is much faster
+                and lighter for large structures.
 
         Returns:
             [[pymatgen.core.structure.PeriodicNeighbor], ...]: a list of
-                list of neighbors for each site in structure.
+                list of neighbors for each site in structure, or a NeighborList
+                if as_arrays is True.
         """
+        if as_arrays:
+            return self._get_neighbor_arrays(r, sites=sites, numerical_tol=numerical_tol)
         if sites is None:
             sites = self.sites
         center_indices, points_indices, images, distances = self.get_neighbor_list(
@@ -2106,6 +2783,51 @@ class IStructure(SiteCollection, MSONable):
             neighbors.append(neighbor_dict[i])
         return neighbors
 
+    def _get_neighbor_arrays(
+        self,
+        r: float,
+        sites: Sequence[PeriodicSite] | None = None,
+        numerical_tol: float = 1e-8,
+    ) -> NeighborList:
+        """Get the neighbors of get_all_neighbors as a NeighborList, without creating
+        PeriodicNeighbor objects.
+        """
+        center_indices, points_indices, images, distances = self.get_neighbor_list(
+            r, sites=sites, numerical_tol=numerical_tol, exclude_self=False
+        )
+        if sites is None:
+            center_coords = self.cart_coords
+            is_self = (center_indices == points_indices) & (distances <= numerical_tol)
+            candidates = (center_indices != points_indices) & (distances <= numerical_tol)
+            centers: Sequence[PeriodicSite] | None = self if np.any(candidates) else None
+        else:
+            center_coords = np.reshape([site.coords for site in sites], (-1, 3))
+            is_self = np.zeros(len(distances), dtype=bool)
+            candidates = distances <= numerical_tol
+            centers = sites
+
+        # Coincident sites are only excluded if they are the same site, as in get_all_neighbors
+        atol = Site.position_atol
+        for pair_idx in np.flatnonzero(candidates):
+            psite, csite = self[points_indices[pair_idx]], centers[center_indices[pair_idx]]  # type: ignore[index]
+            is_self[pair_idx] = (
+                psite.species == csite.species
+                and np.allclose(psite.coords, csite.coords, atol=atol)
+                and psite.properties == csite.properties
+            )
+
+        keep = ~is_self
+        center_indices, points_indices, images = center_indices[keep], points_indices[keep], images[keep]
+        vectors = self.lattice.get_cartesian_coords(self.frac_coords[points_indices] + images)
+        return NeighborList.from_pairs(
+            n_centers=len(center_coords),
+            center_indices=center_indices,
+            points_indices=points_indices,
+            images=images,
+            distances=distances[keep],
+            vectors=vectors - center_coords[center_indices],
+        )
+
     def get_all_neighbors_py(
         self,
         r: float,
@@ -4205,8 +4927,6 @@ class Structure(IStructure, collections.abc.MutableSequence):
             properties=properties,
         )
 
-        self._sites: list[PeriodicSite] = list(self._sites)  # type: ignore[assignment]
-
     def __setitem__(
         self,
         idx: int | slice | Sequence[int] | SpeciesLike,
@@ -4257,6 +4977,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
         else:
             indices = list(idx)
 
+        self._neighbor_list_cache = None
         for ii in indices:
             if isinstance(site, PeriodicSite):
                 if site.lattice != self._lattice:
@@ -4278,6 +4999,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
     def __delitem__(self, idx: SupportsIndex | slice) -> None:
         """Delete a site from the Structure."""
         self._sites.__delitem__(idx)
+        self._neighbor_list_cache = None
 
     @property
     def lattice(self) -> Lattice:
@@ -4289,8 +5011,12 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(lattice, Lattice):
             lattice = Lattice(lattice)
         self._lattice = lattice
-        for site in self:
-            site.lattice = lattice
+        self._neighbor_list_cache = None
+        if (site_arrays := self._site_arrays) is not None:
+            site_arrays.lattice = lattice
+        else:
+            for site in self:
+                site.lattice = lattice
 
     def append(  # type:ignore[override]
         self,
@@ -4358,6 +5084,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                     raise ValueError("New site is too close to an existing site!")
 
         cast("list[PeriodicSite]", self.sites).insert(idx, new_site)
+        self._neighbor_list_cache = None
 
         return self
 
@@ -4395,6 +5122,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
 
         new_site = PeriodicSite(species, frac_coords, self._lattice, properties=properties, label=label)
         cast("list[PeriodicSite]", self.sites)[idx] = new_site
+        self._neighbor_list_cache = None
 
         return self
 
@@ -4639,6 +5367,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
             Structure: self sorted.
         """
         self._sites.sort(key=key, reverse=reverse)
+        self._neighbor_list_cache = None
         return self
 
     def translate_sites(
@@ -4792,11 +5521,14 @@ class Structure(IStructure, collections.abc.MutableSequence):
         # TODO (janosh) maybe default in_place to False after a depreciation period
         struct: Structure = self if in_place else self.copy()
         supercell: Structure = struct * scaling_matrix
+        site_arrays = supercell._get_site_arrays()
         if to_unit_cell:
-            for site in supercell:
-                site.to_unit_cell(in_place=True)
-        struct.sites = supercell.sites
-        struct.lattice = supercell.lattice
+            frac_coords = site_arrays.frac_coords
+            site_arrays.frac_coords = np.where(supercell.pbc, np.mod(frac_coords, 1), frac_coords)
+        struct._site_list = None
+        struct._site_arrays = site_arrays
+        struct._lattice = supercell.lattice
+        struct._neighbor_list_cache = None
 
         return struct
 
@@ -0,0 +1,361 @@
+"""This module provides a columnar container for large collections of structures,
+with a compact binary file format that supports memory-mapped loading and random
+access to individual structures.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import json
+from typing import TYPE_CHECKING, NamedTuple, overload
+
+import numpy as np
+from monty.json import MontyDecoder, MontyEncoder
+
+from pymatgen.core.lattice import Lattice
+from pymatgen.core.sites import Site
+from pymatgen.core.structure import Structure
+from pymatgen.util.io_utils import read_array_file, write_array_file
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+    from numpy.typing import NDArray
+    from typing_extensions import Self
+
+    from pymatgen.core import Composition, IStructure
+    from pymatgen.util.typing import PathLike
+
+__author__ = "Pymatgen Development Team"
+
+# Magic and format version of files written by StructureArray.save
+_MAGIC = b"PMGSTRAR"
+_FORMAT_VERSION = 1
+
+
+class SitePropertyColumn(NamedTuple):
+    """A numeric site property stored as one array over the sites of all structures.
+
+    Attributes:
+        values (NDArray): Values of all sites, of shape (n_sites, ...). Sites of
+            structures without the property hold zeros.
+        present (NDArray): Boolean mask of the structures that have the property.
+        as_array (bool): Whether the values of the sites were numpy arrays (else
+            they are restored as Python objects).
+    """
+
+    values: NDArray
+    present: NDArray[np.bool_]
+    as_array: bool = False
+
+
+class StructureArray(collections.abc.Sequence):
+    """Columnar storage of a sequence of structures.
+
+    Instead of nested per-site dicts, the lattices, the concatenated fractional
+    coordinates of all sites, indices into a table of unique species, the site
+    offsets of each structure and numeric site properties are each held in a single
+    contiguous array. Site properties that are not numeric arrays, site labels and
+    structure-level properties are kept as a small JSON document per structure.
+
+    StructureArray.save writes these arrays into a single binary file. Loading it with
+    mmap=True only maps the file into memory, so opening is fast regardless of its
+    size, and indexing parses only the structure that is asked for.
+    """
+
+    def __init__(
+        self,
+        lattices: NDArray[np.float64],
+        frac_coords: NDArray[np.float64],
+        site_offsets: NDArray[np.int64],
+        species_indices: NDArray[np.int32],
+        species_table: list[Composition],
+        charges: NDArray[np.float64] | None = None,
+        pbc: NDArray[np.bool_] | None = None,
+        site_properties: dict[str, SitePropertyColumn] | None = None,
+        metadata: NDArray[np.uint8] | None = None,
+        metadata_offsets: NDArray[np.int64] | None = None,
+    ) -> None:
+        """
+        Args:
+            lattices (NDArray): Lattice matrices of shape (n_structures, 3, 3).
+            frac_coords (NDArray): Fractional coords of all sites, of shape (n_sites, 3).
+            site_offsets (NDArray): Structure i holds sites site_offsets[i] to
+                site_offsets[i + 1], shape (n_structures + 1,).
+            species_indices (NDArray): Index into species_table of each site.
+            species_table (list[Composition]): Unique species compositions of the sites.
+            charges (NDArray): Charge of each structure. Defaults to neutral.
+            pbc (NDArray): Periodic boundary conditions of each structure, of shape
+                (n_structures, 3). Defaults to periodic in all directions.
+            site_properties (dict[str, SitePropertyColumn]): Numeric site properties.
+            metadata (NDArray): Concatenated UTF-8 JSON documents with the
+                remaining properties of each structure.
+            metadata_offsets (NDArray): Offsets of the JSON document of each
+                structure in metadata, shape (n_structures + 1,).
+        """
+        n_structures = len(lattices)
+        if len(site_offsets) != n_structures + 1 or site_offsets[-1] != len(frac_coords):
+            raise ValueError(f"site_offsets must have {n_structures + 1} entries ending at {len(frac_coords)}")
+        if len(species_indices) != len(frac_coords):
+            raise ValueError(f"{len(species_indices)=} != {len(frac_coords)=}")
+
+        self.lattices = lattices
+        self.frac_coords = frac_coords
+        self.site_offsets = site_offsets
+        self.species_indices = species_indices
+        self.species_table = species_table
+        self.charges = np.zeros(n_structures) if charges is None else charges
+        self.pbc = np.ones((n_structures, 3), dtype=bool) if pbc is None else pbc
+        self.site_properties = site_properties or {}
+        self.metadata = np.frombuffer(b"{}" * n_structures, dtype=np.uint8) if metadata is None else metadata
+        self.metadata_offsets = (
+            np.arange(0, 2 * n_structures + 1, 2, dtype=np.int64) if metadata_offsets is None else metadata_offsets
+        )
+
+    def __len__(self) -> int:
+        """Number of structures."""
+        return len(self.lattices)
+
+    @overload
+    def __getitem__(self, idx: int) -> Structure: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Structure]: ...
+
+    def __getitem__(self, idx: int | slice) -> Structure | list[Structure]:
+        """Get the structure at an index, or a list of structures for a slice."""
+        if isinstance(idx, slice):
+            return [self.get_structure(jdx) for jdx in range(*idx.indices(len(self)))]
+        return self.get_structure(idx)
+
+    def __iter__(self) -> Iterator[Structure]:
+        """Iterator over the structures."""
+        for idx in range(len(self)):
+            yield self.get_structure(idx)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n_structures={len(self)}, n_sites={self.n_sites})"
+
+    @property
+    def n_sites(self) -> int:
+        """Total number of sites of all structures."""
+        return len(self.frac_coords)
+
+    def get_structure(self, idx: int) -> Structure:
+        """Get the structure at an index, only reading the data of this structure.
+
+        Args:
+            idx (int): Index of the structure.
+
+        Returns:
+            Structure
+        """
+        n_structures = len(self)
+        if not -n_structures <= idx < n_structures:
+            raise IndexError(f"index={idx} out of range for {n_structures} structures")
+        idx %= n_structures
+
+        start, end = int(self.site_offsets[idx]), int(self.site_offsets[idx + 1])
+        metadata = self._get_metadata(idx)
+
+        site_properties = {}
+        for key, column in self.site_properties.items():
+            if column.present[idx]:
+                values = column.values[start:end]
+                site_properties[key] = [np.array(val) for val in values] if column.as_array else values.tolist()
+        site_properties |= metadata.get("site_properties", {})
+
+        species_table = self.species_table
+        return Structure(
+            Lattice(self.lattices[idx], pbc=tuple(self.pbc[idx].tolist())),
+            [species_table[type_idx] for type_idx in self.species_indices[start:end].tolist()],
+            np.array(self.frac_coords[start:end], dtype=np.float64),
+            charge=float(self.charges[idx]),
+            site_properties=site_properties,
+            labels=metadata.get("labels"),
+            properties=metadata.get("properties"),
+        )
+
+    def _get_metadata(self, idx: int) -> dict[str, Any]:
+        """Decode the JSON document of the remaining properties of a structure."""
+        start, end = self.metadata_offsets[idx], self.metadata_offsets[idx + 1]
+        return json.loads(self.metadata[start:end].tobytes(), cls=MontyDecoder)
+
+    @classmethod
+    def from_structures(cls, structures: Iterable[IStructure]) -> Self:
+        """Create a StructureArray from structures.
+
+        Args:
+            structures (Iterable[IStructure]): Structures to store.
+
+        Returns:
+            StructureArray
+        """
+        lattices: list[NDArray[np.float64]] = []
+        pbcs: list[tuple[bool, bool, bool]] = []
+        charges: list[float] = []
+        all_frac_coords: list[NDArray[np.float64]] = []
+        all_species_indices: list[list[int]] = []
+        species_table: dict[Composition, int] = {}
+        species_strings: list[str] = []
+        all_metadata: list[dict[str, Any]] = []
+        # Site property key -> (structure index, values) of the structures having it
+        site_props: dict[str, list[tuple[int, list]]] = {}
+
+        for struct_idx, struct in enumerate(structures):
+            lattices.append(struct.lattice.matrix)
+            pbcs.append(struct.pbc)
+            charges.append(struct.charge)
+            all_frac_coords.append(struct.frac_coords)
+
+            species_indices: list[int] = []
+            # Sites usually share Composition objects, so look up each object once
+            seen: dict[int, int] = {}
+            for comp in struct.species_and_occu:
+                if (type_idx := seen.get(id(comp))) is None:
+                    if (type_idx := species_table.get(comp)) is None:
+                        type_idx = species_table[comp] = len(species_table)
+                        species_strings.append(Site(comp, np.zeros(3), skip_checks=True).species_string)
+                    seen[id(comp)] = type_idx
+                species_indices.append(type_idx)
+            all_species_indices.append(species_indices)
+
+            metadata: dict[str, Any] = {}
+            labels = struct.labels
+            if any(label != species_strings[type_idx] for label, type_idx in zip(labels, species_indices, strict=True)):
+                metadata["labels"] = labels
+            if struct.properties:
+                metadata["properties"] = struct.properties
+            all_metadata.append(metadata)
+
+            for key, vals in struct.site_properties.items():
+                site_props.setdefault(key, []).append((struct_idx, list(vals)))
+
+        site_offsets = np.zeros(len(lattices) + 1, dtype=np.int64)
+        site_offsets[1:] = np.cumsum([len(species_indices) for species_indices in all_species_indices])
+
+        site_property_columns = {}
+        for key, struct_vals in site_props.items():
+            column = _get_site_property_column(struct_vals, site_offsets)
+            if column is not None:
+                site_property_columns[key] = column
+            else:
+                for struct_idx, vals in struct_vals:
+                    all_metadata[struct_idx].setdefault("site_properties", {})[key] = vals
+
+        metadata_docs = [json.dumps(metadata, cls=MontyEncoder).encode() for metadata in all_metadata]
+        metadata_offsets = np.zeros(len(metadata_docs) + 1, dtype=np.int64)
+        metadata_offsets[1:] = np.cumsum([len(doc) for doc in metadata_docs])
+
+        return cls(
+            lattices=np.reshape(lattices, (-1, 3, 3)).astype(np.float64),
+            frac_coords=np.concatenate(all_frac_coords) if all_frac_coords else np.zeros((0, 3)),
+            site_offsets=site_offsets,
+            species_indices=np.fromiter(
+                (type_idx for species_indices in all_species_indices for type_idx in species_indices),
+                dtype=np.int32,
+                count=site_offsets[-1],
+            ),
+            species_table=list(species_table),
+            charges=np.array(charges, dtype=np.float64),
+            pbc=np.reshape(pbcs, (-1, 3)).astype(bool),
+            site_properties=site_property_columns,
+            metadata=np.frombuffer(b"".join(metadata_docs), dtype=np.uint8),
+            metadata_offsets=metadata_offsets,
+        )
+
+    def save(self, filename: PathLike) -> None:
+        """Write the StructureArray to a binary file.
+
+        Args:
+            filename (PathLike): Path of the file.
+        """
+        arrays: dict[str, NDArray] = {
+            "lattices": self.lattices,
+            "pbc": self.pbc,
+            "charges": self.charges,
+            "site_offsets": self.site_offsets,
+            "frac_coords": self.frac_coords,
+            "species_indices": self.species_indices,
+            "metadata": self.metadata,
+            "metadata_offsets": self.metadata_offsets,
+        }
+        for key, column in self.site_properties.items():
+            arrays[f"site_properties/{key}/values"] = column.values
+            arrays[f"site_properties/{key}/present"] = column.present
+
+        header = {
+            "format_version": _FORMAT_VERSION,
+            "species": [Site(comp, np.zeros(3), skip_checks=True).as_dict()["species"] for comp in self.species_table],
+            "site_properties": {key: {"as_array": column.as_array} for key, column in self.site_properties.items()},
+        }
+        write_array_file(filename, _MAGIC, header, arrays)
+
+    @classmethod
+    def load(cls, filename: PathLike, mmap: bool = True) -> Self:
+        """Load a StructureArray written by StructureArray.save.
+
+        Args:
+            filename (PathLike): Path of the file.
+            mmap (bool): Whether to memory-map the file (read-only) instead of reading
+                it into memory. Only the parts of the file that are accessed are then
+                actually read. Defaults to True.
+
+        Returns:
+            StructureArray
+        """
+        header, arrays = read_array_file(filename, _MAGIC, mmap=mmap)
+        if header["format_version"] > _FORMAT_VERSION:
+            raise ValueError(f"Unsupported StructureArray format version {header['format_version']}")
+
+        return cls(
+            lattices=arrays["lattices"],
+            frac_coords=arrays["frac_coords"],
+            site_offsets=arrays["site_offsets"],
+            species_indices=arrays["species_indices"],
+            species_table=[
+                Site.from_dict({"species": species, "xyz": [0, 0, 0]}).species for species in header["species"]
+            ],
+            charges=arrays["charges"],
+            pbc=arrays["pbc"],
+            site_properties={
+                key: SitePropertyColumn(
+                    arrays[f"site_properties/{key}/values"],
+                    arrays[f"site_properties/{key}/present"],
+                    as_array=spec["as_array"],
+                )
+                for key, spec in header["site_properties"].items()
+            },
+            metadata=arrays["metadata"],
+            metadata_offsets=arrays["metadata_offsets"],
+        )
+
+
+def _get_site_property_column(
+    struct_vals: list[tuple[int, list]],
+    site_offsets: NDArray[np.int64],
+) -> SitePropertyColumn | None:
+    """Store the values of a site property as a column if they are numeric arrays of the
+    same dtype and shape in all structures having the property, else return None.
+    """
+    arrays = []
+    for _, vals in struct_vals:
+        try:
+            arr = np.asarray(vals)
+        except ValueError:  # ragged values
+            return None
+        if arr.dtype.kind not in "biuf" or arr.shape[:1] != (len(vals),):
+            return None
+        arrays.append(arr)
+    if any(arr.dtype != arrays[0].dtype or arr.shape[1:] != arrays[0].shape[1:] for arr in arrays):
+        return None
+
+    values = np.zeros((site_offsets[-1], *arrays[0].shape[1:]), dtype=arrays[0].dtype)
+    present = np.zeros(len(site_offsets) - 1, dtype=bool)
+    for (struct_idx, _), arr in zip(struct_vals, arrays, strict=True):
+        values[site_offsets[struct_idx] : site_offsets[struct_idx + 1]] = arr
+        present[struct_idx] = True
+
+    as_array = all(isinstance(val, np.ndarray) for _, vals in struct_vals for val in vals)
+    return SitePropertyColumn(values, present, as_array=as_array)
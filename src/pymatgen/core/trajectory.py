@@ -15,7 +15,16 @@ import numpy as np
 from monty.io import zopen
 from monty.json import MSONable
 
-from pymatgen.core.structure import Composition, DummySpecies, Element, Lattice, Molecule, Species, Structure
+from pymatgen.core.structure import (
+    Composition,
+    DummySpecies,
+    Element,
+    Lattice,
+    Molecule,
+    NeighborList,
+    Species,
+    Structure,
+)
 from pymatgen.io.ase import NO_ASE_ERR, AseAtomsAdaptor
 
 if NO_ASE_ERR is None:
@@ -28,6 +37,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
     from typing import Any
 
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.util.typing import PathLike, SitePropsType
@@ -288,6 +298,40 @@ class Trajectory(MSONable):
 
         raise TypeError(f"bad index={frames!r}, expected one of [{', '.join(str(ValidIndex).split(' | '))}]")
 
+    def iter_neighbor_lists(
+        self,
+        cutoff: float,
+        skin: float = 0.3,
+        numerical_tol: float = 1e-8,
+    ) -> Iterator[NeighborList]:
+        """Iterator of the neighbor lists of all frames in the trajectory.
+
+        Uses a VerletNeighborList, so the neighbor search is only redone after some
+        atom has moved by more than skin / 2 (or the lattice has changed), and the
+        frames in between only filter the candidate pairs by distance. To analyze
+        frames and neighbors together, zip this with iteration over the trajectory,
+        e.g. zip(traj, traj.iter_neighbor_lists(3)).
+
+        Args:
+            cutoff (float): Neighbor cutoff radius in Angstrom.
+            skin (float): Extra search radius in Angstrom. Defaults to 0.3.
+            numerical_tol (float): Tolerance for the neighbor search. Defaults to 1e-8.
+
+        Yields:
+            NeighborList: Neighbors within cutoff of all sites of a frame, without self
+                pairs. Images refer to the fractional coords wrapped into the unit cell,
+                as in the Structures obtained by iterating over the trajectory.
+        """
+        self.to_positions()
+        verlet_list = VerletNeighborList(cutoff, skin=skin, numerical_tol=numerical_tol)
+
+        for idx in range(len(self)):
+            if self.lattice is None:
+                yield verlet_list.update(self.coords[idx])
+            else:
+                lattice = self.lattice if self.constant_lattice else self.lattice[idx]
+                yield verlet_list.update(np.mod(self.coords[idx], 1), lattice)
+
     def get_structure(self, idx: int) -> Structure | Trajectory:
         """Get structure at specified index.
 
@@ -877,3 +921,145 @@ class Trajectory(MSONable):
             temp_file.close()
 
         return ase_traj
+
+
+class VerletNeighborList:
+    """Verlet-style neighbor list for consecutive frames of a trajectory.
+
+    Candidate pairs are searched within cutoff + skin and each frame only filters them
+    by the cutoff. Since no pair distance can shrink by more than twice the largest
+    displacement, the candidates stay complete until some atom has moved by more than
+    skin / 2 since the last search, at which point they are rebuilt. A change of the
+    lattice also triggers a rebuild.
+    """
+
+    def __init__(self, cutoff: float, skin: float = 0.3, numerical_tol: float = 1e-8) -> None:
+        """
+        Args:
+            cutoff (float): Neighbor cutoff radius in Angstrom.
+            skin (float): Extra search radius in Angstrom. A larger skin makes rebuilds
+                rarer but each frame more expensive to filter. Defaults to 0.3.
+            numerical_tol (float): Tolerance for the neighbor search. Defaults to 1e-8.
+        """
+        if cutoff <= 0 or skin < 0:
+            raise ValueError(f"cutoff must be positive and skin non-negative, got {cutoff=}, {skin=}")
+
+        self.cutoff = cutoff
+        self.skin = skin
+        self.numerical_tol = numerical_tol
+        self.n_builds = 0
+
+        self._candidates: NeighborList | None = None
+        self._image_vectors: NDArray[np.float64] | None = None
+        self._ref_coords: NDArray[np.float64] | None = None
+        self._ref_lattice: NDArray[np.float64] | None = None
+
+    def update(self, coords: ArrayLike, lattice: ArrayLike | Lattice | None = None) -> NeighborList:
+        """Get the neighbor list of a frame, rebuilding the candidate pairs if needed.
+
+        Args:
+            coords: shape (N, 3). Fractional coords of the sites for periodic frames,
+                or Cartesian coords if lattice is None.
+            lattice: shape (3, 3). Lattice of the frame, or None for molecules.
+
+        Returns:
+            NeighborList: Neighbors within cutoff of all N sites, without self pairs.
+        """
+        coords = np.asarray(coords, dtype=float)
+        if isinstance(lattice, Lattice):
+            lattice = lattice.matrix
+        lattice = None if lattice is None else np.asarray(lattice, dtype=float)
+
+        if self._needs_rebuild(coords, lattice):
+            self._build(coords, lattice)
+        elif lattice is not None:
+            self._rebase_images(coords, lattice)
+
+        candidates = cast("NeighborList", self._candidates)
+        centers, points = candidates.center_indices, candidates.points_indices
+        cart_coords = coords if lattice is None else coords @ lattice
+        # np.take is much faster than fancy indexing for gathering rows
+        vectors = np.take(cart_coords, points, axis=0)
+        vectors -= np.take(cart_coords, centers, axis=0)
+        if self._image_vectors is not None:
+            vectors += self._image_vectors
+        sq_distances = np.einsum("ij,ij->i", vectors, vectors)
+
+        selected = np.flatnonzero(sq_distances <= self.cutoff**2)
+        center_indices = centers[selected]
+        return NeighborList(
+            center_indices=center_indices,
+            points_indices=points[selected],
+            images=np.take(candidates.images, selected, axis=0),
+            distances=np.sqrt(sq_distances[selected]),
+            vectors=np.take(vectors, selected, axis=0),
+            offsets=np.searchsorted(center_indices, np.arange(candidates.n_centers + 1)),
+        )
+
+    def _rebase_images(self, coords: NDArray[np.float64], lattice: NDArray[np.float64]) -> None:
+        """Update the images of pairs whose sites crossed the cell boundary since the
+        last build, so that the candidates refer to the current fractional coords.
+        """
+        shifts = np.round(coords - cast("np.ndarray", self._ref_coords))
+        moved = np.any(shifts != 0, axis=1)
+        if not moved.any():
+            return
+
+        candidates = cast("NeighborList", self._candidates)
+        centers, points = candidates.center_indices, candidates.points_indices
+        affected = np.flatnonzero(moved[centers] | moved[points])
+        images = candidates.images[affected] + (shifts[centers[affected]] - shifts[points[affected]]).astype(np.int64)
+        # The candidates are private, so their arrays can be updated in place
+        candidates.images[affected] = images
+        self._image_vectors[affected] = images @ lattice  # type: ignore[index]
+        self._ref_coords = cast("np.ndarray", self._ref_coords) + shifts
+
+    def _needs_rebuild(self, coords: NDArray[np.float64], lattice: NDArray[np.float64] | None) -> bool:
+        """Whether the candidate pairs have to be searched again for a frame."""
+        if (
+            self._candidates is None
+            or self._ref_coords is None
+            or self._ref_coords.shape != coords.shape
+            or (lattice is None) != (self._ref_lattice is None)
+        ):
+            return True
+
+        if lattice is None:
+            displacements = coords - self._ref_coords
+        else:
+            if not np.allclose(lattice, self._ref_lattice, rtol=0, atol=self.numerical_tol):
+                return True
+            frac_disp = coords - self._ref_coords
+            displacements = (frac_disp - np.round(frac_disp)) @ lattice
+
+        return np.max(np.sum(displacements**2, axis=1), initial=0) > (self.skin / 2) ** 2
+
+    def _build(self, coords: NDArray[np.float64], lattice: NDArray[np.float64] | None) -> None:
+        """Search the candidate pairs within cutoff + skin."""
+        n_sites = len(coords)
+        if lattice is None:
+            structure = Structure(
+                Lattice(np.eye(3), pbc=(False, False, False)),
+                [DummySpecies()] * n_sites,
+                coords,
+                coords_are_cartesian=True,
+            )
+        else:
+            structure = Structure(Lattice(lattice), [DummySpecies()] * n_sites, coords)
+
+        centers, points, images, distances = structure.get_neighbor_list(
+            self.cutoff + self.skin, numerical_tol=self.numerical_tol, exclude_self=False
+        )
+        is_pair = (centers != points) | np.any(images != 0, axis=1)
+        self._candidates = NeighborList.from_pairs(
+            n_sites,
+            centers[is_pair],
+            points[is_pair],
+            images[is_pair],
+            distances[is_pair],
+            np.zeros((np.count_nonzero(is_pair), 3)),
+        )
+        self._image_vectors = None if lattice is None else self._candidates.images @ lattice
+        self._ref_coords = coords.copy()
+        self._ref_lattice = None if lattice is None else lattice.copy()
+        self.n_builds += 1
@@ -9,10 +9,11 @@ import copy
 import os
 import warnings
 from collections import defaultdict
+from functools import lru_cache
 from typing import TYPE_CHECKING, TypeAlias, cast
 
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from monty.design_patterns import cached_class
 from monty.dev import deprecated
 from monty.json import MSONable
@@ -32,7 +33,7 @@ from pymatgen.entries.computed_entries import (
 )
 from pymatgen.io.vasp.sets import MITRelaxSet, MPRelaxSet, VaspInputSet
 from pymatgen.util.due import Doi, due
-from pymatgen.util.joblib import set_python_warnings, tqdm_joblib
+from pymatgen.util.joblib import tqdm_joblib
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -710,15 +711,24 @@ class Compatibility(MSONable, abc.ABC):
                 if not ignore_entry:
                     processed_entry_list.append(entry)
         elif not inplace:
-            # set python warnings to ignore otherwise warnings will be printed multiple times
-            with (
-                tqdm_joblib(tqdm(total=len(entries), disable=not verbose)),
-                set_python_warnings("ignore"),
-            ):
-                results = Parallel(n_jobs=n_workers)(
-                    delayed(self._process_entry_inplace)(entry, clean, on_error) for entry in entries
+            # Entries with the same chemistry are processed in the same batch to share the
+            # caches of the worker, e.g. of oxidation state guesses
+            order = sorted(range(len(entries)), key=lambda idx: entries[idx].composition.reduced_formula)
+            batches = [batch for batch in np.array_split(order, 4 * effective_n_jobs(n_workers)) if len(batch)]
+            with tqdm_joblib(tqdm(total=len(batches), disable=not verbose)):
+                batch_results = Parallel(n_jobs=n_workers)(
+                    delayed(self._process_entries_batch)([entries[idx] for idx in batch], clean, on_error)
+                    for batch in batches
                 )
-            for result in results:
+            results: list = [None] * len(entries)
+            for batch, batch_result in zip(batches, batch_results, strict=True):
+                for idx, result in zip(batch, batch_result, strict=True):
+                    results[idx] = result
+
+            for result, caught_warnings in results:
+                # Raise the warnings recorded in the workers in the order of the entries
+                for warning in caught_warnings:
+                    warnings.warn(warning, stacklevel=2)
                 if result is None:
                     continue
                 entry, ignore_entry = result
@@ -729,6 +739,27 @@ class Compatibility(MSONable, abc.ABC):
 
         return processed_entry_list
 
+    def _process_entries_batch(
+        self,
+        entries: list[AnyComputedEntry],
+        clean: bool,
+        on_error: Literal["ignore", "warn", "raise"],
+    ) -> list[tuple[tuple[AnyComputedEntry, bool] | None, list[Warning]]]:
+        """Process entries in a worker of process_entries, recording the warnings
+        raised for each entry so that they can be raised again in the main process.
+
+        Returns:
+            list[tuple[result, warnings]]: The result of _process_entry_inplace and
+                the warnings raised for each entry.
+        """
+        results = []
+        for entry in entries:
+            with warnings.catch_warnings(record=True) as caught_warnings:
+                warnings.simplefilter("always")
+                result = self._process_entry_inplace(entry, clean, on_error)
+            results.append((result, [warning.message for warning in caught_warnings]))
+        return results
+
     def explain(self, entry: ComputedEntry) -> None:
         """Print an explanation of the energy adjustments applied by the
         Compatibility class. Inspired by the "explain" methods in many database
@@ -1178,13 +1209,7 @@ class MaterialsProject2020Compatibility(Compatibility):
         # Composition.oxi_state_guesses(), e.g. {'Al': 3.0, 'S': 2.0, 'O': -2.0} for 'Al2SO4'
         if "oxidation_states" not in entry.data:
             # try to guess the oxidation states from composition
-            # for performance reasons, fail if the composition is too large
-            try:
-                oxi_states = entry.composition.oxi_state_guesses(max_sites=-20)
-            except ValueError:
-                oxi_states = ({},)
-
-            entry.data["oxidation_states"] = (oxi_states or ({},))[0]
+            entry.data["oxidation_states"] = dict(_guess_oxidation_states(tuple(comp.reduced_composition.items())))
 
         if entry.data["oxidation_states"] == {}:
             warnings.warn(
@@ -1265,6 +1290,29 @@ class MaterialsProject2020Compatibility(Compatibility):
         return adjustments
 
 
+@lru_cache(maxsize=4096)
+def _guess_oxidation_states(reduced_comp: tuple[tuple[Element, float], ...]) -> tuple[tuple[str, float], ...]:
+    """Most likely oxidation states of a composition for MaterialsProject2020Compatibility.
+    Memoized on the reduced composition, on which the guesses solely depend, since
+    guessing oxidation states is expensive for complex formulas.
+
+    Args:
+        reduced_comp (tuple[tuple[Element, float], ...]): (element, amount) pairs of the
+            reduced composition.
+
+    Returns:
+        tuple[tuple[str, float], ...]: (element, oxidation state) pairs, empty if no
+            oxidation states could be guessed.
+    """
+    # for performance reasons, fail if the composition is too large
+    try:
+        oxi_states = Composition(dict(reduced_comp)).oxi_state_guesses(max_sites=-20)
+    except ValueError:
+        oxi_states = ({},)
+
+    return tuple((oxi_states or ({},))[0].items())
+
+
 class MITCompatibility(CorrectionsList):
     """This class implements the GGA/GGA+U mixing scheme, which allows mixing of
     entries. Note that this should only be used for VASP calculations using the
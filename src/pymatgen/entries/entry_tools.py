@@ -15,24 +15,29 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from monty.io import zopen
 from monty.json import MontyDecoder, MontyEncoder, MSONable
 
 from pymatgen.analysis.phase_diagram import PDEntry
-from pymatgen.analysis.structure_matcher import SpeciesComparator, StructureMatcher
+from pymatgen.analysis.structure_matcher import SpeciesComparator, StructureIndex, StructureMatcher
 from pymatgen.core import Composition, Element
+from pymatgen.entries.computed_entries import ComputedEntry
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-    from typing import Literal
+    from collections.abc import Iterable, Iterator
+    from typing import IO, Literal
 
     from typing_extensions import Self
 
     from pymatgen.entries import Entry
-    from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
-    from pymatgen.util.typing import SpeciesLike
+    from pymatgen.entries.computed_entries import ComputedStructureEntry
+    from pymatgen.util.typing import PathLike, SpeciesLike
 
 logger = logging.getLogger(__name__)
 
+# whitespace and commas separating the objects of a JSON array or JSON Lines file
+_JSON_SEPARATOR = re.compile(r"[\s,]*")
+
 
 def _get_host(structure, species_to_remove):
     if species_to_remove:
@@ -57,32 +62,32 @@ def _perform_grouping(args):
 
     entries = json.loads(entries_json, cls=MontyDecoder)
     hosts = json.loads(hosts_json, cls=MontyDecoder)
-    unmatched = list(zip(entries, hosts, strict=True))
-    while len(unmatched) > 0:
-        ref_host = unmatched[0][1]
-        logger.info(f"Reference tid = {unmatched[0][0].entry_id}, formula = {ref_host.formula}")
-        ref_formula = ref_host.reduced_formula
-        logger.info(f"Reference host = {ref_formula}")
-        matches = [unmatched[0]]
-        for idx in range(1, len(unmatched)):
-            test_host = unmatched[idx][1]
-            logger.info(f"Testing tid = {unmatched[idx][0].entry_id}, formula = {test_host.formula}")
-            test_formula = test_host.reduced_formula
-            logger.info(f"Test host = {test_formula}")
-            matcher = StructureMatcher(
-                ltol=ltol,
-                stol=stol,
-                angle_tol=angle_tol,
-                primitive_cell=primitive_cell,
-                scale=scale,
-                comparator=comparator,
-            )
-            if matcher.fit(ref_host, test_host):
-                logger.info("Fit found")
-                matches.append(unmatched[idx])
-        groups.append(json.dumps([m[0] for m in matches], cls=MontyEncoder))
-        unmatched = list(filter(lambda x: x not in matches, unmatched))
-        logger.info(f"{len(unmatched)} unmatched remaining")
+    matcher = StructureMatcher(
+        ltol=ltol,
+        stol=stol,
+        angle_tol=angle_tol,
+        primitive_cell=primitive_cell,
+        scale=scale,
+        comparator=comparator,
+    )
+    # Only fit the hosts sharing the invariants of each reference host. They are
+    # fitted with the reference host first as fit is not exactly symmetric.
+    index = StructureIndex(matcher)
+    index.add_structures(hosts)
+
+    grouped: set[int] = set()
+    for ref_idx, (ref_entry, ref_host) in enumerate(zip(entries, hosts, strict=True)):
+        if ref_idx in grouped:
+            continue
+        logger.info(f"Reference tid = {ref_entry.entry_id}, formula = {ref_host.formula}")
+        matches = [ref_idx]
+        for idx in index.get_candidates(ref_host):
+            if idx > ref_idx and idx not in grouped and matcher.fit(ref_host, hosts[idx]):
+                matches.append(idx)
+        grouped.update(matches)
+        logger.info(f"{len(matches) - 1} fits found")
+        groups.append(json.dumps([entries[idx] for idx in matches], cls=MontyEncoder))
+        logger.info(f"{len(entries) - len(grouped)} unmatched remaining")
 
 
 def group_entries_by_structure(
@@ -177,6 +182,37 @@ def group_entries_by_structure(
     return entry_groups
 
 
+def _iter_json_objects(file: IO[str], chunk_size: int = 2**20) -> Iterator:
+    """Iterate over the JSON values in a text stream holding either one value per
+    line (JSON Lines) or a JSON array, reading chunk_size characters at a time.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    while not buffer and (chunk := file.read(chunk_size)):
+        buffer = chunk.lstrip()
+    is_array = buffer.startswith("[")
+    pos = int(is_array)
+    while True:
+        pos = _JSON_SEPARATOR.match(buffer, pos).end()  # type: ignore[union-attr]
+        if is_array and buffer.startswith("]", pos):
+            return
+        try:
+            if pos == len(buffer):
+                raise json.JSONDecodeError("Expecting value", buffer, pos)
+            obj, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # the value is incomplete, or the buffer is exhausted; read at least as much
+            # as is pending so a value larger than chunk_size is re-decoded O(log n) times
+            chunk = file.read(max(chunk_size, len(buffer) - pos))
+            if not chunk:
+                if pos == len(buffer) and not is_array:
+                    return
+                raise
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield obj
+
+
 def group_entries_by_composition(entries, sort_by_e_per_atom=True):
     """Given a sequence of Entry-like objects, group them by composition and
         optionally sort by energy above hull.
@@ -328,6 +364,59 @@ class EntrySet(collections.abc.MutableSet, MSONable):
                 row.append(str(entry.energy))
                 writer.writerow(row)
 
+    @staticmethod
+    def write_to_file(entries: Iterable[Entry], filename: PathLike) -> None:
+        """Write entries to a file one at a time, as one JSON-encoded entry per line
+        (JSON Lines), so that entries can be streamed from e.g. a generator. The file
+        can be read back with EntrySet.iter_from_file.
+
+        Args:
+            entries: Entries to write.
+            filename: Filename to write to. Note that if the filename ends with gz,
+                bz2 or xz, the relevant compression will be applied.
+        """
+        with zopen(filename, mode="wt", encoding="utf-8") as file:
+            for entry in entries:
+                file.write(f"{json.dumps(entry, cls=MontyEncoder)}\n")
+
+    @staticmethod
+    def iter_from_file(
+        filename: PathLike,
+        chemsys: Iterable[str] | None = None,
+        include_structure: bool = True,
+    ) -> Iterator[Entry]:
+        """Iterate over the entries in a file, decoding one entry at a time instead of
+        loading the whole file. This allows e.g. building a PhaseDiagram of a single
+        chemical system, or processing entries with a Compatibility scheme in batches,
+        from files larger than the available memory.
+
+        Args:
+            filename: Filename to read from, either written by EntrySet.write_to_file or
+                holding a JSON list of entries (e.g. written with monty's dumpfn).
+                Compressed files (gz, bz2, xz) are supported.
+            chemsys: If given, only entries belonging to this chemical system (including
+                all sub systems) are returned, see get_subset_in_chemsys. Entries are
+                filtered on their composition, before the rest is decoded.
+            include_structure: Whether to decode the structures of entries that have one.
+                If False, structures are skipped and ComputedEntry are returned instead
+                of e.g. ComputedStructureEntry, which is faster and uses less memory.
+
+        Yields:
+            Entry: The entries in the file.
+        """
+        chem_sys = None if chemsys is None else set(chemsys)
+        decoder = MontyDecoder()
+        with zopen(filename, mode="rt", encoding="utf-8") as file:
+            for dct in _iter_json_objects(file):
+                if chem_sys is not None and not chem_sys.issuperset(
+                    sp.symbol for sp in Composition(dct["composition"])
+                ):
+                    continue
+                if not include_structure and "structure" in dct:
+                    yield ComputedEntry.from_dict(dct)
+                else:
+                    yield decoder.process_decoded(dct)
+
     @classmethod
     def from_csv(cls, filename: str) -> Self:
         """Imports PDEntries from a csv.
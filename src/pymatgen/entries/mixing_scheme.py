@@ -8,9 +8,13 @@ import copy
 import os
 import warnings
 from itertools import groupby
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
+from monty.json import jsanitize
+from monty.serialization import dumpfn, loadfn
 
 from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.analysis.structure_matcher import StructureMatcher
@@ -23,6 +27,10 @@ from pymatgen.entries.compatibility import (
 from pymatgen.entries.computed_entries import ComputedStructureEntry, ConstantEnergyAdjustment
 from pymatgen.entries.entry_tools import EntrySet
 
+if TYPE_CHECKING:
+    from pymatgen.core import Structure
+    from pymatgen.util.typing import PathLike
+
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 __author__ = "Ryan Kingsbury"
@@ -123,6 +131,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         verbose: bool = False,
         inplace: bool = True,
         mixing_state_data=None,
+        n_workers: int = 1,
     ) -> list[AnyComputedEntry]:
         """Process a sequence of entries with the DFT mixing scheme. Note
         that this method will change the data of the original entries.
@@ -149,6 +158,8 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                 reasons. In general, it should always be left at the default value (None) to avoid
                 inconsistencies between the mixing state data and the properties of the
                 ComputedStructureEntry in entries.
+            n_workers (int): Number of parallel workers used to match structures when
+                generating the mixing state data. Defaults to 1 (serial).
 
         Returns:
             list[AnyComputedEntry]: Adjusted entries. Entries in the original list incompatible with
@@ -180,7 +191,7 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         if mixing_state_data is None:
             if verbose:
                 print("  Generating mixing state data from provided entries.")
-            mixing_state_data = self.get_mixing_state_data(entries_type_1 + entries_type_2)
+            mixing_state_data = self.get_mixing_state_data(entries_type_1 + entries_type_2, n_workers=n_workers)
 
         if verbose:
             # how many stable entries from run_type_1 do we have in run_type_2?
@@ -452,13 +463,37 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
             f"an edge case in {type(self).__name__}. Inspect your input carefully and post a bug report."
         )
 
-    def get_mixing_state_data(self, entries: list[ComputedStructureEntry]):
+    def get_mixing_state_data(
+        self,
+        entries: list[ComputedStructureEntry],
+        n_workers: int = 1,
+        pd_type_1: PhaseDiagram | None = None,
+        pd_type_2: PhaseDiagram | None = None,
+        cache_file: PathLike | None = None,
+    ):
         """Generate internal state data to be passed to get_adjustments.
 
+        Structures are bucketed by composition before matching, so each bucket can be
+        matched independently (and in parallel). For large entry sets that change
+        incrementally, the expensive parts can be reused between calls: pass phase
+        diagrams built ahead of time (e.g. kept up to date with PhaseDiagram.add_entries)
+        and a cache_file, in which case structures are only re-matched for compositions
+        whose set of entries changed since the cache was written.
+
         Args:
             entries: The list of ComputedStructureEntry to process. It is assumed that the entries have
                 already been filtered using _filter_and_sort_entries() to remove any irrelevant run types,
                 apply compat_1 and compat_2, and confirm that all have unique entry_id.
+            n_workers (int): Number of parallel workers used to match structures. Defaults to 1 (serial).
+            pd_type_1 (PhaseDiagram): Prebuilt PhaseDiagram of the run_type_1 entries. If None (default),
+                it is constructed from entries.
+            pd_type_2 (PhaseDiagram): Prebuilt PhaseDiagram of the run_type_2 entries. If None (default),
+                it is constructed from entries.
+            cache_file (PathLike): File (.json or .json.gz) in which the matched structure groups are
+                cached. If it exists and was written with the same structure_matcher and fuzzy_matching
+                settings, the groups of compositions with unchanged entry_ids are reused. The file is
+                (over)written with the groups of the current entries. Note that entries are identified
+                by entry_id only, so an entry whose structure changed must get a new entry_id.
 
         Returns:
             DataFrame: A pandas DataFrame that contains information associating structures from
@@ -498,23 +533,24 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
         entries_type_2 = [e for e in filtered_entries if e.parameters["run_type"] in self.valid_rtypes_2]
 
         # construct PhaseDiagram for each run_type, if possible
-        pd_type_1, pd_type_2 = None, None
-        try:
-            pd_type_1 = PhaseDiagram(entries_type_1)  # type: ignore[arg-type]
-        except ValueError:
-            warnings.warn(f"{self.run_type_1} entries do not form a complete PhaseDiagram.", stacklevel=2)
+        if pd_type_1 is None:
+            try:
+                pd_type_1 = PhaseDiagram(entries_type_1)  # type: ignore[arg-type]
+            except ValueError:
+                warnings.warn(f"{self.run_type_1} entries do not form a complete PhaseDiagram.", stacklevel=2)
 
-        try:
-            pd_type_2 = PhaseDiagram(entries_type_2)  # type: ignore[arg-type]
-        except ValueError:
-            warnings.warn(f"{self.run_type_2} entries do not form a complete PhaseDiagram.", stacklevel=2)
+        if pd_type_2 is None:
+            try:
+                pd_type_2 = PhaseDiagram(entries_type_2)  # type: ignore[arg-type]
+            except ValueError:
+                warnings.warn(f"{self.run_type_2} entries do not form a complete PhaseDiagram.", stacklevel=2)
 
         # Objective: loop through all the entries, group them by structure matching (or fuzzy structure matching
         # where relevant). For each group, put a row in a pandas DataFrame with the composition of the run_type_1 entry,
         # the run_type_2 entry, whether or not that entry is a ground state (not necessarily on the hull), its energy,
         # and the energy of the hull at that composition
         all_entries = list(entries_type_1) + list(entries_type_2)
-        row_list = []
+        entries_by_id = {entry.entry_id: entry for entry in all_entries}
         columns = [
             "formula",
             "spacegroup",
@@ -530,49 +566,59 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
             "hull_energy_2",
         ]
 
-        def _get_sg(struct) -> int:
-            """Helper function to get spacegroup with a loose tolerance."""
-            try:
-                return struct.get_space_group_info(symprec=0.1)[1]
-            except Exception:
-                return -1
-
-        # loop through all structures
-        # this logic follows emmet.builders.vasp.materials.MaterialsBuilder.filter_and_group_tasks
-        structures = []
-        for entry in all_entries:
-            struct = entry.structure
-            struct.entry_id = entry.entry_id
-            structures.append(struct)
-
-        # First group by composition, then by spacegroup number, then by structure matching
-        for comp, comp_group in groupby(sorted(structures, key=lambda s: s.composition), key=lambda s: s.composition):
-            l_comp_group = list(comp_group)
-            # group by spacegroup, then by number of sites (for diatmics) or by structure matching
-            for sg, pre_group in groupby(sorted(l_comp_group, key=_get_sg), key=_get_sg):
-                l_pre_group = list(pre_group)
-                if comp.reduced_formula in ["O2", "H2", "Cl2", "F2", "N2", "I", "Br", "H2O"] and self.fuzzy_matching:
-                    # group by number of sites
-                    for idx, site_group in groupby(sorted(l_pre_group, key=len), key=len):
-                        l_sitegroup = list(site_group)
-                        row_list.append(
-                            self._populate_df_row(
-                                l_sitegroup,
-                                comp,
-                                sg,
-                                idx,
-                                pd_type_1,
-                                pd_type_2,
-                                all_entries,
-                            )
-                        )
-                else:
-                    for group in self.structure_matcher.group_structures(l_pre_group):
-                        group = list(group)
-                        idx = len(group[0])
-                        # StructureMatcher.group_structures returns a list of lists,
-                        # so each group should be a list containing matched structures
-                        row_list.append(self._populate_df_row(group, comp, sg, idx, pd_type_1, pd_type_2, all_entries))
+        # First group by composition, then match the structures within each composition
+        buckets = [
+            (comp, [entry.entry_id for entry in group])
+            for comp, group in groupby(
+                sorted(all_entries, key=lambda e: e.structure.composition), key=lambda e: e.structure.composition
+            )
+        ]
+
+        cached_groups = {}
+        if cache_file is not None and os.path.isfile(cache_file):
+            cache = loadfn(cache_file)
+            if cache["settings"]["fuzzy_matching"] == self.fuzzy_matching and jsanitize(
+                cache["settings"]["structure_matcher"].as_dict()
+            ) == jsanitize(self.structure_matcher.as_dict()):
+                cached_groups = cache["structure_groups"]
+
+        structure_groups: dict[str, dict] = {}
+        to_match = []
+        for comp, entry_ids in buckets:
+            cached = cached_groups.get(comp.formula)
+            if cached is not None and set(cached["entry_ids"]) == set(entry_ids):
+                structure_groups[comp.formula] = cached
+            else:
+                to_match.append((comp, entry_ids))
+
+        # dispatch the largest buckets first so the workers finish at about the same time
+        to_match.sort(key=lambda bucket: len(bucket[1]), reverse=True)
+        matched = Parallel(n_jobs=n_workers)(
+            delayed(_group_structures)(
+                entry_ids,
+                [entries_by_id[entry_id].structure for entry_id in entry_ids],
+                self.structure_matcher,
+                self.fuzzy_matching,
+            )
+            for _comp, entry_ids in to_match
+        )
+        for (comp, entry_ids), groups in zip(to_match, matched, strict=True):
+            structure_groups[comp.formula] = {"entry_ids": entry_ids, "groups": groups}
+
+        if cache_file is not None:
+            dumpfn(
+                {
+                    "settings": {"structure_matcher": self.structure_matcher, "fuzzy_matching": self.fuzzy_matching},
+                    "structure_groups": structure_groups,
+                },
+                cache_file,
+            )
+
+        row_list = []
+        for comp, _entry_ids in buckets:
+            for sg, n_sites, group_ids in structure_groups[comp.formula]["groups"]:
+                group = [entries_by_id[entry_id] for entry_id in group_ids]
+                row_list.append(self._populate_df_row(group, comp, sg, n_sites, pd_type_1, pd_type_2))
 
         mixing_state_data = pd.DataFrame(row_list, columns=columns)
         return mixing_state_data.sort_values(["formula", "energy_1", "spacegroup", "num_sites"], ignore_index=True)
@@ -671,28 +717,20 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
 
         return list(entries_type_1), list(entries_type_2)
 
-    def _populate_df_row(self, struct_group, comp, sg, n, pd_type_1, pd_type_2, all_entries):
+    def _populate_df_row(self, entry_group, comp, sg, n, pd_type_1, pd_type_2):
         """Helper function to populate a row of the mixing state DataFrame, given
-        a list of matched structures.
+        a list of entries with matching structures.
         """
         # within the group of matched structures, keep the lowest energy entry from
         # each run_type
         entries_type_1 = sorted(
-            (
-                e
-                for e in all_entries
-                if e.entry_id in [s.entry_id for s in struct_group] and e.parameters["run_type"] in self.valid_rtypes_1
-            ),
+            (e for e in entry_group if e.parameters["run_type"] in self.valid_rtypes_1),
             key=lambda x: x.energy_per_atom,
         )
         first_entry = entries_type_1[0] if len(entries_type_1) > 0 else None
 
         entries_type_2 = sorted(
-            (
-                e
-                for e in all_entries
-                if e.entry_id in [s.entry_id for s in struct_group] and e.parameters["run_type"] in self.valid_rtypes_2
-            ),
+            (e for e in entry_group if e.parameters["run_type"] in self.valid_rtypes_2),
             key=lambda x: x.energy_per_atom,
         )
         second_entry = entries_type_2[0] if len(entries_type_2) > 0 else None
@@ -753,3 +791,56 @@ class MaterialsProjectDFTMixingScheme(Compatibility):
                 f"{entry.correction / entry.composition.num_atoms:<9.3f} {pd.get_e_above_hull(entry):<9.3f}"
             )
         return
+
+
+def _get_sg(struct: Structure) -> int:
+    """Helper function to get spacegroup with a loose tolerance."""
+    try:
+        return struct.get_space_group_info(symprec=0.1)[1]
+    except Exception:
+        return -1
+
+
+def _group_structures(
+    entry_ids: list,
+    structures: list[Structure],
+    structure_matcher: StructureMatcher,
+    fuzzy_matching: bool,
+) -> list[tuple[int, int, list]]:
+    """Group structures sharing the same composition into distinct materials.
+
+    Args:
+        entry_ids (list): The entry_id of each structure.
+        structures (list[Structure]): Structures, all with the same composition.
+        structure_matcher (StructureMatcher): Used to match the structures.
+        fuzzy_matching (bool): Whether to group diatomic elements (and a few others) by
+            spacegroup and number of sites instead of structure matching.
+
+    Returns:
+        list[tuple[int, int, list]]: (spacegroup, number of sites, entry_ids) of each group.
+    """
+    # this logic follows emmet.builders.vasp.materials.MaterialsBuilder.filter_and_group_tasks
+    ids: dict[int, str] = {}
+    sg_structures = []
+    for entry_id, struct in zip(entry_ids, structures, strict=True):
+        if id(struct) in ids:  # the same Structure object may be shared by several entries
+            struct = struct.copy()
+        ids[id(struct)] = entry_id
+        sg_structures.append((_get_sg(struct), struct))
+    sg_structures.sort(key=lambda x: x[0])
+    reduced_formula = structures[0].composition.reduced_formula
+
+    groups = []
+    # group by spacegroup, then by number of sites (for diatmics) or by structure matching
+    for sg, pre_group in groupby(sg_structures, key=lambda x: x[0]):
+        l_pre_group = [struct for _sg, struct in pre_group]
+        if reduced_formula in ["O2", "H2", "Cl2", "F2", "N2", "I", "Br", "H2O"] and fuzzy_matching:
+            # group by number of sites
+            for n_sites, site_group in groupby(sorted(l_pre_group, key=len), key=len):
+                groups.append((sg, n_sites, [ids[id(struct)] for struct in site_group]))
+        else:
+            # StructureMatcher.group_structures returns a list of lists,
+            # so each group should be a list containing matched structures
+            for group in structure_matcher.group_structures(l_pre_group):
+                groups.append((sg, len(group[0]), [ids[id(struct)] for struct in group]))
+    return groups
@@ -64,10 +64,61 @@ class LinearAssignment:
         self._x = np.empty(self.n, dtype=np.int64)
         self._y = np.empty(self.n, dtype=np.int64)
 
-        self.min_cost = compute(self.n, self.c, self._x, self._y, self.epsilon)
+        cdef np.float_t[:, :] c = self.c
+        cdef np.int64_t[:] x = self._x
+        cdef np.int64_t[:] y = self._y
+        cdef np.float_t eps = self.epsilon
+        cdef int n = self.n
+        cdef np.float_t min_cost
+        with nogil:
+            min_cost = compute(n, c, x, y, eps)
+        self.min_cost = min_cost
         self.solution = self._x[:self.nx]
 
 
+def linear_assignment_batch(costs: np.ndarray, epsilon: float=1e-13):
+    """
+    Solve the Linear Assignment Problem for a stack of cost matrices of the
+    same shape, with the same LAPJV algorithm as LinearAssignment. The GIL is
+    released while solving, so batches can be processed in parallel by a
+    thread pool.
+
+    Args:
+        costs: The cost matrices, of shape (n_problems, nx, ny) with nx <= ny.
+            costs[k, i, j] is the cost of matching x[i] to y[j] in problem k.
+        epsilon: Tolerance for determining if solution vector is < 0
+
+    Returns:
+        min_costs (n_problems, ): The minimum cost of each matching.
+        solutions (n_problems, nx): The matching of the rows to columns of each
+            problem, as in LinearAssignment.solution.
+    """
+    orig_c = np.asarray(costs, dtype=np.float64)
+    if orig_c.ndim != 3:
+        raise ValueError("costs must be a stack of cost matrices")
+    n_problems, nx, ny = orig_c.shape
+    if nx > ny:
+        raise ValueError("cost matrix must have at least as many columns as rows")
+
+    # Pad rectangular problems with rows of zero cost
+    padded = np.zeros((n_problems, ny, ny), dtype=np.float64)
+    padded[:, :nx] = orig_c
+
+    cdef np.float_t[:, :, ::1] c = padded
+    cdef np.int64_t[:, ::1] x = np.empty((n_problems, ny), dtype=np.int64)
+    cdef np.int64_t[:, ::1] y = np.empty((n_problems, ny), dtype=np.int64)
+    cdef np.float_t[::1] min_costs = np.zeros(n_problems, dtype=np.float64)
+    cdef np.float_t eps = fabs(epsilon)
+    cdef Py_ssize_t k
+    cdef int n = ny
+
+    if n > 0:
+        with nogil:
+            for k in range(c.shape[0]):
+                min_costs[k] = compute(n, c[k], x[k], y[k], eps)
+    return np.asarray(min_costs), np.asarray(x)[:, :nx]
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef np.float_t compute(int size, np.float_t[:, :] c, np.int64_t[:] x, np.int64_t[:] y, np.float_t eps) nogil:
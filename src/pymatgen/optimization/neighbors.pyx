@@ -19,24 +19,23 @@ from libc.stdlib cimport free, malloc, realloc
 from libc.string cimport memset
 
 
-cdef void *safe_malloc(size_t size) except? NULL:
-    """Raise MemoryError if malloc fails."""
-    if size == 0:
-        return NULL
-    cdef void *ptr = malloc(size)
-    if ptr == NULL:
-        raise MemoryError(f"Memory allocation of {size} bytes failed!")
-    return ptr
-
-
-cdef void *safe_realloc(void *ptr_orig, size_t size) except? NULL:
-    """Raise MemoryError if realloc fails."""
-    if size == 0:
-        return NULL
-    cdef void *ptr = realloc(ptr_orig, size)
-    if ptr == NULL:
-        raise MemoryError(f"Realloc memory of {size} bytes failed!")
-    return ptr
+cdef struct NeighborList:
+    # Growable buffers of neighbor pairs
+    np.int64_t *index_1
+    np.int64_t *index_2
+    double *offsets
+    double *distances
+    Py_ssize_t count
+    Py_ssize_t capacity
+
+
+cdef struct Images:
+    # Growable buffers of the periodic images of the points around the centers
+    double *coords
+    double *offsets
+    np.int64_t *indices
+    Py_ssize_t count
+    Py_ssize_t capacity
 
 
 def find_points_in_spheres(
@@ -70,110 +69,368 @@ def find_points_in_spheres(
         offset_vectors (n, 3): The periodic image offsets for all_coords.
         distances (n, ).
     """
-    if r < min_r:
-        findex1, findex2, foffset_vectors, fdistances = find_points_in_spheres(
-            all_coords=all_coords, center_coords=center_coords,
-            r=min_r + tol, pbc=pbc, lattice=lattice, tol=tol, min_r=min_r)
-        mask = fdistances <= r
-        return findex1[mask], findex2[mask], foffset_vectors[mask], fdistances[
-            mask]
+    cdef:
+        NeighborList neighbors
+        int status = 0
+
+    check_lattice(lattice)
+    init_neighbor_list(&neighbors)
+    if all_coords.shape[0] > 0 and center_coords.shape[0] > 0:
+        with nogil:
+            status = _find_points_in_spheres(
+                &all_coords[0, 0], all_coords.shape[0],
+                &center_coords[0, 0], center_coords.shape[0],
+                r, &pbc[0], &lattice[0, 0], tol, min_r, &neighbors
+            )
+    return neighbor_list_to_arrays(&neighbors, status)
+
+
+def find_points_in_spheres_batch(
+        const double[:, ::1] all_coords,
+        const np.int64_t[::1] all_offsets,
+        const double[:, ::1] center_coords,
+        const np.int64_t[::1] center_offsets,
+        const double r,
+        const np.int64_t[:, ::1] pbc,
+        const double[:, :, ::1] lattices,
+        const double tol=1e-8,
+        const double min_r=1.0
+    ):
+    """Batched version of `find_points_in_spheres` for many independent sets of points,
+    e.g. the sites of many structures. The points of all sets are concatenated, and
+    set `i` is made of `all_coords[all_offsets[i]:all_offsets[i + 1]]` and
+    `center_coords[center_offsets[i]:center_offsets[i + 1]]` with lattice `lattices[i]`
+    and periodic boundaries `pbc[i]`. The GIL is released during the whole search,
+    so several batches can be processed in parallel by a thread pool.
+
+    Args:
+        all_coords: (np.ndarray[double, dim=2]) concatenated Cartesian coordinates
+            of the points of all sets.
+        all_offsets: (np.ndarray[np.int64_t, dim=1]) offsets of each set in all_coords,
+            of length n_sets + 1.
+        center_coords: (np.ndarray[double, dim=2]) concatenated Cartesian coordinates
+            of the centering points of all sets.
+        center_offsets: (np.ndarray[np.int64_t, dim=1]) offsets of each set in
+            center_coords, of length n_sets + 1.
+        r: (float) cutoff radius
+        pbc: (np.ndarray[np.int64_t, dim=2]) n_sets x 3 periodic boundaries
+        lattices: (np.ndarray[double, dim=3]) n_sets x 3 x 3 lattice matrices
+        tol: (float) numerical tolerance
+        min_r: (float) minimal cutoff to calculate the neighbor list directly,
+            see `find_points_in_spheres`.
 
+    Returns:
+        pair_offsets (n_sets + 1, ): The pairs of set i are pair_offsets[i]:pair_offsets[i + 1].
+        index1 (n, ): Indexes of center_coords, relative to the start of each set.
+        index2 (n, ): Indexes of all_coords, relative to the start of each set.
+        offset_vectors (n, 3): The periodic image offsets for all_coords.
+        distances (n, ).
+    """
+    cdef:
+        NeighborList neighbors
+        Py_ssize_t i_set
+        Py_ssize_t n_sets = lattices.shape[0]
+        np.int64_t n_total, n_center
+        int status = 0
+
+    if pbc.shape[0] != n_sets or pbc.shape[1] != 3:
+        raise ValueError("pbc must be a n_sets x 3 array")
+    check_offsets(np.asarray(all_offsets), all_coords.shape[0], n_sets)
+    check_offsets(np.asarray(center_offsets), center_coords.shape[0], n_sets)
+    for i_set in range(n_sets):
+        check_lattice(lattices[i_set])
+
+    pair_offsets = np.zeros(n_sets + 1, dtype=np.int64)
+    cdef np.int64_t[::1] pair_offsets_view = pair_offsets
+
+    init_neighbor_list(&neighbors)
+    with nogil:
+        for i_set in range(n_sets):
+            n_total = all_offsets[i_set + 1] - all_offsets[i_set]
+            n_center = center_offsets[i_set + 1] - center_offsets[i_set]
+            if n_total > 0 and n_center > 0:
+                status = _find_points_in_spheres(
+                    &all_coords[all_offsets[i_set], 0], n_total,
+                    &center_coords[center_offsets[i_set], 0], n_center,
+                    r, &pbc[i_set, 0], &lattices[i_set, 0, 0], tol, min_r, &neighbors
+                )
+                if status < 0:
+                    break
+            pair_offsets_view[i_set + 1] = neighbors.count
+    return (pair_offsets, *neighbor_list_to_arrays(&neighbors, status))
+
+
+cdef check_offsets(offsets, Py_ssize_t n_coords, Py_ssize_t n_sets):
+    """Raise ValueError unless offsets split n_coords coordinates into n_sets sets."""
+    if len(offsets) != n_sets + 1 or offsets[0] != 0 or offsets[n_sets] != n_coords or np.any(np.diff(offsets) < 0):
+        raise ValueError(f"Offsets must increase from 0 to {n_coords} in {n_sets} steps")
+
+
+cdef check_lattice(const double[:, ::1] lattice):
+    """Raise ValueError for singular lattices, which cannot be handled without the GIL."""
+    if lattice.shape[0] != 3 or lattice.shape[1] != 3:
+        raise ValueError(f"Lattice must be a 3x3 matrix, got shape ({lattice.shape[0]}, {lattice.shape[1]})")
+    if matrix_det(&lattice[0, 0]) == 0:
+        raise ValueError("Lattice matrix is singular")
+
+
+cdef void init_neighbor_list(NeighborList *neighbors) nogil:
+    neighbors.index_1 = NULL
+    neighbors.index_2 = NULL
+    neighbors.offsets = NULL
+    neighbors.distances = NULL
+    neighbors.count = 0
+    neighbors.capacity = 0
+
+
+cdef void free_neighbor_list(NeighborList *neighbors) nogil:
+    free(neighbors.index_1)
+    free(neighbors.index_2)
+    free(neighbors.offsets)
+    free(neighbors.distances)
+    init_neighbor_list(neighbors)
+
+
+cdef tuple neighbor_list_to_arrays(NeighborList *neighbors, int status):
+    """Copy the pairs to numpy arrays and free the buffers. Raise MemoryError
+    if the search failed to allocate memory.
+    """
+    cdef Py_ssize_t count = neighbors.count
+
+    if status < 0:
+        free_neighbor_list(neighbors)
+        raise MemoryError("A realloc of memory of failed!")
+
+    if count == 0:
+        result = (np.array([], dtype=np.int64), np.array([], dtype=np.int64),
+            np.array([[], [], []], dtype=float).T, np.array([], dtype=float))
+    else:
+        result = (
+            np.array(<np.int64_t[:count]>neighbors.index_1),
+            np.array(<np.int64_t[:count]>neighbors.index_2),
+            np.array(<double[:count, :3]>neighbors.offsets),
+            np.array(<double[:count]>neighbors.distances),
+        )
+    free_neighbor_list(neighbors)
+    return result
+
+
+cdef int add_neighbor(
+        NeighborList *neighbors,
+        np.int64_t index_1,
+        np.int64_t index_2,
+        const double[3] offset,
+        double distance
+    ) nogil:
+    """Append a pair to the neighbor list. Return -1 if the buffers cannot be grown."""
     cdef:
-        int i, j, k
-        unsigned int i_dim  # index of dimension
-        unsigned int i_pt  # index of point in all_coords (n_total)
+        Py_ssize_t capacity
+        Py_ssize_t count = neighbors.count
+        void *ptr
+
+    if count >= neighbors.capacity:
+        # Grow by doubling, allocating incrementally is ~3x faster than using vectors in cpp
+        capacity = neighbors.capacity * 2 if neighbors.capacity > 0 else 10000
+        ptr = realloc(neighbors.index_1, capacity * sizeof(np.int64_t))
+        if ptr == NULL:
+            return -1
+        neighbors.index_1 = <np.int64_t*> ptr
+        ptr = realloc(neighbors.index_2, capacity * sizeof(np.int64_t))
+        if ptr == NULL:
+            return -1
+        neighbors.index_2 = <np.int64_t*> ptr
+        ptr = realloc(neighbors.offsets, 3 * capacity * sizeof(double))
+        if ptr == NULL:
+            return -1
+        neighbors.offsets = <double*> ptr
+        ptr = realloc(neighbors.distances, capacity * sizeof(double))
+        if ptr == NULL:
+            return -1
+        neighbors.distances = <double*> ptr
+        neighbors.capacity = capacity
+
+    neighbors.index_1[count] = index_1
+    neighbors.index_2[count] = index_2
+    neighbors.offsets[3*count] = offset[0]
+    neighbors.offsets[3*count + 1] = offset[1]
+    neighbors.offsets[3*count + 2] = offset[2]
+    neighbors.distances[count] = distance
+    neighbors.count = count + 1
+    return 0
+
+
+cdef int add_image(
+        Images *images,
+        const double[3] coords,
+        np.int64_t i,
+        np.int64_t j,
+        np.int64_t k,
+        np.int64_t index
+    ) nogil:
+    """Append a periodic image of point `index` to images. Return -1 if the buffers cannot be grown."""
+    cdef:
+        Py_ssize_t capacity
+        Py_ssize_t count = images.count
+        void *ptr
+
+    if count >= images.capacity:
+        capacity = images.capacity * 2 if images.capacity > 0 else 1024
+        ptr = realloc(images.coords, 3 * capacity * sizeof(double))
+        if ptr == NULL:
+            return -1
+        images.coords = <double*> ptr
+        ptr = realloc(images.offsets, 3 * capacity * sizeof(double))
+        if ptr == NULL:
+            return -1
+        images.offsets = <double*> ptr
+        ptr = realloc(images.indices, capacity * sizeof(np.int64_t))
+        if ptr == NULL:
+            return -1
+        images.indices = <np.int64_t*> ptr
+        images.capacity = capacity
+
+    images.coords[3*count] = coords[0]
+    images.coords[3*count + 1] = coords[1]
+    images.coords[3*count + 2] = coords[2]
+    images.offsets[3*count] = i
+    images.offsets[3*count + 1] = j
+    images.offsets[3*count + 2] = k
+    images.indices[count] = index
+    images.count = count + 1
+    return 0
+
+
+cdef int _find_points_in_spheres(
+        const double *all_coords,
+        np.int64_t n_total,
+        const double *center_coords,
+        np.int64_t n_center,
+        double r,
+        const np.int64_t *pbc,
+        const double *lattice,
+        double tol,
+        double min_r,
+        NeighborList *neighbors
+    ) nogil:
+    """Append the neighbor pairs of one set of points to neighbors, see
+    `find_points_in_spheres`. Return -1 if memory allocation failed.
+    """
+    cdef:
+        # Fractional coordinates, image offset corrections and wrapped Cartesian
+        # coordinates of all points, and fractional coordinates of the centers
+        double *buffer = <double*> malloc((9 * n_total + 3 * n_center) * sizeof(double))
+        Images images
+        int status
+
+    if buffer == NULL:
+        return -1
+    images.coords = NULL
+    images.offsets = NULL
+    images.indices = NULL
+    images.count = 0
+    images.capacity = 0
+
+    status = search_points_in_spheres(
+        all_coords, n_total, center_coords, n_center, r, pbc, lattice, tol, min_r,
+        buffer, buffer + 3 * n_total, buffer + 6 * n_total, buffer + 9 * n_total,
+        &images, neighbors
+    )
+
+    free(buffer)
+    free(images.coords)
+    free(images.offsets)
+    free(images.indices)
+    return status
+
+
+cdef int search_points_in_spheres(
+        const double *all_coords,
+        np.int64_t n_total,
+        const double *center_coords,
+        np.int64_t n_center,
+        double r,
+        const np.int64_t *pbc,
+        const double *lattice,
+        double tol,
+        double min_r,
+        double *all_frac_coords,
+        double *offset_correction,
+        double *coords_in_cell,
+        double *frac_coords,
+        Images *images,
+        NeighborList *neighbors
+    ) nogil:
+    """Cell-list neighbor search, using the scratch buffers passed in."""
+    cdef:
+        np.int64_t i, j, k
+        int i_dim, di, dj, dk
+        np.int64_t i_pt, i_center  # indices of points in all_coords and center_coords
         double[3] max_rep  # maximum repetitions in each direction
 
         # Valid boundary, that is the minimum in center_coords - (r + tol)
         double[3] valid_min
         double[3] valid_max
-
         double ledge
 
-        unsigned int n_center = center_coords.shape[0]
-        unsigned int n_total = all_coords.shape[0]
-        np.int64_t nlattice = 1
-
         np.int64_t[3] max_bounds = [1, 1, 1]
         np.int64_t[3] min_bounds = [0, 0, 0]
-        double [:, ::1] frac_coords =  <double[:n_center, :3]> safe_malloc(
-            n_center * 3 * sizeof(double)
-        )
-        double[:, ::1] all_frac_coords = <double[:n_total, :3]> safe_malloc(
-            n_total * 3 * sizeof(double)
-        )
-        double[:, ::1] coords_in_cell = <double[:n_total, :3]> safe_malloc(
-            n_total * 3 * sizeof(double)
-        )
-        double[:, ::1] offset_correction = <double[:n_total, :3]> safe_malloc(
-            n_total * 3 * sizeof(double)
-        )
-        double[3][3] inv_lattice_arr
-        double[:, ::1] inv_lattice = inv_lattice_arr
-        double[3][3] reciprocal_lattice_arr = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
-        double[:, ::1] reciprocal_lattice = reciprocal_lattice_arr
-
-        unsigned int count = 0
-        unsigned int n_atoms = n_total
-        double *offsets_p_temp = <double*> safe_malloc(n_atoms * 3 * sizeof(double))
-        double *expanded_coords_p_temp = <double*> safe_malloc(
-            n_atoms * 3 * sizeof(double)
-        )
-        np.int64_t *indices_p_temp = <np.int64_t*> safe_malloc(n_atoms * sizeof(np.int64_t))
-        double coord_temp[3]
-        np.int64_t ncube[3]
-
-        np.int64_t[:, ::1] center_indices3 = <np.int64_t[:n_center, :3]> safe_malloc(
-            n_center*3*sizeof(np.int64_t)
-        )
-        np.int64_t[::1] center_indices1 = <np.int64_t[:n_center]> safe_malloc(n_center*sizeof(np.int64_t))
-
-        unsigned int malloc_chunk = 10000  # size of memory chunks to re-allocate dynamically
-        unsigned int failed_malloc = 0  # flag for failed reallocation within loops
-        np.int64_t *index_1 = <np.int64_t*> safe_malloc(malloc_chunk*sizeof(np.int64_t))
-        np.int64_t *index_2 = <np.int64_t*> safe_malloc(malloc_chunk*sizeof(np.int64_t))
-        double *offset_final = <double*> safe_malloc(3*malloc_chunk*sizeof(double))
-        double *distances = <double*> safe_malloc(malloc_chunk*sizeof(double))
-        np.int64_t cube_index_temp
-        np.int64_t link_index
+        double[9] inv_lattice
+        double[9] reciprocal_lattice
+        double[3] coord_temp
+        double[3] offset_temp
+        np.int64_t[3] ncube
+        np.int64_t[3] cube_index3
+        np.int64_t nb_cubes, cube_index, link_index, point_index
+        np.int64_t *head
+        np.int64_t *atom_indices
         double d_temp2
-        double r2 = r * r
+        double r2, search_r
+        int status = 0
+
+    if r < min_r:
+        # Calculate the neighbor list with min_r and discard those that have larger distances
+        r2 = (min_r + tol) * (min_r + tol)
+        search_r = min_r + tol
+    else:
+        r2 = r * r
+        search_r = r
 
-    if r < 0.1:
+    if search_r < 0.1:
         ledge = 0.1
     else:
-        ledge = r
+        ledge = search_r
 
-    get_max_and_min(center_coords, valid_max, valid_min)
+    get_max_and_min(center_coords, n_center, valid_max, valid_min)
     for i_dim in range(3):
-        valid_max[i_dim] = valid_max[i_dim] + r + tol
-        valid_min[i_dim] = valid_min[i_dim] - r - tol
+        valid_max[i_dim] = valid_max[i_dim] + search_r + tol
+        valid_min[i_dim] = valid_min[i_dim] - search_r - tol
 
     # Process PBC
-    get_frac_coords(lattice, inv_lattice, all_coords, offset_correction)
+    matrix_inv(lattice, inv_lattice)
+    matmul(all_coords, n_total, inv_lattice, offset_correction)
     for i_pt in range(n_total):
         for i_dim in range(3):
             if pbc[i_dim]:
                 # Only wrap atoms when this dimension is PBC
-                all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim] % 1
-                offset_correction[i_pt, i_dim] = offset_correction[i_pt, i_dim] - all_frac_coords[i_pt, i_dim]
+                all_frac_coords[3*i_pt + i_dim] = offset_correction[3*i_pt + i_dim] % 1
+                offset_correction[3*i_pt + i_dim] = (
+                    offset_correction[3*i_pt + i_dim] - all_frac_coords[3*i_pt + i_dim]
+                )
             else:
-                all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim]
-                offset_correction[i_pt, i_dim] = 0
+                all_frac_coords[3*i_pt + i_dim] = offset_correction[3*i_pt + i_dim]
+                offset_correction[3*i_pt + i_dim] = 0
 
     # Compute the reciprocal lattice in place
     get_reciprocal_lattice(lattice, reciprocal_lattice)
 
-    get_max_rep(reciprocal_lattice, max_rep, r)
+    get_max_rep(reciprocal_lattice, max_rep, search_r)
 
     # Get fractional coordinates of center points in place
-    get_frac_coords(lattice, inv_lattice, center_coords, frac_coords)
+    matmul(center_coords, n_center, inv_lattice, frac_coords)
 
-    get_bounds(frac_coords, max_rep, &pbc[0], max_bounds, min_bounds)
+    get_bounds(frac_coords, n_center, max_rep, pbc, max_bounds, min_bounds)
 
-    for i_dim in range(3):
-        nlattice *= (max_bounds[i_dim] - min_bounds[i_dim])
-    matmul(all_frac_coords, lattice, coords_in_cell)
+    matmul(all_frac_coords, n_total, lattice, coords_in_cell)
 
     # Get translated images, coordinates and indices
     for i in range(min_bounds[0], max_bounds[0]):
@@ -181,10 +438,10 @@ def find_points_in_spheres(
             for k in range(min_bounds[2], max_bounds[2]):
                 for i_pt in range(n_total):
                     for i_dim in range(3):
-                        coord_temp[i_dim] = <double>i * lattice[0, i_dim] + \
-                                        <double>j * lattice[1, i_dim] + \
-                                        <double>k * lattice[2, i_dim] + \
-                                        coords_in_cell[i_pt, i_dim]
+                        coord_temp[i_dim] = <double>i * lattice[i_dim] + \
+                                        <double>j * lattice[3 + i_dim] + \
+                                        <double>k * lattice[6 + i_dim] + \
+                                        coords_in_cell[3*i_pt + i_dim]
                     if (
                             (coord_temp[0] > valid_min[0]) &
                             (coord_temp[0] < valid_max[0]) &
@@ -193,339 +450,96 @@ def find_points_in_spheres(
                             (coord_temp[2] > valid_min[2]) &
                             (coord_temp[2] < valid_max[2])
                     ):
-                        offsets_p_temp[3*count] = i
-                        offsets_p_temp[3*count+1] = j
-                        offsets_p_temp[3*count+2] = k
-                        indices_p_temp[count] = i_pt
-                        expanded_coords_p_temp[3*count] = coord_temp[0]
-                        expanded_coords_p_temp[3*count+1] = coord_temp[1]
-                        expanded_coords_p_temp[3*count+2] = coord_temp[2]
-                        count += 1
-                        if count >= n_atoms:  # exceeding current memory
-                            n_atoms += n_atoms
-                            offsets_p_temp = <double*> realloc(
-                                offsets_p_temp, n_atoms * 3 * sizeof(double)
-                            )
-                            expanded_coords_p_temp = <double*> realloc(
-                                expanded_coords_p_temp, n_atoms * 3 * sizeof(double)
-                            )
-                            indices_p_temp = <np.int64_t*> realloc(
-                                indices_p_temp, n_atoms * sizeof(np.int64_t)
-                            )
-                        if (
-                                offset_final is NULL or
-                                expanded_coords_p_temp is NULL or
-                                indices_p_temp is NULL
-                        ):
-                            failed_malloc = 1
-                            break
-                else:
-                    continue
-                break
-            else:
-                continue
-            break
-        else:
-            continue
-        break
-
-    if failed_malloc:
-        raise MemoryError("A realloc of memory of failed!")
-    else:
-        failed_malloc = 0
+                        if add_image(images, coord_temp, i, j, k, i_pt) < 0:
+                            return -1
 
     # If no valid neighbors were found return empty
-    if count == 0:
-        free(&frac_coords[0, 0])
-        free(&all_frac_coords[0, 0])
-        free(&coords_in_cell[0, 0])
-        free(&offset_correction[0, 0])
-        free(&center_indices1[0])
-        free(&center_indices3[0, 0])
-
-        free(offsets_p_temp)
-        free(expanded_coords_p_temp)
-        free(indices_p_temp)
-
-        free(index_1)
-        free(index_2)
-        free(offset_final)
-        free(distances)
-
-        return (np.array([], dtype=np.int64), np.array([], dtype=np.int64),
-            np.array([[], [], []], dtype=float).T, np.array([], dtype=float))
-
-    n_atoms = count
-    cdef:
-        # Delete those beyond (min_center_coords - r - tol, max_center_coords + r + tol)
-        double *offsets_p = <double*> safe_realloc(
-            offsets_p_temp, count * 3 * sizeof(double)
-        )
-        double *expanded_coords_p = <double*> safe_realloc(
-            expanded_coords_p_temp, count * 3 * sizeof(double)
-        )
-        np.int64_t *indices_p = <np.int64_t*> safe_realloc(
-            indices_p_temp, count * sizeof(np.int64_t)
-        )
-
-        double[:, ::1] offsets = <double[:count, :3]> offsets_p
-        double[:, ::1] expanded_coords = <double[:count, :3]> expanded_coords_p
-        np.int64_t[::1] indices = <np.int64_t[:count]> indices_p
-
-        # Construct linked cell list
-        np.int64_t[:, ::1] all_indices3 = <np.int64_t[:n_atoms, :3]> safe_malloc(
-            n_atoms * 3 * sizeof(np.int64_t)
-        )
-        np.int64_t[::1] all_indices1 = <np.int64_t[:n_atoms]> safe_malloc(
-            n_atoms * sizeof(np.int64_t)
-        )
+    if images.count == 0:
+        return 0
 
+    # Construct linked cell list
     for i_dim in range(3):
         ncube[i_dim] = <np.int64_t>(ceil((valid_max[i_dim] - valid_min[i_dim]) / ledge))
-
-    compute_cube_index(expanded_coords, valid_min, ledge, all_indices3)
-    three_to_one(all_indices3, ncube[1], ncube[2], all_indices1)
-
-    cdef:
-        np.int64_t nb_cubes = ncube[0] * ncube[1] * ncube[2]
-        np.int64_t *head = <np.int64_t*> safe_malloc(nb_cubes*sizeof(np.int64_t))
-        np.int64_t *atom_indices = <np.int64_t*> safe_malloc(n_atoms*sizeof(np.int64_t))
-        np.int64_t[:, ::1] neighbor_map = <np.int64_t[:nb_cubes, :27]> safe_malloc(
-            nb_cubes * 27 * sizeof(np.int64_t)
-        )
-
-    memset(<void*>head, -1, nb_cubes*sizeof(np.int64_t))
-    memset(<void*>atom_indices, -1, n_atoms*sizeof(np.int64_t))
-
-    get_cube_neighbors(ncube, neighbor_map)
-    for i_pt in range(n_atoms):
-        atom_indices[i_pt] = head[all_indices1[i_pt]]
-        head[all_indices1[i_pt]] = i_pt
-
-    # Get center atoms' cube indices
-    compute_cube_index(center_coords, valid_min, ledge, center_indices3)
-    three_to_one(center_indices3, ncube[1], ncube[2], center_indices1)
-
-    count = 0
-    for i in range(n_center):
-        for j in range(27):
-            if neighbor_map[center_indices1[i], j] == -1:
-                continue
-            cube_index_temp = neighbor_map[center_indices1[i], j]
-            link_index = head[cube_index_temp]
-            while link_index != -1:
-                d_temp2 = distance2(expanded_coords, center_coords, link_index, i, 3)
-                if d_temp2 < r2 + tol:
-                    index_1[count] = i
-                    index_2[count] = indices[link_index]
-                    offset_final[3*count] = offsets[link_index, 0] - offset_correction[indices[link_index], 0]
-                    offset_final[3*count + 1] = offsets[link_index, 1] - offset_correction[indices[link_index], 1]
-                    offset_final[3*count + 2] = offsets[link_index, 2] - offset_correction[indices[link_index], 2]
-                    distances[count] = sqrt(d_temp2)
-
-                    count += 1
-                    # Increasing the memory size by allocating incrementally
-                    # malloc_chunk more memory locations, I found it 3x faster to do so
-                    # compared to using vectors in cpp
-                    if count >= malloc_chunk:
-                        malloc_chunk += malloc_chunk  # double the size
-                        index_1 = <np.int64_t*> realloc(index_1, malloc_chunk * sizeof(np.int64_t))
-                        index_2 = <np.int64_t*> realloc(index_2, malloc_chunk*sizeof(np.int64_t))
-                        offset_final = <double*> realloc(
-                            offset_final, 3*malloc_chunk*sizeof(double)
-                        )
-                        distances = <double*> realloc(
-                            distances, malloc_chunk*sizeof(double)
-                        )
-                        if (
-                                index_1 is NULL or index_2 is NULL or
-                                offset_final is NULL or distances is NULL
-                        ):
-                            failed_malloc = 1
-                            break
-                link_index = atom_indices[link_index]
-            else:
-                continue
+    nb_cubes = ncube[0] * ncube[1] * ncube[2]
+
+    head = <np.int64_t*> malloc(nb_cubes * sizeof(np.int64_t))
+    atom_indices = <np.int64_t*> malloc(images.count * sizeof(np.int64_t))
+    if head == NULL or atom_indices == NULL:
+        free(head)
+        free(atom_indices)
+        return -1
+    memset(<void*>head, -1, nb_cubes * sizeof(np.int64_t))
+
+    for i_pt in range(images.count):
+        compute_cube_index(&images.coords[3*i_pt], valid_min, ledge, ncube, cube_index3)
+        cube_index = three_to_one(cube_index3, ncube)
+        atom_indices[i_pt] = head[cube_index]
+        head[cube_index] = i_pt
+
+    for i_center in range(n_center):
+        compute_cube_index(&center_coords[3*i_center], valid_min, ledge, ncube, cube_index3)
+        # Loop over the 27 neighboring cubes of the center's cube
+        for di in range(-1, 2):
+            for dj in range(-1, 2):
+                for dk in range(-1, 2):
+                    if (
+                            (cube_index3[0] + di < 0) | (cube_index3[0] + di >= ncube[0]) |
+                            (cube_index3[1] + dj < 0) | (cube_index3[1] + dj >= ncube[1]) |
+                            (cube_index3[2] + dk < 0) | (cube_index3[2] + dk >= ncube[2])
+                    ):
+                        continue
+                    cube_index = (
+                        (cube_index3[0] + di) * ncube[1] * ncube[2] +
+                        (cube_index3[1] + dj) * ncube[2] +
+                        cube_index3[2] + dk
+                    )
+                    link_index = head[cube_index]
+                    while link_index != -1:
+                        d_temp2 = distance2(&images.coords[3*link_index], &center_coords[3*i_center])
+                        if d_temp2 < r2 + tol and (r >= min_r or sqrt(d_temp2) <= r):
+                            point_index = images.indices[link_index]
+                            for i_dim in range(3):
+                                offset_temp[i_dim] = (
+                                    images.offsets[3*link_index + i_dim] -
+                                    offset_correction[3*point_index + i_dim]
+                                )
+                            if add_neighbor(neighbors, i_center, point_index, offset_temp, sqrt(d_temp2)) < 0:
+                                status = -1
+                                break
+                        link_index = atom_indices[link_index]
+                    if status < 0:
+                        break
+                if status < 0:
+                    break
+            if status < 0:
+                break
+        if status < 0:
             break
-        else:
-            continue
-        break
 
-    if failed_malloc:
-        raise MemoryError("A realloc of memory of failed!")
-    else:
-        failed_malloc = 0
-
-    if count == 0:
-        py_index_1 = np.array([], dtype=np.int64)
-        py_index_2 = np.array([], dtype=np.int64)
-        py_offsets = np.array([[], [], []], dtype=float).T
-        py_distances = np.array([], dtype=float)
-    else:
-        # Resize to the actual size
-        index_1 = <np.int64_t*>safe_realloc(index_1, count * sizeof(np.int64_t))
-        index_2 = <np.int64_t*>safe_realloc(index_2, count*sizeof(np.int64_t))
-        offset_final = <double*>safe_realloc(offset_final, 3*count*sizeof(double))
-        distances = <double*>safe_realloc(distances, count*sizeof(double))
-
-        # Convert to python objects
-        py_index_1 = np.array(<np.int64_t[:count]>index_1)
-        py_index_2 = np.array(<np.int64_t[:count]>index_2)
-        py_offsets = np.array(<double[:count, :3]>offset_final)
-        py_distances = np.array(<double[:count]>distances)
-
-    # Free allocated memory
-    free(index_1)
-    free(index_2)
-    free(offset_final)
-    free(distances)
-    free(offsets_p)
-    free(expanded_coords_p)
-    free(indices_p)
     free(head)
     free(atom_indices)
-
-    free(&offset_correction[0, 0])
-    free(&frac_coords[0, 0])
-    free(&all_frac_coords[0, 0])
-    free(&coords_in_cell[0, 0])
-    free(&center_indices1[0])
-    free(&center_indices3[0, 0])
-    free(&neighbor_map[0, 0])
-
-    free(&all_indices3[0, 0])
-    free(&all_indices1[0])
-
-    return py_index_1, py_index_2, py_offsets, py_distances
-
-
-cdef void get_cube_neighbors(
-        np.int64_t[3] ncube,
-        np.int64_t[:, ::1] neighbor_map
-    ):
-    """
-    Get {cube_index: cube_neighbor_indices} map.
-    """
-    cdef:
-        int i, j, k
-        unsigned int count = 0
-        np.int64_t ncubes = ncube[0] * ncube[1] * ncube[2]
-        np.int64_t[::1] counts = <np.int64_t[:ncubes]> safe_malloc(ncubes * sizeof(np.int64_t))
-        np.int64_t[:, ::1] cube_indices_3d = <np.int64_t[:ncubes, :3]> safe_malloc(
-            ncubes*3*sizeof(np.int64_t)
-        )
-        np.int64_t[::1] cube_indices_1d = <np.int64_t[:ncubes]> safe_malloc(ncubes*sizeof(np.int64_t))
-
-        # Creating the memviews of c-arrays once substantially improves speed
-        # but for some reason it makes the runtime scaling with the number of
-        # atoms worse
-        np.int64_t[1][3] index3_arr
-        np.int64_t[:, ::1] index3 = index3_arr
-        np.int64_t[1] index1_arr
-        np.int64_t[::1] index1 = index1_arr
-
-        int n = 1
-        np.int64_t ntotal = (2 * n + 1) * (2 * n + 1) * (2 * n + 1)
-        np.int64_t[:, ::1] ovectors
-        np.int64_t *ovectors_p = <np.int64_t *> safe_malloc(ntotal * 3 * sizeof(np.int64_t))
-        unsigned int n_ovectors = compute_offset_vectors(ovectors_p, n)
-
-    # Resize to the actual size
-    ovectors_p = <np.int64_t *> safe_realloc(ovectors_p, n_ovectors * 3 * sizeof(np.int64_t))
-    ovectors = <np.int64_t[:n_ovectors, :3]>ovectors_p
-
-    memset(<void*>&neighbor_map[0, 0], -1, neighbor_map.shape[0] * 27 * sizeof(np.int64_t))
-
-    for i in range(ncubes):
-        counts[i] = 0
-
-    for i in range(ncube[0]):
-        for j in range(ncube[1]):
-            for k in range(ncube[2]):
-                cube_indices_3d[count, 0] = i
-                cube_indices_3d[count, 1] = j
-                cube_indices_3d[count, 2] = k
-                count += 1
-
-    three_to_one(cube_indices_3d, ncube[1], ncube[2], cube_indices_1d)
-
-    for i in range(ncubes):
-        for j in range(27):
-            index3[0, 0] = ovectors[j, 0] + cube_indices_3d[i, 0]
-            index3[0, 1] = ovectors[j, 1] + cube_indices_3d[i, 1]
-            index3[0, 2] = ovectors[j, 2] + cube_indices_3d[i, 2]
-            if (
-                    (index3[0, 0] < ncube[0]) &
-                    (index3[0, 0] >= 0) &
-                    (index3[0, 1] < ncube[1]) &
-                    (index3[0, 1] >= 0) &
-                    (index3[0, 2] < ncube[2]) &
-                    (index3[0, 2] >= 0)
-            ):
-                three_to_one(index3, ncube[1], ncube[2], index1)
-                neighbor_map[i, counts[i]] = index1[0]
-                counts[i] += 1
-
-    free(&cube_indices_3d[0, 0])
-    free(&cube_indices_1d[0])
-    free(&counts[0])
-    free(ovectors_p)
-
-
-cdef int compute_offset_vectors(
-        np.int64_t* ovectors,
-        np.int64_t n
-    ) nogil:
-    cdef:
-        int i, j, k, ind
-        int count = 0
-        double center[8][3] # center vertices coords
-        double offset[8][3]  # offsetted vertices
-
-    for i in range(2):
-        for j in range(2):
-            for k in range(2):
-                ind = i * 4 + j * 2 + k
-                center[ind][0] = i - 0.5
-                center[ind][1] = j - 0.5
-                center[ind][2] = k - 0.5
-
-    for i in range(-n, n + 1):
-        for j in range(-n, n + 1):
-            for k in range(-n, n + 1):
-                offset_cube(center, i, j, k, offset)
-                if distance_vertices(center, offset, n):
-                    ovectors[3*count] = i
-                    ovectors[3*count + 1] = j
-                    ovectors[3*count + 2] = k
-                    count += 1
-
-    return count
+    return status
 
 
 cdef double distance2(
-        const double[:, ::1] m1,
-        const double[:, ::1] m2,
-        np.int64_t index1,
-        np.int64_t index2,
-        np.int64_t size
+        const double *m1,
+        const double *m2
     ) nogil:
-    """Faster way to compute the distance squared by not using slice
-    but providing indices in each matrix.
-    """
+    """Squared distance between two 3d points."""
     cdef:
         int i
         double s = 0
 
-    for i in range(size):
-        s += (m1[index1, i] - m2[index2, i]) * (m1[index1, i] - m2[index2, i])
+    for i in range(3):
+        s += (m1[i] - m2[i]) * (m1[i] - m2[i])
     return s
 
 
 cdef void get_bounds(
-        const double[:, ::1] frac_coords,
+        const double *frac_coords,
+        np.int64_t n_points,
         const double[3] max_rep,
-        const np.int64_t[3] pbc,
+        const np.int64_t *pbc,
         np.int64_t[3] max_bounds,
         np.int64_t[3] min_bounds
     ) nogil:
@@ -538,7 +552,7 @@ cdef void get_bounds(
         double[3] max_fcoords
         double[3] min_fcoords
 
-    get_max_and_min(frac_coords, max_fcoords, min_fcoords)
+    get_max_and_min(frac_coords, n_points, max_fcoords, min_fcoords)
 
     for i_dim in range(3):
         min_bounds[i_dim] = 0
@@ -549,39 +563,28 @@ cdef void get_bounds(
             min_bounds[i_dim] = <np.int64_t>(floor(min_fcoords[i_dim] - max_rep[i_dim] - 1e-8))
             max_bounds[i_dim] = <np.int64_t>(ceil(max_fcoords[i_dim] + max_rep[i_dim] + 1e-8))
 
-cdef void get_frac_coords(
-        const double[:, ::1] lattice,
-        double[:, ::1] inv_lattice,
-        const double[:, ::1] cart_coords,
-        double[:, ::1] frac_coords
-    ) nogil:
-    """
-    Compute the fractional coordinates.
-    """
-    matrix_inv(lattice, inv_lattice)
-    matmul(cart_coords, inv_lattice, frac_coords)
-
 cdef void matmul(
-        const double[:, ::1] m1,
-        const double[:, ::1] m2,
-        double [:, ::1] out
+        const double *m1,
+        np.int64_t n_rows,
+        const double *m2,
+        double *out
     ) nogil:
     """
-    Matrix multiplication.
+    Multiplication of a n_rows x 3 matrix with a 3x3 matrix.
     """
     cdef:
-        int i, j, k
-        int m = m1.shape[0], n = m1.shape[1], l = m2.shape[1]
+        np.int64_t i
+        int j, k
 
-    for i in range(m):
-        for j in range(l):
-            out[i, j] = 0
-            for k in range(n):
-                out[i, j] += m1[i, k] * m2[k, j]
+    for i in range(n_rows):
+        for j in range(3):
+            out[3*i + j] = 0
+            for k in range(3):
+                out[3*i + j] += m1[3*i + k] * m2[3*k + j]
 
 cdef void matrix_inv(
-        const double[:, ::1] matrix,
-        double[:, ::1] inv
+        const double *matrix,
+        double *inv
     ) nogil:
     """
     Matrix inversion.
@@ -592,23 +595,23 @@ cdef void matrix_inv(
 
     for i in range(3):
         for j in range(3):
-            inv[i, j] = (matrix[(j+1)%3, (i+1)%3] * matrix[(j+2)%3, (i+2)%3] -
-                matrix[(j+2)%3, (i+1)%3] * matrix[(j+1)%3, (i+2)%3]) / det
+            inv[3*i + j] = (matrix[3*((j+1)%3) + (i+1)%3] * matrix[3*((j+2)%3) + (i+2)%3] -
+                matrix[3*((j+2)%3) + (i+1)%3] * matrix[3*((j+1)%3) + (i+2)%3]) / det
 
 cdef double matrix_det(
-        const double[:, ::1] matrix
+        const double *matrix
     ) nogil:
     """
     Matrix determinant.
     """
     return (
-        matrix[0, 0] * (matrix[1, 1] * matrix[2, 2] - matrix[1, 2] * matrix[2, 1]) +
-        matrix[0, 1] * (matrix[1, 2] * matrix[2, 0] - matrix[1, 0] * matrix[2, 2]) +
-        matrix[0, 2] * (matrix[1, 0] * matrix[2, 1] - matrix[1, 1] * matrix[2, 0])
+        matrix[0] * (matrix[4] * matrix[8] - matrix[5] * matrix[7]) +
+        matrix[1] * (matrix[5] * matrix[6] - matrix[3] * matrix[8]) +
+        matrix[2] * (matrix[3] * matrix[7] - matrix[4] * matrix[6])
     )
 
 cdef void get_max_rep(
-        const double[:, ::1] reciprocal_lattice,
+        const double *reciprocal_lattice,
         double[3] max_rep,
         double r
     ) nogil:
@@ -619,13 +622,13 @@ cdef void get_max_rep(
         unsigned int i_dim
         double recp_len
 
-    for i_dim in range(3):  # TODO: is it ever not 3x3 for our cases?
-        recp_len = norm(reciprocal_lattice[i_dim, :])
+    for i_dim in range(3):
+        recp_len = norm(&reciprocal_lattice[3*i_dim])
         max_rep[i_dim] = ceil((r + 0.15) * recp_len / (2 * pi))
 
 cdef void get_reciprocal_lattice(
-        const double[:, ::1] lattice,
-        double[:, ::1] reciprocal_lattice
+        const double *lattice,
+        double *reciprocal_lattice
     ) nogil:
     """
     Compute the reciprocal lattice.
@@ -633,16 +636,16 @@ cdef void get_reciprocal_lattice(
     cdef unsigned int i
     for i in range(3):
         recip_component(
-            lattice[i, :], lattice[(i+1)%3, :],
-            lattice[(i+2)%3, :],
-            reciprocal_lattice[i, :]
+            &lattice[3*i], &lattice[3*((i+1)%3)],
+            &lattice[3*((i+2)%3)],
+            &reciprocal_lattice[3*i]
         )
 
 cdef void recip_component(
-        const double[::1] a1,
-        const double[::1] a2,
-        const double[::1] a3,
-        double[::1] out
+        const double *a1,
+        const double *a2,
+        const double *a3,
+        double *out
     ) nogil:
     """
     Compute the reciprocal lattice vector.
@@ -652,14 +655,14 @@ cdef void recip_component(
         double prod
         double ai_cross_aj[3]
 
-    cross(&a2[0], &a3[0], ai_cross_aj)  # need to pass address of memviews
-    prod = inner(&a1[0], ai_cross_aj)
+    cross(a2, a3, ai_cross_aj)
+    prod = inner(a1, ai_cross_aj)
     for i in range(3):
         out[i] = 2 * pi * ai_cross_aj[i] / prod
 
 cdef double inner(
-    const double[3] x,
-    const double[3] y
+    const double *x,
+    const double *y
     ) nogil:
     """
     Compute inner product of 3d vectors.
@@ -673,9 +676,9 @@ cdef double inner(
     return sum
 
 cdef void cross(
-        const double[3] x,
-        const double[3] y,
-        double[3] out
+        const double *x,
+        const double *y,
+        double *out
     ) nogil:
     """
     Cross product of vector x and y, output in out.
@@ -685,22 +688,22 @@ cdef void cross(
     out[2] = x[0] * y[1] - x[1] * y[0]
 
 cdef double norm(
-        const double[::1] vec
+        const double *vec
     ) nogil:
     """
-    Vector norm.
+    3d vector norm.
     """
     cdef:
         unsigned int i
-        unsigned int n = vec.shape[0]
         double sum = 0
 
-    for i in range(n):
+    for i in range(3):
         sum += vec[i] * vec[i]
     return sqrt(sum)
 
 cdef void get_max_and_min(
-        const double[:, ::1] coords,
+        const double *coords,
+        np.int64_t n_points,
         double[3] max_coords,
         double[3] min_coords
     ) nogil:
@@ -708,86 +711,42 @@ cdef void get_max_and_min(
     Compute the lower (min_coords) and upper (max_coords) boundaries along each dimension.
     """
     cdef:
-        unsigned int i_dim, i_pt
-        unsigned int n_points = coords.shape[0]
-        unsigned int n_dims = coords.shape[1]
+        np.int64_t i_pt
+        int i_dim
 
-    for i_dim in range(n_dims):
-        max_coords[i_dim] = coords[0, i_dim]
-        min_coords[i_dim] = coords[0, i_dim]
+    for i_dim in range(3):
+        max_coords[i_dim] = coords[i_dim]
+        min_coords[i_dim] = coords[i_dim]
 
-    for i_dim in range(n_points):
-        for i_pt in range(n_dims):
-            if coords[i_dim, i_pt] >= max_coords[i_pt]:
-                max_coords[i_pt] = coords[i_dim, i_pt]
-            if coords[i_dim, i_pt] <= min_coords[i_pt]:
-                min_coords[i_pt] = coords[i_dim, i_pt]
+    for i_pt in range(n_points):
+        for i_dim in range(3):
+            if coords[3*i_pt + i_dim] >= max_coords[i_dim]:
+                max_coords[i_dim] = coords[3*i_pt + i_dim]
+            if coords[3*i_pt + i_dim] <= min_coords[i_dim]:
+                min_coords[i_dim] = coords[3*i_pt + i_dim]
 
 cdef void compute_cube_index(
-        const double[:, ::1] coords,
+        const double *coords,
         const double[3] global_min,
         double radius,
-        np.int64_t[:, ::1] return_indices
+        const np.int64_t[3] ncube,
+        np.int64_t[3] cube_index
     ) nogil:
     """
-    Computes the cube indices for a set of coordinates based on radius.
+    Computes the cube index of a point based on radius, clipped to the cell list.
     """
-    cdef unsigned int i_pt, i_dim
+    cdef int i_dim
 
-    for i_pt in range(coords.shape[0]):
-        for i_dim in range(coords.shape[1]):
-            return_indices[i_pt, i_dim] = <np.int64_t>(
-                floor((coords[i_pt, i_dim] - global_min[i_dim] + 1e-8) / radius)
-            )
+    for i_dim in range(3):
+        cube_index[i_dim] = <np.int64_t>(floor((coords[i_dim] - global_min[i_dim] + 1e-8) / radius))
+        if cube_index[i_dim] >= ncube[i_dim]:
+            cube_index[i_dim] = ncube[i_dim] - 1
 
-cdef void three_to_one(
-        const np.int64_t[:, ::1] label3d,
-        np.int64_t ny,
-        np.int64_t nz,
-        np.int64_t[::1] label1d
+cdef np.int64_t three_to_one(
+        const np.int64_t[3] label3d,
+        const np.int64_t[3] ncube
     ) nogil:
     """
-    3D vector representation to 1D.
+    3D cube index to 1D.
     """
-    cdef:
-        unsigned int i
-        unsigned int n = label3d.shape[0]
-
-    for i in range(n):
-        label1d[i] = label3d[i, 0] * ny * nz + label3d[i, 1] * nz + label3d[i, 2]
-
-cdef bint distance_vertices(
-        const double[8][3] center,
-        const double[8][3] off,
-        double r
-    ) nogil:
-    cdef:
-        unsigned int i, j
-        double d2
-        double r2 = r * r
-
-    for i in range(8):
-        for j in range(8):
-            d2 = (center[i][0] - off[j][0]) * (center[i][0] - off[j][0]) + \
-                 (center[i][1] - off[j][1]) * (center[i][1] - off[j][1]) + \
-                 (center[i][2] - off[j][2]) * (center[i][2] - off[j][2])
-            if d2 <= r2:
-                return 1
-    return 0
-
-cdef void offset_cube(
-        const double[8][3] center,
-        np.int64_t n,
-        np.int64_t m,
-        np.int64_t l,
-        const double[8][3] (&offsetted)
-    ) nogil:
-    cdef unsigned int i, j, k
-
-    for i in range(2):
-        for j in range(2):
-            for k in range(2):
-                ind = i * 4 + j * 2 + k
-                offsetted[ind][0] = center[ind][0] + n
-                offsetted[ind][1] = center[ind][1] + m
-                offsetted[ind][2] = center[ind][2] + l
+    return label3d[0] * ncube[1] * ncube[2] + label3d[1] * ncube[2] + label3d[2]
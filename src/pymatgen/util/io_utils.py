@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import json
 import re
 import warnings
 from typing import TYPE_CHECKING
 
+import numpy as np
 from monty.io import zopen
+from monty.json import MontyDecoder, MontyEncoder
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
     from pathlib import Path
     from typing import Any
 
+    from pymatgen.util.typing import PathLike
+
 __author__ = "Shyue Ping Ong, Rickard Armiento, Anubhav Jain, G Matteo, Ioannis Petousis"
 __copyright__ = "Copyright 2011, The Materials Project"
 __version__ = "1.0"
@@ -21,6 +26,11 @@ __email__ = "shyuep@gmail.com"
 __status__ = "Production"
 __date__ = "Sep 23, 2011"
 
+# Layout of a binary array file: the 8-byte magic, the length of the JSON header as
+# little-endian uint64, the header, then all arrays with their start offsets aligned
+# to _ALIGNMENT bytes relative to the (aligned) end of the header
+_ALIGNMENT = 64
+
 
 def clean_lines(
     string_list: list[str],
@@ -109,3 +119,72 @@ def micro_pyawk(
                         postdebug(results, match)
 
     return results
+
+
+def write_array_file(filename: PathLike, magic: bytes, header: dict[str, Any], arrays: dict[str, np.ndarray]) -> None:
+    """Write a JSON header and arrays to a binary file that read_array_file can
+    memory-map.
+
+    Args:
+        filename (PathLike): Path of the file.
+        magic (bytes): 8 bytes identifying the type of file.
+        header (dict): JSON-serializable data (using MontyEncoder).
+        arrays (dict[str, np.ndarray]): Arrays to write.
+    """
+    if len(magic) != 8:
+        raise ValueError(f"magic should be 8 bytes, got {magic!r}")
+
+    array_specs: dict[str, dict[str, Any]] = {}
+    offset = 0
+    for name, arr in arrays.items():
+        array_specs[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+        offset = _align(offset + arr.nbytes)
+
+    header_bytes = json.dumps({**header, "arrays": array_specs}, cls=MontyEncoder).encode()
+    data_start = _align(len(magic) + 8 + len(header_bytes))
+
+    with open(filename, mode="wb") as file:
+        file.write(magic)
+        file.write(np.uint64(len(header_bytes)).astype("<u8").tobytes())
+        file.write(header_bytes)
+        for name, arr in arrays.items():
+            file.seek(data_start + array_specs[name]["offset"])
+            file.write(np.ascontiguousarray(arr).tobytes())
+
+
+def read_array_file(
+    filename: PathLike, magic: bytes, mmap: bool = True
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Read the header and arrays of a file written by write_array_file.
+
+    Args:
+        filename (PathLike): Path of the file.
+        magic (bytes): 8 bytes identifying the type of file, as passed to write_array_file.
+        mmap (bool): Whether to memory-map the arrays (read-only) instead of reading
+            them into memory. Only the parts of the file that are accessed are then
+            actually read. Defaults to True.
+
+    Returns:
+        tuple[dict, dict[str, np.ndarray]]: The header and the arrays.
+    """
+    with open(filename, mode="rb") as file:
+        if file.read(len(magic)) != magic:
+            raise ValueError(f"{filename} is not a binary array file starting with {magic!r}")
+        header_len = int(np.frombuffer(file.read(8), dtype="<u8")[0])
+        header = json.loads(file.read(header_len), cls=MontyDecoder)
+
+    buffer = np.memmap(filename, dtype=np.uint8, mode="r") if mmap else np.fromfile(filename, dtype=np.uint8)
+    data_start = _align(len(magic) + 8 + header_len)
+
+    arrays = {}
+    for name, spec in header.pop("arrays").items():
+        dtype = np.dtype(spec["dtype"])
+        start = data_start + spec["offset"]
+        end = start + dtype.itemsize * int(np.prod(spec["shape"]))
+        arrays[name] = buffer[start:end].view(dtype).reshape(spec["shape"])
+    return header, arrays
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to a multiple of _ALIGNMENT."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
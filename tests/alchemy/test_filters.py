@@ -105,3 +105,33 @@ class TestRemoveExistingFilter:
             self._struct_list[-1],
             transmuter.transformed_structures[-1].final_structure,
         )
+
+    def test_existing_structures_changed(self):
+        fil = RemoveExistingFilter(self._existing_structures[:2])
+        assert fil.test(self._struct_list[-1])
+        assert not fil.test(self._struct_list[0])
+
+        index = fil._get_index()
+        assert len(index) == 2
+        fil.existing_structures.append(self._struct_list[-1])
+        assert not fil.test(self._struct_list[-1])
+        assert fil._get_index() is index
+        assert len(index) == 3
+        fil.existing_structures = self._struct_list[3:4]
+        assert fil.test(self._struct_list[0])
+        assert not fil.test(self._struct_list[3])
+
+    def test_ignored_species(self):
+        # with ignored species, only structures with the same composition hash are compared, as before
+        struct = self._struct_list[0]
+        lithiated = struct.copy()
+        lithiated.append("Li", [0.5, 0.5, 0.5])
+        matcher = StructureMatcher(ignored_species=["Li"])
+        assert matcher.fit(struct, lithiated)
+
+        fil = RemoveExistingFilter([struct], structure_matcher=matcher)
+        assert fil.test(lithiated)
+        assert not fil.test(struct.copy())
+        fil = RemoveExistingFilter([lithiated], structure_matcher=matcher)
+        assert fil.test(struct)
+        assert not fil.test(lithiated.copy())
@@ -8,6 +8,7 @@ from shutil import which
 
 import networkx as nx
 import networkx.algorithms.isomorphism as iso
+import numpy as np
 import pytest
 from monty.serialization import loadfn
 from pytest import approx
@@ -136,6 +137,36 @@ class TestStructureGraph(MatSciTest):
         assert len(nacl_graph.get_connected_sites(1)) == 12
         assert len(nacl_graph.graph.get_edge_data(1, 1)) == 6
 
+    def test_add_edges_from_neighbor_list(self):
+        structure = self.get_structure("LiFePO4")
+        strategy = MinimumDistanceNN()
+        neighbor_list = strategy.get_all_neighbor_list(structure)
+
+        struct_graph = StructureGraph.from_empty_graph(structure)
+        struct_graph.add_edges_from_neighbor_list(neighbor_list, weights=True)
+        edge_by_edge = StructureGraph.from_empty_graph(structure)
+        for idx, nn_info in enumerate(strategy.get_all_nn_info(structure)):
+            for nn in nn_info:
+                edge_by_edge.add_edge(idx, nn["site_index"], to_jimage=nn["image"], weight=nn["weight"])
+        assert struct_graph == edge_by_edge
+        assert struct_graph.graph.number_of_edges() == edge_by_edge.graph.number_of_edges()
+        assert sorted(d["weight"] for *_, d in struct_graph.graph.edges(data=True)) == approx(
+            sorted(d["weight"] for *_, d in edge_by_edge.graph.edges(data=True))
+        )
+
+        # adding the same edges again to a non-empty graph creates no duplicates
+        struct_graph.add_edges_from_neighbor_list(neighbor_list)
+        assert struct_graph.graph.number_of_edges() == edge_by_edge.graph.number_of_edges()
+
+        # missing weights (NaN) give edges without weight, as for weight=None
+        no_weights = neighbor_list._replace(weights=np.full(len(neighbor_list.distances), np.nan))
+        for graph in (StructureGraph.from_empty_graph(structure), copy.deepcopy(struct_graph)):
+            graph.add_edges_from_neighbor_list(no_weights, weights=True)
+            assert graph == edge_by_edge
+        graph = StructureGraph.from_empty_graph(structure)
+        graph.add_edges_from_neighbor_list(no_weights, weights=True)
+        assert all("weight" not in data for *_, data in graph.graph.edges(data=True))
+
     def test_set_node_attributes(self):
         self.square_sg.set_node_attributes()
 
@@ -5,7 +5,7 @@ from typing import get_args
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
 from pymatgen.analysis.graphs import MoleculeGraph, StructureGraph
@@ -476,6 +476,39 @@ class TestMiniDistNN(MatSciTest):
         assert crystal_nn.get_cn(self.cscl, 0) == 8
         assert crystal_nn.get_cn(self.lifepo4, 0) == 6
 
+    def test_get_all_nn_info_neighbor_list_cache(self):
+        min_dist_nn = MinimumDistanceNN(tol=0.1)
+        expected = [min_dist_nn.get_nn_info(self.lifepo4, idx) for idx in range(len(self.lifepo4))]
+        assert self.lifepo4._neighbor_list_cache is None
+
+        all_nn_info = min_dist_nn.get_all_nn_info(self.lifepo4)
+        assert self.lifepo4._neighbor_list_cache.r == min_dist_nn.search_cutoff_radius
+        assert [sorted(nn["site_index"] for nn in nns) for nns in all_nn_info] == [
+            sorted(nn["site_index"] for nn in nns) for nns in expected
+        ]
+        assert VoronoiNN().search_cutoff_radius is None
+
+    def test_get_all_neighbor_list(self):
+        for strategy in (MinimumDistanceNN(tol=0.1), MinimumDistanceNN(cutoff=5, get_all_sites=True), EconNN()):
+            neighbor_list = strategy.get_all_neighbor_list(self.lifepo4)
+            assert neighbor_list.n_centers == len(self.lifepo4)
+            for idx, nn_info in enumerate(strategy.get_all_nn_info(self.lifepo4)):
+                start, end = neighbor_list.offsets[idx : idx + 2]
+                assert_array_equal(neighbor_list.center_indices[start:end], idx)
+                expected = sorted((nn["site_index"], *nn["image"], nn["weight"]) for nn in nn_info)
+                actual = sorted(
+                    (*map(int, (point_idx, *image)), weight)
+                    for point_idx, image, weight in zip(
+                        neighbor_list.points_indices[start:end],
+                        neighbor_list.images[start:end],
+                        neighbor_list.weights[start:end],
+                        strict=True,
+                    )
+                )
+                assert [row[:4] for row in actual] == [row[:4] for row in expected]
+                assert [row[4] for row in actual] == approx([row[4] for row in expected])
+        assert_allclose(np.linalg.norm(neighbor_list.vectors, axis=1), neighbor_list.distances)
+
     def test_get_local_order_params(self):
         min_dist_nn = MinimumDistanceNN()
         ops = min_dist_nn.get_local_order_parameters(self.diamond, 0)
@@ -1353,6 +1386,15 @@ class TestCutOffDictNN(MatSciTest):
         with pytest.raises(ValueError, match="Unknown preset='test'"):
             CutOffDictNN.from_preset("test")
 
+    def test_get_all_neighbor_list(self):
+        nn = CutOffDictNN({("C", "C"): 2})
+        neighbor_list = nn.get_all_neighbor_list(self.diamond)
+        assert_array_equal(neighbor_list.offsets, [0, 4, 8])
+        for idx, nn_info in enumerate(nn.get_all_nn_info(self.diamond)):
+            start, end = neighbor_list.offsets[idx : idx + 2]
+            assert sorted(neighbor_list.points_indices[start:end]) == sorted(nn["site_index"] for nn in nn_info)
+        assert_allclose(neighbor_list.weights, neighbor_list.distances)
+
 
 @pytest.mark.skipif(not which("critic2"), reason="critic2 executable not present")
 class TestCritic2NN(MatSciTest):
@@ -509,6 +509,32 @@ class TestPhaseDiagram(MatSciTest):
             h_e = self.pd.get_hull_energy_per_atom(entry.composition)
             assert h_e == approx(entry.energy_per_atom)
 
+    def test_get_e_above_hulls(self):
+        entries = list(self.entries)
+        comps = [entry.composition for entry in entries]
+        e_above_hulls = self.pd.get_e_above_hulls(comps, [entry.energy_per_atom for entry in entries])
+        assert_allclose(e_above_hulls, [self.pd.get_e_above_hull(entry) for entry in entries], atol=1e-10)
+
+        rng = np.random.default_rng(0)
+        amounts = rng.random((200, 3)) * (rng.random((200, 3)) > 0.3)
+        amounts[amounts.sum(axis=1) == 0] = 1
+        hull_energies = self.pd.get_hull_energies_per_atom(amounts, chunk_size=100)
+        for amount, energy in zip(amounts, hull_energies, strict=True):
+            comp = Composition(dict(zip(self.pd.elements, amount, strict=True)))
+            assert energy == approx(self.pd.get_hull_energy_per_atom(comp))
+
+        entry_idx, weights = self.pd.get_decompositions(comps[:20])
+        for comp, indices, amts in zip(comps[:20], entry_idx, weights, strict=True):
+            decomp = {self.pd.qhull_entries[idx]: amt for idx, amt in zip(indices, amts, strict=True) if amt}
+            assert decomp.keys() == self.pd.get_decomposition(comp).keys()
+            assert list(decomp.values()) == approx(list(self.pd.get_decomposition(comp).values()))
+
+        with pytest.raises(ValueError, match=r"Expected array of shape \(n, 3\), got \(2, 2\)"):
+            self.pd.get_decompositions(np.ones((2, 2)))
+
+        pd = PhaseDiagram([entry for entry in entries if entry.reduced_formula == "Li"])
+        assert_allclose(pd.get_hull_energies_per_atom([Composition("Li")]), [min(pd.qhull_data[:-1, -1])])
+
     def test_1d_pd(self):
         entry = PDEntry("H", 0)
         pd = PhaseDiagram([entry])
@@ -649,6 +675,26 @@ class TestPhaseDiagram(MatSciTest):
         assert pd.elements == self.pd.elements
         assert {*pd.as_dict()} == {*self.pd.as_dict()}
 
+    def test_save_load(self):
+        self.pd.save(f"{self.tmp_path}/pd.bin")
+        for mmap in (True, False):
+            pd = PhaseDiagram.load(f"{self.tmp_path}/pd.bin", mmap=mmap)
+            assert isinstance(pd.qhull_data, np.memmap) is mmap
+            assert pd.elements == self.pd.elements
+            assert pd.stable_entries == self.pd.stable_entries
+            assert_allclose(pd.qhull_data, self.pd.qhull_data)
+            for entry in self.entries:
+                assert pd.get_e_above_hull(entry) == approx(self.pd.get_e_above_hull(entry))
+
+        with open(f"{self.tmp_path}/not_pd.bin", mode="wb") as file:
+            file.write(b"not a phase diagram")
+        with pytest.raises(ValueError, match="is not a binary array file starting with b'PMGPHDIA'"):
+            PhaseDiagram.load(f"{self.tmp_path}/not_pd.bin")
+        with pytest.raises(ValueError, match="contains a PhaseDiagram, not a PatchedPhaseDiagram"):
+            PatchedPhaseDiagram.load(f"{self.tmp_path}/pd.bin")
+        with pytest.raises(NotImplementedError, match="save is not supported for GrandPotentialPhaseDiagram"):
+            GrandPotentialPhaseDiagram(self.entries, {Element("O"): -5}).save(f"{self.tmp_path}/gppd.bin")
+
     def test_el_refs(self):
         # Create an imitation of pre_computed phase diagram with el_refs keys being
         # tuple[str, PDEntry] instead of tuple[Element, PDEntry].
@@ -664,6 +710,51 @@ class TestPhaseDiagram(MatSciTest):
             with pytest.raises(ValueError, match="Unable to build phase diagram without entries."):
                 PhaseDiagram(entries=entries)
 
+    def test_add_entries(self):
+        def check_pd(pd, entries):
+            expected = PhaseDiagram(entries)
+            assert pd.stable_entries == expected.stable_entries
+            assert len(pd.all_entries) == len(entries)
+            for entry in entries:
+                assert pd.get_e_above_hull(entry) == approx(expected.get_e_above_hull(entry), abs=1e-8)
+
+        entries = list(self.entries)
+        elements = [entry for entry in entries if entry.is_element]
+        compounds = [entry for entry in entries if not entry.is_element]
+        pd = PhaseDiagram(elements + compounds[::2])
+        stable = pd.add_entries(compounds[1::2])
+        check_pd(pd, elements + compounds)
+        assert set(stable) == pd.stable_entries & set(compounds[1::2])
+
+        # entries above the hull leave the facets unchanged
+        facets = pd.facets
+        unstable = [PDEntry("Li2O", 0), PDEntry("FeO", -1)]
+        assert pd.add_entries(unstable) == []
+        assert pd.facets is facets
+        check_pd(pd, [*elements, *compounds, *unstable])
+
+        # lower energy entries replace stable entries of the same composition
+        li2o = PDEntry("Li2O", -20)
+        assert pd.add_entries([li2o]) == [li2o]
+        check_pd(pd, [*elements, *compounds, *unstable, li2o])
+
+        # a failed update leaves the phase diagram unchanged
+        stable_entries, pd_elements = pd.stable_entries, list(pd.elements)
+        with pytest.raises(ValueError, match=r"Missing terminal entries for elements \['P'\]"):
+            pd.add_entries([PDEntry("Li3P", -15)])
+        assert pd.elements == pd_elements
+        assert pd.stable_entries == stable_entries
+        check_pd(pd, [*elements, *compounds, *unstable, li2o])
+
+        # new elements and lower energy elemental entries rebuild the phase diagram
+        new_entries = [PDEntry("Li", -2), PDEntry("P", -5), PDEntry("Li3P", -15)]
+        pd.add_entries(new_entries)
+        assert pd.elements[-1] == Element("P")
+        check_pd(pd, [*elements, *compounds, *unstable, li2o, *new_entries])
+
+        with pytest.raises(NotImplementedError, match="add_entries is not supported for GrandPotentialPhaseDiagram"):
+            GrandPotentialPhaseDiagram(self.entries, {Element("O"): -5}).add_entries(unstable)
+
 
 class TestGrandPotentialPhaseDiagram:
     def setup_method(self):
@@ -760,6 +851,29 @@ class TestPatchedPhaseDiagram:
     def test_get_stable_entries(self):
         assert self.pd.stable_entries == self.ppd.stable_entries
 
+    def test_save_load(self, tmp_path):
+        self.ppd.save(f"{tmp_path}/ppd.bin")
+        ppd = PatchedPhaseDiagram.load(f"{tmp_path}/ppd.bin")
+        assert ppd.spaces == self.ppd.spaces
+        assert list(ppd.pds) == list(self.ppd.pds)
+        assert ppd.stable_entries == self.ppd.stable_entries
+        # entries are shared between the loaded patches
+        assert {id(e) for pd in ppd for e in pd.qhull_entries} <= {id(e) for e in ppd.qhull_entries}
+        for entry in self.entries:
+            assert ppd.get_e_above_hull(entry) == approx(self.ppd.get_e_above_hull(entry))
+
+    def test_n_workers(self):
+        ppd = PatchedPhaseDiagram(entries=self.entries, n_workers=2)
+        assert list(ppd.pds) == list(self.ppd.pds)
+        assert ppd.stable_entries == self.ppd.stable_entries
+        for space, pd in ppd.pds.items():
+            assert pd.elements == self.ppd[space].elements
+            assert pd.stable_entries == self.ppd[space].stable_entries
+        # entries are shared with the patches rather than copied
+        assert {id(e) for pd in ppd for e in pd.qhull_entries} <= {id(e) for e in ppd.qhull_entries}
+        for entry in self.entries:
+            assert ppd.get_e_above_hull(entry) == approx(self.ppd.get_e_above_hull(entry))
+
     def test_get_qhull_entries(self):
         # NOTE qhull_entry is an specially sorted list due to it's construction, we
         # can't mimic this in ppd therefore just test if sorted versions are equal.
@@ -773,6 +887,35 @@ class TestPatchedPhaseDiagram:
             decomp_ppd = self.ppd.get_decomposition(comp)
             assert decomp_pd == approx(decomp_ppd)
 
+    def test_get_e_above_hulls(self):
+        # includes He, which is in no patch
+        entries = list(self.entries)
+        comps = [entry.composition for entry in entries]
+        e_above_hulls = self.ppd.get_e_above_hulls(comps, [entry.energy_per_atom for entry in entries])
+        assert_allclose(e_above_hulls, [self.pd.get_e_above_hull(entry) for entry in entries], atol=1e-8)
+
+        entry_idx, weights = self.ppd.get_decompositions(comps)
+        for comp, indices, amounts in zip(comps, entry_idx, weights, strict=True):
+            decomp = {self.ppd.qhull_entries[idx]: amt for idx, amt in zip(indices, amounts, strict=True) if amt}
+            expected = self.ppd.get_decomposition(comp)
+            assert decomp.keys() == expected.keys()
+            assert [decomp[entry] for entry in expected] == approx(list(expected.values()))
+
+        # arrays of amounts are grouped by chemical space
+        rng = np.random.default_rng(0)
+        space = max(self.ppd.spaces, key=len)
+        columns = [self.ppd.elements.index(el) for el in space]
+        amounts = np.zeros((50, len(self.ppd.elements)))
+        amounts[:, columns] = rng.random((50, len(columns))) * (rng.random((50, len(columns))) > 0.4)
+        amounts[amounts.sum(axis=1) == 0, columns[0]] = 1
+        hull_energies = self.ppd.get_hull_energies_per_atom(amounts)
+        for amount, energy in zip(amounts, hull_energies, strict=True):
+            comp = Composition(dict(zip(self.ppd.elements, amount, strict=True)))
+            assert energy == approx(self.pd.get_hull_energy_per_atom(comp))
+
+        with pytest.raises(ValueError, match="No suitable PhaseDiagrams found for C-H-O-P"):
+            self.ppd.get_decompositions(self.novel_comps)
+
     def test_get_phase_separation_energy(self):
         for entry in self.novel_entries:
             e_phase_sep_pd = self.pd.get_phase_separation_energy(entry)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import multiprocessing
+from itertools import combinations
+from unittest.mock import patch
 
 import matplotlib.pyplot as plt
 import numpy as np
 from monty.serialization import dumpfn, loadfn
+from numpy.testing import assert_allclose
 from pytest import approx
 
 from pymatgen.analysis.pourbaix_diagram import (
@@ -246,6 +249,73 @@ class TestPourbaixDiagram:
         entry = self.pbx.get_stable_entry(0, 0)
         assert entry.entry_id == "ion-0"
 
+    def test_get_hull_energy_and_stable_indices(self):
+        ph, v = np.meshgrid(np.linspace(-2, 16, 40), np.linspace(-3, 3, 30))
+        hull_energy, stable_indices = self.pbx_no_filter.get_hull_energy_and_stable_indices(ph, v, chunk_size=100)
+        assert hull_energy.shape == stable_indices.shape == ph.shape
+
+        stable_entries = self.pbx_no_filter.stable_entries
+        all_gs = np.array([entry.normalized_energy_at_conditions(ph, v) for entry in stable_entries])
+        assert_allclose(hull_energy, all_gs.min(axis=0))
+        assert_allclose(all_gs.min(axis=0), np.take_along_axis(all_gs, stable_indices[None], axis=0)[0])
+        assert stable_entries[stable_indices[0, 0]] == self.pbx_no_filter.find_stable_entry(ph[0, 0], v[0, 0])
+
+        entries = self.test_data["Zn"][11:13]
+        decomposition_energies = self.pbx_no_filter.get_decomposition_energies(entries, ph, v)
+        assert decomposition_energies.shape == (2, *ph.shape)
+        for entry, energies in zip(entries, decomposition_energies, strict=True):
+            assert_allclose(energies, self.pbx_no_filter.get_decomposition_energy(entry, ph, v))
+
+    def test_prune_combos(self, caplog):
+        pbx = PourbaixDiagram(self.test_data["Ag-Te"], comp_dict={"Ag": 0.5, "Te": 0.5}, filter_solids=True)
+        prod_comp = Composition({"Ag": 0.5, "Te": 0.5})
+        entries = pbx.unprocessed_entries[:12]
+        combos = [list(combo) for size in (1, 2, 3) for combo in combinations(entries, size)]
+
+        candidates = pbx._prune_combos(combos, prod_comp)
+        assert 0 < len(candidates) < len(combos)
+        for combo in combos:
+            if combo not in candidates:
+                assert PourbaixDiagram.process_multientry(combo, prod_comp) is None
+
+        with caplog.at_level("INFO", logger="pymatgen.analysis.pourbaix_diagram"):
+            multi_entries = pbx._process_multientries(combos, prod_comp)
+        assert f"Pruned {len(combos) - len(candidates)} of {len(combos)} entry combinations" in caplog.text
+        expected = [PourbaixDiagram.process_multientry(combo, prod_comp) for combo in combos]
+        assert [entry.entry_id for entry in multi_entries] == [entry.entry_id for entry in expected if entry]
+
+        # combinations are consumed lazily in batches
+        with patch.object(pbx, "_prune_combos", wraps=pbx._prune_combos) as prune_combos:
+            lazy_multi_entries = pbx._process_multientries(iter(combos), prod_comp, batch_size=100)
+        assert prune_combos.call_count == -(-len(combos) // 100)
+        assert [entry.entry_id for entry in lazy_multi_entries] == [entry.entry_id for entry in multi_entries]
+
+    def test_generate_multielement_entries(self):
+        pbx = PourbaixDiagram(self.test_data["Ag-Te"], comp_dict={"Ag": 0.5, "Te": 0.5}, filter_solids=True)
+        entries = pbx._filtered_entries
+        multi_entries = pbx._generate_multielement_entries(entries)
+
+        # only entries on the lower hull in nph-nphi-composition space are combined
+        min_entries, valid_facets = pbx._get_hull_in_nph_nphi_space(entries)
+        hull_entries = {min_entries[idx].entry_id for facet in valid_facets for idx in facet}
+        assert len(hull_entries) < len(entries)
+        assert {entry.entry_id for multi_entry in multi_entries for entry in multi_entry.entry_list} <= hull_entries
+
+        # pruned entries do not change the stable domains
+        prod_comp = Composition({"Ag": 0.5, "Te": 0.5})
+        all_multi_entries = [
+            multi_entry
+            for size in (1, 2)
+            for combo in combinations(entries, size)
+            if (multi_entry := PourbaixDiagram.process_multientry(combo, prod_comp))
+        ]
+        assert len(multi_entries) < len(all_multi_entries)
+        domains = pbx.get_pourbaix_domains(multi_entries)[0]
+        expected = pbx.get_pourbaix_domains(all_multi_entries)[0]
+        assert sorted(map(str, (sorted(entry.entry_id) for entry in domains))) == sorted(
+            map(str, (sorted(entry.entry_id) for entry in expected))
+        )
+
     def test_multielement_parallel(self):
         # Simple test to ensure that multiprocessing is working
         test_entries = self.test_data["Ag-Te-N"]
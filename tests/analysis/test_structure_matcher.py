@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import warnings
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -13,9 +15,11 @@ from pymatgen.analysis.structure_matcher import (
     FrameworkComparator,
     OccupancyComparator,
     OrderDisorderElementComparator,
+    StructureIndex,
     StructureMatcher,
+    _get_matching_volume_range,
 )
-from pymatgen.core import Element, Lattice, Structure, SymmOp
+from pymatgen.core import Element, IStructure, Lattice, Structure, SymmOp
 from pymatgen.util.coord import find_in_coord_list_pbc
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, MatSciTest
 
@@ -292,6 +296,48 @@ class TestStructureMatcher(MatSciTest):
         assert sm_coarse.fit(struct1, struct2, symmetric=True) is False
         assert sm_coarse.fit(struct2, struct1, symmetric=True) is False
 
+    def test_prototype_search(self):
+        # ordered perovskite with 3 A and 3 B cations
+        struct1 = Structure(
+            Lattice.cubic(3.9),
+            ["Ba", "Ti", "O", "O", "O"],
+            [[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0.5, 0], [0.5, 0, 0.5], [0, 0.5, 0.5]],
+        )
+        struct1.make_supercell([3, 1, 1])
+        struct1.replace(0, "Sr")
+        struct1.replace(1, "Ca")
+        struct1.replace(3, "Zr")
+        struct1.replace(4, "Hf")
+        struct2 = struct1.copy()
+        struct2.replace_species({"Sr": "La", "Ba": "K", "Ca": "Na", "Ti": "Nb", "Zr": "Ta", "Hf": "V", "O": "F"})
+
+        sm = StructureMatcher()
+        strict_match = StructureMatcher._strict_match
+        with patch.object(StructureMatcher, "_strict_match", autospec=True, side_effect=strict_match) as mock:
+            mappings = sm.get_all_anonymous_mappings(struct1, struct2)
+            # O can only be mapped to F, the only species with 9 sites
+            assert mock.call_count == 6 * 5 * 4 * 3 * 2
+            mock.reset_mock()
+            assert sm.get_all_anonymous_mappings(struct1, struct2, prototype_search=True) == mappings
+            # A and B cations have different nearest-neighbor distances
+            assert mock.call_count == 3 * 2 * 3 * 2
+            assert sm.fit_anonymous(struct1, struct2, prototype_search=True)
+
+        assert len(mappings) == 6
+        assert all(mapping[Element("O")] == Element("F") for mapping in mappings)
+
+        # the nearest neighbor of Cs is further away than most nearest-neighbor distances
+        coords = [[x, y, z] for x in (0, 0.1) for y in (0, 0.1) for z in (0, 0.1)]
+        cluster = Structure(Lattice.cubic(10), ["Li"] * 8 + ["Cs"], [*coords, [0.5, 0.5, 0.5]])
+        swapped = cluster.copy()
+        swapped.replace_species({"Li": "Na", "Cs": "K"})
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert sm.fit_anonymous(cluster, swapped, prototype_search=True)
+            assert sm.get_all_anonymous_mappings(cluster, swapped, prototype_search=True) == [
+                {Element("Li"): Element("Na"), Element("Cs"): Element("K")}
+            ]
+
     def test_oxi(self):
         """Test oxidation state removal matching."""
         sm = StructureMatcher()
@@ -317,6 +363,88 @@ class TestStructureMatcher(MatSciTest):
         out = sm.group_structures(self.struct_list, anonymous=True)
         assert list(map(len, out)) == [4, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1]
 
+    def test_cache_size(self):
+        sm = StructureMatcher()
+        cached = StructureMatcher(cache_size=3)
+        for s1 in self.struct_list:
+            for s2 in self.struct_list[:4]:
+                assert cached.fit(s1, s2) == sm.fit(s1, s2)
+                assert cached.get_rms_dist(s1, s2) == sm.get_rms_dist(s1, s2)
+        assert len(cached._reduced_cache) == 3
+        assert len(sm._reduced_cache) == 0
+
+        # cached structures are copied so the cache is not modified by scaling
+        struct = self.struct_list[0].copy()
+        struct.scale_lattice(struct.volume * 2)
+        assert cached.fit(struct, self.struct_list[0])
+        assert not StructureMatcher(scale=False, cache_size=3).fit(struct, self.struct_list[0])
+        assert StructureMatcher.from_dict(cached.as_dict())._cache_size == 3
+
+        # structures differing only in site properties or labels are cached separately
+        struct = self.struct_list[0].copy()
+        with_props = struct.copy(site_properties={"magmom": [float(idx) for idx in range(len(struct))]})
+        relabeled = struct.copy()
+        relabeled.relabel_sites()
+        relabeled[0].label = "special"
+        for other in (struct, with_props, relabeled):
+            reduced = cached.prepare_structures([other])[0]
+            expected = sm.prepare_structures([other])[0]
+            assert reduced.site_properties == expected.site_properties
+            assert reduced.labels == expected.labels
+
+        # cache hits do not create the sites of column-wise structures
+        struct = self.struct_list[1]
+        reduced = cached._get_cached_reduced_structure(
+            IStructure(struct.lattice, struct.species_and_occu, struct.frac_coords)
+        )
+        keys = list(cached._reduced_cache)
+        istruct = IStructure(struct.lattice, struct.species_and_occu, struct.frac_coords)
+        assert cached._get_cached_reduced_structure(istruct) == reduced
+        assert list(cached._reduced_cache) == keys
+        assert istruct._site_list is None
+
+    def test_break_on_match(self):
+        # translations are only tested until the first match
+        struct = Structure.from_spacegroup("Fd-3m", Lattice.cubic(5.43), ["Si"], [[0, 0, 0]])
+        struct.make_supercell(2)
+        translated = struct.copy()
+        translated.translate_sites(range(len(translated)), [0.1, 0.2, 0.3])
+        sm = StructureMatcher(primitive_cell=False)
+        with patch.object(sm, "_cmp_fstruct", wraps=sm._cmp_fstruct) as cmp_fstruct:
+            assert sm._strict_match(struct, translated, 1, break_on_match=True) is not None
+        assert cmp_fstruct.call_count < len(struct)
+
+    def test_prepare_structures(self):
+        sm = StructureMatcher(ignored_species=["Ti"])
+        prepared = sm.prepare_structures(self.struct_list)
+        assert all(struct.composition.reduced_formula == "O2" for struct in prepared)
+        for s1, p1 in zip(self.struct_list, prepared, strict=True):
+            for s2, p2 in zip(self.struct_list[:3], prepared[:3], strict=True):
+                assert sm.fit(p1, p2, skip_structure_reduction=True) == sm.fit(s1, s2)
+
+    def test_group_structures_parallel(self):
+        struct_list = [struct.copy() for struct in self.struct_list]
+        for struct in struct_list[::3]:
+            struct.scale_lattice(struct.volume * 1.5)
+        for kwargs in ({}, {"scale": False}, {"scale": False, "primitive_cell": False}):
+            sm = StructureMatcher(**kwargs)
+            for anonymous in (False, True):
+                serial = sm.group_structures(struct_list, anonymous=anonymous)
+                assert sum(map(len, serial)) == len(struct_list)
+                parallel = sm.group_structures(struct_list, anonymous=anonymous, n_workers=2)
+                assert [list(map(id, group)) for group in parallel] == [list(map(id, group)) for group in serial]
+
+    def test_get_matching_volume_range(self):
+        lattice = Lattice.from_parameters(3, 4, 5, 80, 95, 100)
+        ltol, angle_tol = 0.2, 5
+        v_min, v_max = _get_matching_volume_range(lattice, ltol, angle_tol)
+        assert v_min < lattice.volume < v_max
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            lengths = np.array(lattice.abc) * (1 + ltol) ** rng.uniform(-1, 1, 3)
+            angles = np.array(lattice.angles) + rng.uniform(-angle_tol, angle_tol, 3)
+            assert v_min <= Lattice.from_parameters(*lengths, *angles).volume <= v_max
+
     def test_mix(self):
         structures = list(map(self.get_structure, ["Li2O", "Li2O2", "LiFePO4"]))
         structures += [Structure.from_file(f"{VASP_IN_DIR}/{fname}") for fname in ["POSCAR_Li2O", "POSCAR_LiFePO4"]]
@@ -817,3 +945,58 @@ class TestStructureMatcher(MatSciTest):
         assert sm.fit(s1, s2) is False
         assert sm.fit_anonymous(s1, s2) is False
         assert sm.get_mapping(s1, s2) is None
+
+
+class TestStructureIndex(MatSciTest):
+    def setup_method(self):
+        with open(f"{TEST_FILES_DIR}/entries/TiO2_entries.json", encoding="utf-8") as file:
+            entries = json.load(file, cls=MontyDecoder)
+        self.struct_list = [ent.structure for ent in entries]
+
+    def test_find(self):
+        for matcher in (StructureMatcher(), StructureMatcher(scale=False), StructureMatcher(attempt_supercell=True)):
+            index = StructureIndex(matcher)
+            assert index.add_structures(self.struct_list[:-1]) == list(range(len(self.struct_list) - 1))
+            assert len(index) == len(self.struct_list) - 1
+            for struct in self.struct_list:
+                expected = [idx for idx, other in enumerate(self.struct_list[:-1]) if matcher.fit(other, struct)]
+                assert index.get_matches(struct) == expected
+                assert index.find(struct) == (expected[0] if expected else None)
+                assert set(expected) <= set(index.get_candidates(struct))
+                odd = [idx for idx in expected if idx % 2 == 1]
+                assert index.get_matches(struct, prefilter=lambda idx: idx % 2 == 1) == odd
+                assert index.find(struct, prefilter=lambda idx: idx % 2 == 1) == (odd[0] if odd else None)
+
+        index = StructureIndex(StructureMatcher(scale=False))
+        index.add_structures(self.struct_list)
+        struct = self.struct_list[0].copy()
+        assert struct in index
+        assert index.get_candidates(self.get_structure("Si")) == []
+        struct.scale_lattice(struct.volume * 10)
+        assert index.get_candidates(struct) == []
+        assert struct not in index
+
+        with pytest.raises(ValueError, match="allow_subset cannot be used with StructureIndex"):
+            StructureIndex(StructureMatcher(allow_subset=True))
+
+    def test_anonymous(self):
+        index = StructureIndex(anonymous=True)
+        index.add(self.struct_list[0])
+        struct = self.struct_list[0].copy()
+        struct.replace_species({"Ti": "Zr", "O": "S"})
+        assert index.find(struct) == 0
+        assert StructureIndex().add(self.struct_list[0]) == 0
+        assert struct not in StructureIndex()
+
+    def test_save_load(self):
+        index = StructureIndex(StructureMatcher(scale=False, comparator=ElementComparator()))
+        index.add_structures(self.struct_list[:5])
+        index.save(f"{self.tmp_path}/index.json.gz")
+        loaded = StructureIndex.load(f"{self.tmp_path}/index.json.gz")
+        assert len(loaded) == 5
+        assert not loaded.matcher._scale
+        assert isinstance(loaded.matcher._comparator, ElementComparator)
+        for idx, struct in enumerate(self.struct_list):
+            assert loaded.get_matches(struct) == index.get_matches(struct)
+            if idx < 5:
+                assert loaded.get_structure(idx) == index.get_structure(idx)
@@ -148,6 +148,41 @@ class TestComposition(MatSciTest):
         assert Composition({"Fe3+": 2, "Fe2+": 2, "Li": 4, "O": 16, "P": 4}).formula == "Li4 Fe4 P4 O16"
         assert Composition({"Fe3+": 2, "Fe": 2, "Li": 4, "O": 16, "P": 4}).formula == "Li4 Fe4 P4 O16"
 
+    def test_init_from_composition(self):
+        comp = Composition({Element("Fe"): 2, Species("O", -2): 3, "Li": 1e-9})
+        assert list(comp) == [Element("Fe"), Species("O", -2)]
+        assert comp.num_atoms == 5
+
+        copied = Composition(comp)
+        assert copied == comp
+        assert copied.num_atoms == comp.num_atoms
+        assert copied._data is not comp._data
+
+        # negative amounts are still rejected unless allowed
+        negative = Composition({"Fe": -1, "O": 1}, allow_negative=True)
+        with pytest.raises(ValueError, match="Amounts in Composition cannot be negative"):
+            Composition(negative)
+        assert Composition(negative, allow_negative=True) == negative
+
+    def test_cached_values(self):
+        comp = Composition("Li4Fe4P4O16")
+        assert comp.reduced_composition is comp.reduced_composition
+        assert comp.get_reduced_formula_and_factor() == ("LiFePO4", 4)
+        assert comp.get_reduced_formula_and_factor(iupac_ordering=True) == ("LiFePO4", 4)
+        assert comp.fractional_composition is comp.fractional_composition
+        assert hash(comp) == hash(Composition("LiFePO4"))
+
+        # parsed formulas are shared, but the returned dicts are not
+        parsed = Composition._parse_formula("Li2(SO4)3")
+        parsed["Li"] = 0
+        assert Composition._parse_formula("Li2(SO4)3") == {"Li": 2, "S": 3, "O": 12}
+
+        # cached values are not pickled
+        state = comp.__getstate__()
+        assert not set(state) & set(Composition._cached_attrs)
+        for unpickled in self.serialize_with_pickle(comp):
+            assert unpickled.reduced_formula == "LiFePO4"
+
     def test_str_and_repr(self):
         test_cases = [
             (
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import itertools
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -314,6 +315,15 @@ class TestLattice(MatSciTest):
         lattice = Lattice.orthorhombic(9, 9, 5)
         assert len(list(lattice.find_all_mappings(lattice))) == 16
 
+        # batched mappings are yielded in the same order
+        lattice = Lattice.cubic(3)
+        mappings = list(lattice.find_all_mappings(Lattice.cubic(6), ltol=0.2, atol=5, skip_rotation_matrix=True))
+        batches = list(lattice._find_all_mapping_arrays(Lattice.cubic(6), ltol=0.2, atol=5))
+        assert len(mappings) == sum(len(aligned_ms) for aligned_ms, _ in batches) == 336
+        assert_allclose(np.concatenate([aligned_ms for aligned_ms, _ in batches]), [m[0].matrix for m in mappings])
+        assert_array_equal(np.concatenate([scale_ms for _, scale_ms in batches]), [m[2] for m in mappings])
+        assert all(rot is None for _, rot, _ in mappings)
+
         # catch the singular matrix error
         lattice = Lattice.from_parameters(1, 1, 1, 10, 10, 10)
         for latt, _, _ in lattice.find_all_mappings(lattice, ltol=0.05, atol=11):
@@ -444,6 +454,40 @@ class TestLattice(MatSciTest):
         types = {*map(type, result)}
         assert types == {np.ndarray}, f"Expected only np.ndarray, got {[t.__name__ for t in types]}"
 
+    def test_get_points_in_spheres_batched(self):
+        lattice = Lattice.from_parameters(4, 5, 6, 80, 95, 110, pbc=(True, True, False))
+        frac_points = [[0, 0, 0], [0.5, 0.2, 0.3], [0.1, 0.8, 1.4]]
+        centers = lattice.get_cartesian_coords([[0.2, 0.3, 0.4], [0.9, 0.1, 0.5], [0.5, 0.5, 0.5]])
+        radii = [3.0, 4.5, 2.5]
+
+        for with_cython in (True, False):
+            with mock.patch.dict("sys.modules", {} if with_cython else {"pymatgen.optimization.neighbors": None}):
+                center_indices, points_indices, images, distances = lattice.get_points_in_spheres_batched(
+                    frac_points, centers, radii
+                )
+            assert np.all(np.diff(center_indices) >= 0)
+            for idx, (center, r) in enumerate(zip(centers, radii, strict=True)):
+                mask = center_indices == idx
+                frac_coords, dists, inds, imgs = lattice.get_points_in_sphere(frac_points, center, r, zip_results=False)
+                expected = sorted(zip(inds, map(tuple, imgs), dists, strict=True))
+                batched = sorted(zip(points_indices[mask], map(tuple, images[mask]), distances[mask], strict=True))
+                assert len(batched) == len(expected)
+                for (idx1, img1, dist1), (idx2, img2, dist2) in zip(batched, expected, strict=True):
+                    assert (idx1, img1) == (idx2, img2)
+                    assert dist1 == approx(dist2)
+                neighbor_coords = np.take(frac_points, points_indices[mask], axis=0) + images[mask]
+                cart_coords = lattice.get_cartesian_coords(neighbor_coords)
+                assert_allclose(np.linalg.norm(cart_coords - center, axis=1), distances[mask])
+
+        # same radius for all centers
+        center_indices, *_ = lattice.get_points_in_spheres_batched(frac_points, centers, 3)
+        n_neighbors = [len(lattice.get_points_in_sphere(frac_points, center, 3)) for center in centers]
+        assert_array_equal(np.bincount(center_indices), n_neighbors)
+
+        center_indices, points_indices, images, distances = lattice.get_points_in_spheres_batched([], centers, 3)
+        assert len(center_indices) == len(points_indices) == len(distances) == 0
+        assert images.shape == (0, 3)
+
     def test_get_all_distances(self):
         frac_coords = np.array(
             [
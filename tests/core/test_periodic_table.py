@@ -11,7 +11,12 @@ import pytest
 from pytest import approx
 
 from pymatgen.core import DummySpecies, Element, Species, get_el_sp
-from pymatgen.core.periodic_table import ElementBase, ElementType
+from pymatgen.core.periodic_table import (
+    ELEMENT_NUMERIC_PROPERTIES,
+    ElementBase,
+    ElementType,
+    get_element_property_array,
+)
 from pymatgen.core.units import Ha_to_eV
 from pymatgen.io.core import ParseError
 from pymatgen.util.testing import MatSciTest
@@ -737,6 +742,24 @@ def test_get_el_sp():
         get_el_sp(None)
 
 
+def test_get_element_property_array():
+    for prop in ELEMENT_NUMERIC_PROPERTIES:
+        table = get_element_property_array(prop)
+        assert table.shape == (119,)
+        assert np.isnan(table[0])
+        assert not table.flags.writeable
+
+    assert get_element_property_array("X")[26] == approx(Element.Fe.X)
+    assert get_element_property_array("atomic_mass")[8] == approx(Element.O.atomic_mass)
+    assert get_element_property_array("melting_point")[13] == approx(Element.Al.melting_point)
+    assert get_element_property_array("Z")[[1, 92]].tolist() == [1, 92]
+    # no data
+    assert np.isnan(get_element_property_array("atomic_radius")[118])
+
+    with pytest.raises(ValueError, match="Invalid prop='block'"):
+        get_element_property_array("block")
+
+
 def test_element_type():
     assert isinstance(ElementType.actinoid, Enum)
     assert isinstance(ElementType.metalloid, Enum)
@@ -4,6 +4,7 @@ import itertools
 import json
 import math
 import os
+import pickle
 from fractions import Fraction
 from pathlib import Path
 from shutil import which
@@ -151,6 +152,35 @@ class TestIStructure(MatSciTest):
         supercell = self.struct * 2
         assert supercell.matches(self.struct)
 
+    def test_mul(self):
+        struct = IStructure(
+            self.lattice,
+            ["Si", {"Ge": 0.5, "Si": 0.5}],
+            [[0, 0, 0], [0.75, 0.5, 0.75]],
+            site_properties={"magmom": [1, -1]},
+            labels=["Si1", None],
+        )
+        scaling_matrix = [[1, 1, 0], [-1, 1, 0], [0, 0, 2]]
+        supercell = struct * scaling_matrix
+        assert isinstance(supercell, Structure)
+        assert len(supercell) == 8
+        assert_allclose(supercell.lattice.matrix, np.dot(scaling_matrix, self.lattice.matrix))
+
+        # sites are grouped by original site, with properties and labels tiled
+        assert supercell.site_properties["magmom"] == [1] * 4 + [-1] * 4
+        assert supercell.labels == ["Si1"] * 4 + [struct[1].species_string] * 4
+        assert supercell.species_and_occu == [struct[0].species] * 4 + [struct[1].species] * 4
+        assert np.all((supercell.frac_coords >= 0) & (supercell.frac_coords < 1))
+        # all copies of a site are lattice translations of it in the original cell
+        frac_diffs = self.lattice.get_fractional_coords(supercell.cart_coords)
+        frac_diffs -= np.repeat(struct.frac_coords, 4, axis=0)
+        assert_allclose(frac_diffs, np.round(frac_diffs), atol=1e-8)
+        assert len(np.unique(np.round(frac_diffs[:4]), axis=0)) == 4
+
+        # same result once the sites have been created
+        struct.sites  # noqa: B018
+        assert struct * scaling_matrix == supercell
+
     def test_bad_structure(self):
         coords = [[0, 0, 0], [0.75, 0.5, 0.75], [0.75, 0.5, 0.75]]
         with pytest.raises(
@@ -339,6 +369,73 @@ class TestIStructure(MatSciTest):
         assert self.propertied_structure[0].magmom == 5
         assert self.propertied_structure[1].magmom == -5
 
+    def test_site_arrays(self):
+        struct = IStructure(
+            self.lattice,
+            ["Si", {"Fe": 0.5, "Mn": 0.5}, "Si"],
+            [[0, 0, 0], [1.25, 0.5, -0.25], [0.5, 0.5, 0.5]],
+            to_unit_cell=True,
+            site_properties={"magmom": [1, 2, 3]},
+            labels=[None, "FeMn", "Si3"],
+        )
+        # bulk properties are served from the columnar storage without creating sites
+        assert_allclose(struct.frac_coords, [[0, 0, 0], [0.25, 0.5, 0.75], [0.5, 0.5, 0.5]])
+        assert_allclose(struct.cart_coords, self.lattice.get_cartesian_coords(struct.frac_coords))
+        assert struct.site_properties == {"magmom": [1, 2, 3]}
+        assert struct.labels == ["Si", "FeMn", "Si3"]
+        assert struct.composition == Composition({"Si": 2, "Fe": 0.5, "Mn": 0.5})
+        assert not struct.is_ordered
+        assert struct.types_of_species == (Element.Mn, Element.Fe, Element.Si)
+        assert len(struct) == 3
+        assert struct._site_list is None
+        # returned arrays are copies
+        struct.frac_coords[0] = 0.5
+        assert_allclose(struct.frac_coords[0], [0, 0, 0])
+
+        # sites are created on first access and become the source of truth
+        assert struct[1].species == Composition({"Fe": 0.5, "Mn": 0.5})
+        assert struct._site_arrays is None
+        assert struct[2].magmom == 3
+        assert struct[1].label == "FeMn"
+        assert struct.species_and_occu[0] == Composition("Si")
+
+        with pytest.raises(ValueError, match="Species occupancies sum to more than 1"):
+            IStructure(self.lattice, [{"Fe": 0.8, "Mn": 0.5}], [[0, 0, 0]])
+
+    def test_get_element_property_array(self):
+        struct = IStructure(
+            self.lattice,
+            ["Si", {"Fe": 0.5, "Mn": 0.25}, Species("O", -2), "Si"],
+            [[0, 0, 0], [0.25, 0.5, 0.75], [0.5, 0.5, 0.5], [0.75, 0.75, 0.75]],
+        )
+        mn_mass, fe_mass = float(Element.Mn.atomic_mass), float(Element.Fe.atomic_mass)
+        expected = [Element.Si.atomic_mass, (0.5 * fe_mass + 0.25 * mn_mass) / 0.75, Element.O.atomic_mass]
+        assert_allclose(struct.get_element_property_array("atomic_mass"), [*expected, Element.Si.atomic_mass])
+        assert struct._site_list is None
+
+        # same result from the sites
+        assert_allclose(struct[0].x, 0)
+        assert struct._site_arrays is None
+        assert_allclose(struct.get_element_property_array("atomic_mass"), [*expected, Element.Si.atomic_mass])
+
+        # species attributes
+        struct = IStructure(self.lattice, [Species("Li", 1), Species("O", -2)], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        assert_allclose(struct.get_element_property_array("oxi_state"), [1, -2])
+        assert_allclose(struct.get_element_property_array("ionic_radius"), [0.9, 1.26])
+        with pytest.raises(ValueError, match="prop='block' is not a numeric property of Li"):
+            struct.get_element_property_array("block")
+        with pytest.raises(AttributeError, match="Element has no attribute oxi_state"):
+            self.struct.get_element_property_array("oxi_state")
+
+        mol = IMolecule(["C", "H", "X"], [[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+        assert_allclose(mol.get_element_property_array("X"), [2.55, 2.2, np.nan])
+
+        # named isotopes share the atomic number of H but not all of its properties
+        mol = IMolecule(["H", "D", "T"], [[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+        isotopes = [Element.H, Element("D"), Element("T")]
+        assert_allclose(mol.get_element_property_array("atomic_mass"), [float(el.atomic_mass) for el in isotopes])
+        assert_allclose(mol.get_element_property_array("X"), [2.2, 2.2, 2.2])
+
     def test_properties_dict(self):
         assert self.propertied_structure.properties == {"test_property": "test"}
 
@@ -714,6 +811,15 @@ Direct
             assert_allclose(cy_indices2, py_indices2)
             assert len(cy_offsets) == len(py_offsets)
 
+    def test_get_neighbor_lists(self):
+        structures = [self.struct, self.struct * 2, self.propertied_structure]
+        neighbor_lists = IStructure.get_neighbor_lists(structures, 3)
+        assert len(neighbor_lists) == len(structures)
+        for struct, neighbor_list in zip(structures, neighbor_lists, strict=True):
+            for arr, ref_arr in zip(neighbor_list, struct.get_neighbor_list(3), strict=True):
+                assert_array_equal(arr, ref_arr)
+        assert IStructure.get_neighbor_lists([], 3) == []
+
     @pytest.mark.skip("TODO: need someone to fix this")
     @pytest.mark.skipif(not os.getenv("CI"), reason="Only run this in CI tests")
     def test_get_all_neighbors_crosscheck_old(self):
@@ -886,6 +992,32 @@ Direct
             )
             assert norm < 1e-3
 
+    def test_get_all_neighbors_as_arrays(self):
+        struct = self.get_structure("LiFePO4")
+        nn_objects = struct.get_all_neighbors(3)
+        neighbor_list = struct.get_all_neighbors(3, as_arrays=True)
+        assert neighbor_list.n_centers == len(struct)
+        assert_array_equal(np.diff(neighbor_list.offsets), [len(nns) for nns in nn_objects])
+        for idx, nns in enumerate(nn_objects):
+            start, end = neighbor_list.offsets[idx : idx + 2]
+            expected = sorted((nn.index, *map(int, nn.image), round(nn.nn_distance, 8)) for nn in nns)
+            actual = sorted(
+                (int(point_idx), *map(int, image), round(float(dist), 8))
+                for point_idx, image, dist in zip(
+                    neighbor_list.points_indices[start:end],
+                    neighbor_list.images[start:end],
+                    neighbor_list.distances[start:end],
+                    strict=True,
+                )
+            )
+            assert actual == expected
+        assert_allclose(np.linalg.norm(neighbor_list.vectors, axis=1), neighbor_list.distances)
+
+        # subset of centers
+        neighbor_list = struct.get_all_neighbors(3, sites=struct[:2], as_arrays=True)
+        assert neighbor_list.n_centers == 2
+        assert_array_equal(np.diff(neighbor_list.offsets), [len(nns) for nns in nn_objects[:2]])
+
     def test_get_dist_matrix(self):
         assert_allclose(self.struct.distance_matrix, [[0.0, 2.3516318], [2.3516318, 0.0]])
 
@@ -1099,6 +1231,54 @@ class TestStructure(MatSciTest):
         with pytest.raises(TypeError, match="unhashable type: 'Structure'"):
             _ = {self.struct: 1}
 
+    def test_site_arrays_mutation(self):
+        struct = Structure(Lattice.cubic(3), ["Si", "Si"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        struct.lattice = Lattice.cubic(4)
+        assert struct._site_list is None
+        assert_allclose(struct.cart_coords[1], [2, 2, 2])
+
+        struct.append("O", [0.25, 0.25, 0.25])
+        assert isinstance(struct.sites, list)
+        assert struct[1].lattice == Lattice.cubic(4)
+        assert struct.formula == "Si2 O1"
+        struct[0].frac_coords = [0.1, 0.1, 0.1]
+        assert_allclose(struct.frac_coords[0], [0.1, 0.1, 0.1])
+
+    def test_neighbor_list_cache(self):
+        struct = self.struct.copy()
+        ref = struct._find_neighbor_pairs(3, None, struct.cart_coords, 1e-8)
+        center_indices, points_indices, images, distances = struct.get_neighbor_list(3, exclude_self=False)
+        assert struct._neighbor_list_cache.r == 3
+        for arr, ref_arr in zip((center_indices, points_indices, images, distances), ref, strict=True):
+            assert_array_equal(arr, ref_arr)
+
+        # smaller cutoffs and subsets of sites are answered from the cached superset
+        for r in (0.5, 2.5):
+            expected = struct._find_neighbor_pairs(r, [struct[1]], struct.cart_coords, 1e-8)
+            center_indices, points_indices, images, distances = struct.get_neighbor_list(
+                r, sites=[struct[1]], exclude_self=False
+            )
+            assert_array_equal(center_indices, expected[0])
+            assert {(idx, *img) for idx, img in zip(points_indices, images, strict=True)} == {
+                (idx, *img) for idx, img in zip(expected[1], expected[2], strict=True)
+            }
+            assert_allclose(np.sort(distances), np.sort(expected[3]))
+        assert struct._neighbor_list_cache.r == 3
+        assert len(struct.get_neighbors(struct[0], 2.5)) == 4
+
+        # the cache is rebuilt for larger cutoffs and when sites or the lattice change
+        struct.get_neighbor_list(4)
+        assert struct._neighbor_list_cache.r == 4
+        struct[0].frac_coords = [0.01, 0, 0]
+        assert_array_equal(
+            struct.get_neighbor_list(4, exclude_self=False)[3],
+            struct._find_neighbor_pairs(4, None, struct.cart_coords, 1e-8)[3],
+        )
+        struct.lattice = struct.lattice.matrix * 1.1
+        assert struct._neighbor_list_cache is None
+        assert len(struct.get_neighbors(struct[0], 2.5)) == 0
+        assert pickle.loads(pickle.dumps(struct))._neighbor_list_cache is None  # noqa: S301
+
     def test_sort(self):
         self.struct[0] = "F"
         returned = self.struct.sort()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from pymatgen.core import Lattice, Structure, StructureArray
+from pymatgen.util.testing import MatSciTest
+
+
+class TestStructureArray(MatSciTest):
+    def setup_method(self):
+        lifepo4 = self.get_structure("LiFePO4")
+        lifepo4.add_site_property("magmom", [float(idx) for idx in range(len(lifepo4))])
+        lifepo4.add_site_property("selective_dynamics", [[True, False, True]] * len(lifepo4))
+
+        si = self.get_structure("Si")
+        si.add_oxidation_state_by_element({"Si": 4})
+        si.relabel_sites()
+        si.properties["energy"] = -10.8
+
+        disordered = Structure(
+            Lattice.cubic(3, pbc=(True, True, False)),
+            [{"Fe": 0.5, "Mn": 0.5}, "O"],
+            [[0, 0, 0], [0.5, 0.5, 0.5]],
+            site_properties={"magmom": [np.array([0, 0, 1.0]), np.array([0, 0, -1.0])], "note": ["a", None]},
+        )
+        self.structures = [lifepo4, si, self.get_structure("CsCl"), disordered]
+
+    def _check_structures(self, structure_array):
+        assert len(structure_array) == len(self.structures)
+        for struct, loaded in zip(self.structures, structure_array, strict=True):
+            assert loaded == struct
+            assert loaded.lattice.pbc == struct.lattice.pbc
+            assert loaded.labels == struct.labels
+            assert loaded.properties == struct.properties
+            assert loaded.charge == struct.charge
+            assert loaded.site_properties.keys() == struct.site_properties.keys()
+            for key, vals in struct.site_properties.items():
+                for val, loaded_val in zip(vals, loaded.site_properties[key], strict=True):
+                    assert type(loaded_val) is type(val)
+                    assert np.all(loaded_val == val)
+
+    def test_from_structures(self):
+        structure_array = StructureArray.from_structures(self.structures)
+        assert structure_array.n_sites == sum(map(len, self.structures))
+        assert_array_equal(structure_array.site_offsets, np.cumsum([0, *map(len, self.structures)]))
+        assert_allclose(structure_array.lattices[1], self.structures[1].lattice.matrix)
+
+        # numeric site properties are stored as columns, others per structure
+        assert set(structure_array.site_properties) == {"selective_dynamics"}
+        assert_array_equal(structure_array.site_properties["selective_dynamics"].present, [True, False, False, False])
+        # magmoms are scalars in one structure and vectors in another
+        assert set(structure_array._get_metadata(3)["site_properties"]) == {"magmom", "note"}
+        assert StructureArray.from_structures(self.structures[:3]).site_properties.keys() == {
+            "magmom",
+            "selective_dynamics",
+        }
+
+        self._check_structures(structure_array)
+        assert structure_array[-1] == self.structures[-1]
+        assert structure_array[1:3] == self.structures[1:3]
+        with pytest.raises(IndexError, match="index=4 out of range for 4 structures"):
+            structure_array[4]
+
+    def test_save_load(self):
+        structure_array = StructureArray.from_structures(self.structures)
+        structure_array.save(f"{self.tmp_path}/structures.bin")
+
+        for mmap in (True, False):
+            loaded = StructureArray.load(f"{self.tmp_path}/structures.bin", mmap=mmap)
+            assert isinstance(loaded.frac_coords, np.memmap) is mmap
+            assert_array_equal(loaded.frac_coords, structure_array.frac_coords)
+            self._check_structures(loaded)
+
+        # random access into a memory-mapped file
+        loaded = StructureArray.load(f"{self.tmp_path}/structures.bin")
+        assert loaded[2] == self.structures[2]
+
+        empty = StructureArray.from_structures([])
+        empty.save(f"{self.tmp_path}/empty.bin")
+        assert len(StructureArray.load(f"{self.tmp_path}/empty.bin")) == 0
+
+        with open(f"{self.tmp_path}/not_structures.bin", mode="wb") as file:
+            file.write(b"not a structure array")
+        with pytest.raises(ValueError, match="is not a binary array file starting with b'PMGSTRAR'"):
+            StructureArray.load(f"{self.tmp_path}/not_structures.bin")
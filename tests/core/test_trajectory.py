@@ -5,11 +5,11 @@ import re
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Molecule, Structure
-from pymatgen.core.trajectory import Trajectory
+from pymatgen.core.trajectory import Trajectory, VerletNeighborList
 from pymatgen.io.qchem.outputs import QCOutput
 from pymatgen.io.vasp.outputs import Xdatcar
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, VASP_OUT_DIR, MatSciTest
@@ -462,6 +462,62 @@ class TestTrajectory(MatSciTest):
         written_traj = Trajectory.from_file(f"{self.tmp_path}/traj_test_XDATCAR", constant_lattice=False)
         self._check_traj_equality(traj, written_traj)
 
+    def test_iter_neighbor_lists(self):
+        for traj in (self.traj, self.traj_mols):
+            neighbor_lists = list(traj.iter_neighbor_lists(3, skin=0.5))
+            assert len(neighbor_lists) == len(traj)
+
+            for frame, neighbor_list in zip(traj, neighbor_lists, strict=True):
+                assert neighbor_list.n_centers == len(frame)
+                assert_allclose(np.linalg.norm(neighbor_list.vectors, axis=1), neighbor_list.distances)
+                if isinstance(frame, Structure):
+                    center_indices, points_indices, images, _ = frame.get_neighbor_list(3)
+                    expected = sorted(zip(center_indices, points_indices, map(tuple, images.astype(int)), strict=True))
+                else:
+                    dist_matrix = frame.distance_matrix
+                    np.fill_diagonal(dist_matrix, np.inf)
+                    pairs = zip(*np.nonzero(dist_matrix <= 3), strict=True)
+                    expected = sorted((idx, jdx, (0, 0, 0)) for idx, jdx in pairs)
+                actual = sorted(
+                    zip(
+                        neighbor_list.center_indices,
+                        neighbor_list.points_indices,
+                        map(tuple, neighbor_list.images),
+                        strict=True,
+                    )
+                )
+                assert actual == expected
+
+    def test_verlet_neighbor_list(self):
+        lattice = Lattice.cubic(3)
+        coords = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]])
+        verlet_list = VerletNeighborList(2.7, skin=0.4)
+
+        neighbor_list = verlet_list.update(coords, lattice)
+        assert_array_equal(neighbor_list.offsets, [0, 8, 16])
+        assert verlet_list.n_builds == 1
+
+        # small moves, including one across the cell boundary, reuse the candidates
+        for step in (0.01, 0.02, 0.03):
+            moved = np.mod(coords + np.array([[-step, 0, 0], [0, 0, 0]]), 1)
+            neighbor_list = verlet_list.update(moved, lattice)
+            assert verlet_list.n_builds == 1
+            structure = Structure(lattice, ["Cs", "Cl"], moved)
+            assert len(neighbor_list.distances) == len(structure.get_neighbor_list(2.7)[0])
+            assert_allclose(np.sort(neighbor_list.distances), np.sort(structure.get_neighbor_list(2.7)[3]), atol=1e-10)
+
+        # moving by more than skin / 2 triggers a rebuild
+        moved = coords + np.array([[0.1, 0, 0], [0, 0, 0]])
+        verlet_list.update(moved, lattice)
+        assert verlet_list.n_builds == 2
+
+        # so does a change of the lattice
+        verlet_list.update(moved, Lattice.cubic(3.01))
+        assert verlet_list.n_builds == 3
+
+        with pytest.raises(ValueError, match="cutoff must be positive and skin non-negative"):
+            VerletNeighborList(2.7, skin=-1)
+
     def test_as_from_dict(self):
         dct = self.traj.as_dict()
         traj = Trajectory.from_dict(dct)
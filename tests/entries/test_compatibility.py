@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 from monty.json import MontyDecoder
+from monty.serialization import loadfn
 from pytest import approx
 
 import pymatgen.entries
@@ -30,6 +31,7 @@ from pymatgen.entries.compatibility import (
     MaterialsProjectCompatibility,
     MITAqueousCompatibility,
     MITCompatibility,
+    _guess_oxidation_states,
     needs_u_correction,
 )
 from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry, ConstantEnergyAdjustment
@@ -1218,6 +1220,32 @@ class TestMaterialsProjectCompatibility2020:
         entries = self.compat.process_entries([self.entry1, self.entry2, self.entry3])
         assert len(entries) == 2
 
+    @pytest.mark.skipif(sys.platform.startswith("win"), reason="Windows broken permissions.")
+    def test_parallel_process_entries(self):
+        entries = loadfn(f"{TEST_FILES_DIR}/entries/Li-Fe-P-O_entries.json")[::10]
+        for entry in entries:
+            entry.data.pop("oxidation_states", None)
+        compat = MaterialsProject2020Compatibility(check_potcar=False)
+
+        with pytest.warns(UserWarning) as serial_warnings:
+            serial = compat.process_entries(copy.deepcopy(entries), on_error="warn")
+        with pytest.warns(UserWarning) as parallel_warnings:
+            parallel = compat.process_entries(entries, inplace=False, n_workers=2, on_error="warn")
+        assert [str(w.message) for w in parallel_warnings if w.category is UserWarning] == [
+            str(w.message) for w in serial_warnings if w.category is UserWarning
+        ]
+        assert [entry.entry_id for entry in parallel] == [entry.entry_id for entry in serial]
+        assert [entry.correction for entry in parallel] == [entry.correction for entry in serial]
+        assert [entry.data["oxidation_states"] for entry in parallel if len(entry.composition) > 1] == [
+            entry.data["oxidation_states"] for entry in serial if len(entry.composition) > 1
+        ]
+
+        # oxidation states are guessed once per reduced composition
+        _guess_oxidation_states.cache_clear()
+        compat.process_entries([ComputedEntry("Fe2O3", -1, parameters=self.entry1.parameters)] * 3)
+        compat.process_entries(ComputedEntry("Fe4O6", -2, parameters=self.entry1.parameters))
+        assert _guess_oxidation_states.cache_info().misses == 1
+
     def test_config_file(self):
         config_file = Path(f"{TEST_FILES_DIR}/entries/compatibility/MP2020Compatibility_alternate.yaml")
         compat = MaterialsProject2020Compatibility(config_file=config_file)
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import io
+import json
 import re
 from itertools import starmap
 
 import pytest
+from monty.io import zopen
 from monty.serialization import dumpfn, loadfn
 
 from pymatgen.core import Element
 from pymatgen.entries.computed_entries import ComputedEntry
-from pymatgen.entries.entry_tools import EntrySet, group_entries_by_composition, group_entries_by_structure
+from pymatgen.entries.entry_tools import (
+    EntrySet,
+    _iter_json_objects,
+    group_entries_by_composition,
+    group_entries_by_structure,
+)
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/entries"
@@ -77,6 +85,39 @@ class TestEntrySet(MatSciTest):
         entry_set = loadfn(f"{self.tmp_path}/temp_entry_set.json")
         assert len(entry_set) == len(self.entry_set)
 
+    def test_write_to_file_iter_from_file(self):
+        # JSON list of ComputedEntry as written by dumpfn
+        assert set(EntrySet.iter_from_file(f"{TEST_DIR}/Li-Fe-P-O_entries.json")) == self.entry_set.entries
+        entries = list(EntrySet.iter_from_file(f"{TEST_DIR}/Li-Fe-P-O_entries.json", chemsys=["Li", "O"]))
+        assert set(entries) == self.entry_set.get_subset_in_chemsys(["Li", "O"]).entries
+
+        # streamed JSON lines, read back in small chunks
+        EntrySet.write_to_file(iter(self.entry_set), f"{self.tmp_path}/entries.jsonl.gz")
+        with zopen(f"{self.tmp_path}/entries.jsonl.gz", mode="rt", encoding="utf-8") as file:
+            assert len(file.readlines()) == len(self.entry_set)
+            file.seek(0)
+            assert len(list(_iter_json_objects(file, chunk_size=100))) == len(self.entry_set)
+
+        # a value much larger than chunk_size is read in geometrically growing chunks
+        file = io.StringIO(json.dumps([{"data": list(range(20_000))}] * 2))
+        read_sizes = []
+        file.read = lambda size, read=file.read: read_sizes.append(size) or read(size)
+        assert len(list(_iter_json_objects(file, chunk_size=100))) == 2
+        assert len(read_sizes) < 30
+        assert set(EntrySet.iter_from_file(f"{self.tmp_path}/entries.jsonl.gz")) == self.entry_set.entries
+
+        entries = loadfn(f"{TEST_DIR}/TiO2_entries.json")
+        EntrySet.write_to_file(entries, f"{self.tmp_path}/TiO2_entries.jsonl")
+        loaded = list(EntrySet.iter_from_file(f"{self.tmp_path}/TiO2_entries.jsonl"))
+        assert [entry.structure for entry in loaded] == [entry.structure for entry in entries]
+        loaded = list(EntrySet.iter_from_file(f"{self.tmp_path}/TiO2_entries.jsonl", include_structure=False))
+        assert all(type(entry) is ComputedEntry for entry in loaded)
+        assert [entry.energy for entry in loaded] == [entry.energy for entry in entries]
+        assert list(EntrySet.iter_from_file(f"{self.tmp_path}/TiO2_entries.jsonl", chemsys=["Ti"])) == []
+
+        EntrySet.write_to_file([], f"{self.tmp_path}/empty.jsonl")
+        assert list(EntrySet.iter_from_file(f"{self.tmp_path}/empty.jsonl")) == []
+
     def test_ground_states(self):
         ground_states = self.entry_set.ground_states
         assert len(ground_states) < len(self.entry_set)
@@ -113,9 +113,10 @@ from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Structure
+from pymatgen.entries import mixing_scheme
 from pymatgen.entries.compatibility import Compatibility, CompatibilityError
 from pymatgen.entries.computed_entries import CompositionEnergyAdjustment, ComputedEntry, ComputedStructureEntry
-from pymatgen.entries.mixing_scheme import MaterialsProjectDFTMixingScheme
+from pymatgen.entries.mixing_scheme import MaterialsProjectDFTMixingScheme, _group_structures
 from pymatgen.util.testing import TEST_FILES_DIR
 
 __author__ = "Ryan Kingsbury"
@@ -2004,6 +2005,43 @@ class TestMaterialsProjectDFTMixingSchemeArgs:
         entries = compat.process_entries(ms_complete.all_entries)
         assert len(entries) == 8
 
+    def test_mixing_state_cache(self, mixing_scheme_no_compat, ms_complete, tmp_path, monkeypatch):
+        cache_file = f"{tmp_path}/mixing_state.json.gz"
+        pd_type_1 = PhaseDiagram(ms_complete.gga_entries)
+        state_data = mixing_scheme_no_compat.get_mixing_state_data(
+            ms_complete.all_entries, n_workers=2, pd_type_1=pd_type_1, cache_file=cache_file
+        )
+        pd.testing.assert_frame_equal(state_data, ms_complete.state_data)
+
+        matched = []
+
+        def group_structures(entry_ids, *args):
+            matched.append(set(entry_ids))
+            return _group_structures(entry_ids, *args)
+
+        monkeypatch.setattr(mixing_scheme, "_group_structures", group_structures)
+        state_data = mixing_scheme_no_compat.get_mixing_state_data(ms_complete.all_entries, cache_file=cache_file)
+        pd.testing.assert_frame_equal(state_data, ms_complete.state_data)
+        assert matched == []
+
+        # only the composition with a new entry is matched again
+        scan_4 = next(entry for entry in ms_complete.scan_entries if entry.entry_id == "r2scan-4")
+        new_entry = ComputedStructureEntry(
+            scan_4.structure, scan_4.energy + 1, parameters={"run_type": "R2SCAN"}, entry_id="r2scan-new"
+        )
+        state_data = mixing_scheme_no_compat.get_mixing_state_data(
+            [*ms_complete.all_entries, new_entry], cache_file=cache_file
+        )
+        pd.testing.assert_frame_equal(state_data, ms_complete.state_data)
+        assert matched == [{"gga-4", "gga-6", "r2scan-4", "r2scan-6", "r2scan-new"}]
+
+        # changing the structure matcher invalidates the cache
+        matched.clear()
+        compat = MaterialsProjectDFTMixingScheme(compat_1=None, structure_matcher=StructureMatcher(scale=False))
+        state_data = compat.get_mixing_state_data(ms_complete.all_entries, cache_file=cache_file)
+        assert len(state_data) == 8
+        assert len(matched) == 6  # all compositions
+
     def test_processing_entries_inplace(self):
         # load two entries in GGA_GGA_U_R2SCAN thermo type
         entriesJson = Path(f"{TEST_FILES_DIR}/entries/entries_thermo_type_GGA_GGA_U_R2SCAN.json")
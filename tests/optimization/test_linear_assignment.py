@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
+from numpy.testing import assert_array_equal
 from pytest import approx
 
-from pymatgen.optimization.linear_assignment import LinearAssignment
+from pymatgen.optimization.linear_assignment import LinearAssignment, linear_assignment_batch
 
 
 class TestLinearAssignment:
@@ -253,3 +256,27 @@ class TestLinearAssignment:
         # if the input doesn't get converted to a float, the masking
         # doesn't work properly
         assert la.orig_c.dtype == np.float64
+
+    def test_batch(self):
+        rng = np.random.default_rng(0)
+        costs = rng.integers(0, 20, size=(50, 7, 9)).astype(float)
+        min_costs, solutions = linear_assignment_batch(costs)
+        assert min_costs.shape == (50,)
+        assert solutions.shape == (50, 7)
+        for cost, min_cost, solution in zip(costs, min_costs, solutions, strict=True):
+            la = LinearAssignment(cost)
+            assert min_cost == approx(la.min_cost)
+            assert_array_equal(solution, la.solution)
+            assert cost[np.arange(7), solution].sum() == approx(min_cost)
+
+        # batches can be solved in parallel by threads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(linear_assignment_batch, np.split(costs, 5)))
+        assert_array_equal(np.concatenate([res[0] for res in results]), min_costs)
+        assert_array_equal(np.concatenate([res[1] for res in results]), solutions)
+
+        assert linear_assignment_batch(np.zeros((0, 3, 3)))[0].shape == (0,)
+        with pytest.raises(ValueError, match="cost matrix must have at least as many columns as rows"):
+            linear_assignment_batch(costs.transpose(0, 2, 1))
+        with pytest.raises(ValueError, match="costs must be a stack of cost matrices"):
+            linear_assignment_batch(costs[0])
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
 from pymatgen.core.lattice import Lattice
-from pymatgen.optimization.neighbors import find_points_in_spheres
+from pymatgen.optimization.neighbors import find_points_in_spheres, find_points_in_spheres_batch
 from pymatgen.util.testing import MatSciTest
 
 
@@ -61,3 +62,46 @@ class TestNeighbors(MatSciTest):
             lattice=np.array(lattice.matrix),
         )
         assert len(nns[0]) == 4
+
+    def test_points_in_spheres_batch(self):
+        rng = np.random.default_rng(42)
+        lattices = [self.families[name].matrix for name in self.families]
+        all_coords = [
+            rng.random((n_points, 3)) @ lattice for n_points, lattice in zip(range(2, 8), lattices, strict=True)
+        ]
+        center_coords = [coords[:2] for coords in all_coords]
+        pbc = np.array([[1, 1, 1], [1, 0, 1], [0, 0, 0], [1, 1, 1], [1, 1, 0], [1, 1, 1]], dtype=np.int64)
+        all_offsets = np.cumsum([0] + [len(coords) for coords in all_coords])
+        center_offsets = np.cumsum([0] + [len(coords) for coords in center_coords])
+
+        pair_offsets, *batch = find_points_in_spheres_batch(
+            all_coords=np.concatenate(all_coords),
+            all_offsets=all_offsets,
+            center_coords=np.concatenate(center_coords),
+            center_offsets=center_offsets,
+            r=12,
+            pbc=pbc,
+            lattices=np.array(lattices),
+        )
+        assert len(pair_offsets) == len(lattices) + 1
+        for idx, lattice in enumerate(lattices):
+            nns = find_points_in_spheres(
+                all_coords=all_coords[idx],
+                center_coords=center_coords[idx],
+                r=12,
+                pbc=pbc[idx],
+                lattice=np.array(lattice),
+            )
+            for batch_arr, arr in zip(batch, nns, strict=True):
+                np.testing.assert_array_equal(batch_arr[pair_offsets[idx] : pair_offsets[idx + 1]], arr)
+
+        with pytest.raises(ValueError, match="Offsets must increase from 0 to"):
+            find_points_in_spheres_batch(
+                all_coords=np.concatenate(all_coords),
+                all_offsets=all_offsets[::-1].copy(),
+                center_coords=np.concatenate(center_coords),
+                center_offsets=center_offsets,
+                r=12,
+                pbc=pbc,
+                lattices=np.array(lattices),
+            )
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from pymatgen.util.io_utils import micro_pyawk
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymatgen.core import Element
+from pymatgen.util.io_utils import micro_pyawk, read_array_file, write_array_file
 from pymatgen.util.testing import VASP_OUT_DIR, MatSciTest
 
 
@@ -16,3 +21,28 @@ class TestFunc(MatSciTest):
 
         micro_pyawk(f"{VASP_OUT_DIR}/OUTCAR.gz", [["POTCAR:(.*)", f2, f]])
         assert len(data) == 6
+
+    def test_array_file(self):
+        arrays = {
+            "ints": np.arange(5, dtype=np.int32),
+            "floats": np.linspace(0, 1, 6).reshape(2, 3),
+            "empty": np.zeros((0, 3), dtype=bool),
+        }
+        filename = f"{self.tmp_path}/arrays.bin"
+        write_array_file(filename, b"TESTFILE", {"elements": [Element.Fe]}, arrays)
+
+        for mmap in (True, False):
+            header, loaded = read_array_file(filename, b"TESTFILE", mmap=mmap)
+            assert header == {"elements": [Element.Fe]}
+            assert list(loaded) == list(arrays)
+            for name, arr in arrays.items():
+                assert loaded[name].dtype == arr.dtype
+                assert_array_equal(loaded[name], arr)
+                if mmap and arr.size:
+                    # memory-mapped arrays start at 64-byte aligned offsets
+                    assert loaded[name].ctypes.data % 64 == 0
+
+        with pytest.raises(ValueError, match="is not a binary array file starting with b'OTHERFIL'"):
+            read_array_file(filename, b"OTHERFIL")
+        with pytest.raises(ValueError, match="magic should be 8 bytes"):
+            write_array_file(filename, b"SHORT", {}, arrays)